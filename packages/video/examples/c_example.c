@@ -68,23 +68,22 @@ void example_video_filters(void) {
     printf("Created frame: %ux%u\n", width, height);
 
     // Scale to 1280x720
-    void* scaled = NULL;
-    err = video_filter_scale(frame, 1280, 720, 3, &scaled); // 3 = Lanczos
-    if (err == VIDEO_OK) {
+    void* scaled = video_filter_scale(frame, 1280, 720, 3); // 3 = Lanczos
+    if (scaled) {
         printf("Scaled to: %ux%u\n", video_frame_width(scaled), video_frame_height(scaled));
 
         // Apply grayscale
-        void* gray = NULL;
-        err = video_filter_grayscale(scaled, &gray);
-        if (err == VIDEO_OK) {
+        void* gray = video_filter_grayscale(scaled);
+        if (gray) {
             printf("Applied grayscale filter\n");
 
             // Apply blur
-            void* blurred = NULL;
-            err = video_filter_blur(gray, 1.5f, &blurred);
-            if (err == VIDEO_OK) {
+            void* blurred = video_filter_blur(gray, 1.5f);
+            if (blurred) {
                 printf("Applied blur filter (sigma=1.5)\n");
                 video_frame_free(blurred);
+            } else {
+                fprintf(stderr, "Blur failed (%d): %s\n", video_get_last_error_code(), video_get_last_error());
             }
 
             video_frame_free(gray);
@@ -125,15 +124,13 @@ void example_crop_and_rotate(void) {
     }
 
     // Crop to center 1280x720
-    void* cropped = NULL;
-    err = video_filter_crop(frame, 320, 180, 1280, 720, &cropped);
-    if (err == VIDEO_OK) {
+    void* cropped = video_filter_crop(frame, 320, 180, 1280, 720);
+    if (cropped) {
         printf("Cropped to: %ux%u\n", video_frame_width(cropped), video_frame_height(cropped));
 
         // Rotate 90 degrees
-        void* rotated = NULL;
-        err = video_filter_rotate(cropped, 1, &rotated); // 1 = 90 degrees
-        if (err == VIDEO_OK) {
+        void* rotated = video_filter_rotate(cropped, 1); // 1 = 90 degrees
+        if (rotated) {
             printf("Rotated to: %ux%u\n", video_frame_width(rotated), video_frame_height(rotated));
             video_frame_free(rotated);
         }
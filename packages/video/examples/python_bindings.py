@@ -1,11 +1,18 @@
 """
 Home Video Library - Python Bindings
 Uses ctypes to call the native library from Python
+
+If the native `_video_ext` extension (see ../python) is installed, Audio and
+VideoFrame are taken from it instead, which skips libffi on every call.
 """
 
 import ctypes
 import os
-from typing import Optional, Tuple
+import threading
+import weakref
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
+from typing import NamedTuple, Optional, Tuple, Union
 from enum import IntEnum
 
 
@@ -34,9 +41,17 @@ def find_library():
 
 
 # Load the library
+# CDLL (unlike PyDLL) releases the GIL for the duration of every foreign call,
+# so long filters and encodes already run in parallel across Python threads.
 _lib_path = find_library()
 _lib = ctypes.CDLL(_lib_path)
 
+# Set HOME_VIDEO_GPU=1 to run Lanczos scaling and blur on the GPU where the
+# native library supports it; it falls back to the CPU kernels otherwise.
+# GPU blur output is identical to the CPU blur; GPU Lanczos samples the same
+# positions as the CPU scaler but may differ from it by rounding.
+USE_GPU = os.environ.get('HOME_VIDEO_GPU', '') not in ('', '0')
+
 
 # ============================================================================
 # Error Codes
@@ -77,6 +92,9 @@ _lib.video_cleanup.restype = None
 _lib.video_get_last_error.argtypes = []
 _lib.video_get_last_error.restype = ctypes.c_char_p
 
+_lib.video_get_last_error_code.argtypes = []
+_lib.video_get_last_error_code.restype = ctypes.c_int
+
 # Version
 _lib.video_version_major.argtypes = []
 _lib.video_version_major.restype = ctypes.c_uint32
@@ -90,6 +108,10 @@ _lib.video_version_patch.restype = ctypes.c_uint32
 _lib.video_version_string.argtypes = []
 _lib.video_version_string.restype = ctypes.c_char_p
 
+# Memory
+_lib.video_free.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+_lib.video_free.restype = None
+
 # Audio
 _lib.video_audio_load.argtypes = [ctypes.c_char_p, ctypes.POINTER(ctypes.c_void_p)]
 _lib.video_audio_load.restype = ctypes.c_int
@@ -128,24 +150,126 @@ _lib.video_frame_width.restype = ctypes.c_uint32
 _lib.video_frame_height.argtypes = [ctypes.c_void_p]
 _lib.video_frame_height.restype = ctypes.c_uint32
 
+_lib.video_frame_pixel_format.argtypes = [ctypes.c_void_p]
+_lib.video_frame_pixel_format.restype = ctypes.c_int32
+
+class VideoFrameInfo(ctypes.Structure):
+    """Frame metadata (mirrors video_frame_info_t)"""
+    _fields_ = [
+        ('width', ctypes.c_uint32),
+        ('height', ctypes.c_uint32),
+        ('stride', ctypes.c_uint32),
+        ('pixel_format', ctypes.c_int32),
+        ('pts_us', ctypes.c_int64),
+    ]
+
+
+_lib.video_frame_info.argtypes = [ctypes.c_void_p, ctypes.POINTER(VideoFrameInfo)]
+_lib.video_frame_info.restype = None
+
+_lib.video_frame_data.argtypes = [ctypes.c_void_p, ctypes.c_uint8]
+_lib.video_frame_data.restype = ctypes.c_void_p
+
+_lib.video_frame_linesize.argtypes = [ctypes.c_void_p, ctypes.c_uint8]
+_lib.video_frame_linesize.restype = ctypes.c_size_t
+
+
+class VideoPlaneInfo(ctypes.Structure):
+    """Plane layout (mirrors video_plane_info_t)"""
+    _fields_ = [
+        ('width', ctypes.c_uint32),
+        ('height', ctypes.c_uint32),
+        ('stride', ctypes.c_uint32),
+        ('bytes_per_pixel', ctypes.c_uint32),
+        ('size', ctypes.c_size_t),
+    ]
+
+
+_lib.video_frame_plane_info.argtypes = [ctypes.c_void_p, ctypes.c_uint8, ctypes.POINTER(VideoPlaneInfo)]
+_lib.video_frame_plane_info.restype = ctypes.c_int
+
 _lib.video_frame_free.argtypes = [ctypes.c_void_p]
 _lib.video_frame_free.restype = None
 
+_lib.video_frame_pool_trim.argtypes = []
+_lib.video_frame_pool_trim.restype = None
+
 # Filters
-_lib.video_filter_scale.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_int32, ctypes.POINTER(ctypes.c_void_p)]
-_lib.video_filter_scale.restype = ctypes.c_int
+# Filters return the new frame handle, or NULL on error.
+# Enum parameters are declared c_int32 and IntEnum members are passed through
+# as-is: ctypes converts int subclasses in C, so pre-converting with int() or
+# .value in the wrappers only adds a Python-level call per argument.
+_lib.video_filter_scale.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_int32]
+_lib.video_filter_scale.restype = ctypes.c_void_p
+
+_lib.video_filter_scale_gpu.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_uint32]
+_lib.video_filter_scale_gpu.restype = ctypes.c_void_p
+
+_lib.video_filter_crop.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32]
+_lib.video_filter_crop.restype = ctypes.c_void_p
 
-_lib.video_filter_crop.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_void_p)]
-_lib.video_filter_crop.restype = ctypes.c_int
+_lib.video_filter_grayscale.argtypes = [ctypes.c_void_p]
+_lib.video_filter_grayscale.restype = ctypes.c_void_p
 
-_lib.video_filter_grayscale.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p)]
-_lib.video_filter_grayscale.restype = ctypes.c_int
+_lib.video_filter_blur.argtypes = [ctypes.c_void_p, ctypes.c_float]
+_lib.video_filter_blur.restype = ctypes.c_void_p
 
-_lib.video_filter_blur.argtypes = [ctypes.c_void_p, ctypes.c_float, ctypes.POINTER(ctypes.c_void_p)]
-_lib.video_filter_blur.restype = ctypes.c_int
+_lib.video_filter_blur_gpu.argtypes = [ctypes.c_void_p, ctypes.c_float]
+_lib.video_filter_blur_gpu.restype = ctypes.c_void_p
 
-_lib.video_filter_rotate.argtypes = [ctypes.c_void_p, ctypes.c_int32, ctypes.POINTER(ctypes.c_void_p)]
-_lib.video_filter_rotate.restype = ctypes.c_int
+_lib.video_filter_rotate.argtypes = [ctypes.c_void_p, ctypes.c_int32]
+_lib.video_filter_rotate.restype = ctypes.c_void_p
+
+
+class VideoOp(ctypes.Structure):
+    """Filter operation descriptor (mirrors video_op_t)"""
+    _fields_ = [
+        ('kind', ctypes.c_int32),
+        ('i0', ctypes.c_int32),
+        ('i1', ctypes.c_int32),
+        ('i2', ctypes.c_int32),
+        ('i3', ctypes.c_int32),
+        ('f0', ctypes.c_float),
+    ]
+
+
+_lib.video_filter_pipeline.argtypes = [ctypes.c_void_p, ctypes.POINTER(VideoOp), ctypes.c_size_t]
+_lib.video_filter_pipeline.restype = ctypes.c_void_p
+
+_lib.video_filter_scale_batch.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_size_t, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_int32, ctypes.POINTER(ctypes.c_void_p)]
+_lib.video_filter_scale_batch.restype = ctypes.c_int
+
+
+# Bind hot-path functions to module globals once, so per-call code skips the
+# attribute lookup on the CDLL object
+_video_audio_load = _lib.video_audio_load
+_video_audio_load_from_memory = _lib.video_audio_load_from_memory
+_video_audio_save = _lib.video_audio_save
+_video_audio_encode = _lib.video_audio_encode
+_video_audio_duration = _lib.video_audio_duration
+_video_audio_sample_rate = _lib.video_audio_sample_rate
+_video_audio_channels = _lib.video_audio_channels
+_video_audio_total_samples = _lib.video_audio_total_samples
+_video_audio_free = _lib.video_audio_free
+_video_free = _lib.video_free
+_video_frame_create = _lib.video_frame_create
+_video_frame_width = _lib.video_frame_width
+_video_frame_height = _lib.video_frame_height
+_video_frame_pixel_format = _lib.video_frame_pixel_format
+_video_frame_info = _lib.video_frame_info
+_video_frame_data = _lib.video_frame_data
+_video_frame_linesize = _lib.video_frame_linesize
+_video_frame_plane_info = _lib.video_frame_plane_info
+_video_frame_free = _lib.video_frame_free
+_video_filter_scale = _lib.video_filter_scale
+_video_filter_scale_gpu = _lib.video_filter_scale_gpu
+_video_filter_crop = _lib.video_filter_crop
+_video_filter_grayscale = _lib.video_filter_grayscale
+_video_filter_blur = _lib.video_filter_blur
+_video_filter_blur_gpu = _lib.video_filter_blur_gpu
+_video_filter_rotate = _lib.video_filter_rotate
+_video_filter_pipeline = _lib.video_filter_pipeline
+_video_filter_scale_batch = _lib.video_filter_scale_batch
 
 # Codec Info
 _lib.video_codec_name.argtypes = [ctypes.c_int32]
@@ -165,12 +289,131 @@ def get_last_error() -> str:
     return msg.decode('utf-8') if msg else "Unknown error"
 
 
+class _PyBuffer(ctypes.Structure):
+    """CPython's Py_buffer, used to pin read-only buffers"""
+    _fields_ = [
+        ('buf', ctypes.c_void_p),
+        ('obj', ctypes.c_void_p),
+        ('len', ctypes.c_ssize_t),
+        ('itemsize', ctypes.c_ssize_t),
+        ('readonly', ctypes.c_int),
+        ('ndim', ctypes.c_int),
+        ('format', ctypes.c_char_p),
+        ('shape', ctypes.c_void_p),
+        ('strides', ctypes.c_void_p),
+        ('suboffsets', ctypes.c_void_p),
+        ('internal', ctypes.c_void_p),
+    ]
+
+
+# ctypes can only export writable buffers, so read-only ones are pinned
+# through the buffer protocol directly; other interpreters fall back to a copy
+try:
+    _PyObject_GetBuffer = ctypes.pythonapi.PyObject_GetBuffer
+    _PyObject_GetBuffer.argtypes = [ctypes.py_object, ctypes.POINTER(_PyBuffer), ctypes.c_int]
+    _PyObject_GetBuffer.restype = ctypes.c_int
+    _PyBuffer_Release = ctypes.pythonapi.PyBuffer_Release
+    _PyBuffer_Release.argtypes = [ctypes.POINTER(_PyBuffer)]
+    _PyBuffer_Release.restype = None
+except AttributeError:
+    _PyObject_GetBuffer = None
+
+_PyBUF_SIMPLE = 0
+
+
+@contextmanager
+def buffer_pointer(data):
+    """Borrow a uint8 pointer into a bytes-like object's memory
+
+    Yields (pointer, length); the pointer is only valid inside the with
+    block. bytes, writable buffers and (on CPython) read-only buffers such as
+    memoryview slices or read-only mmaps are passed through without a copy.
+    """
+    if isinstance(data, bytes):
+        # c_char_p points at the bytes object's internal buffer
+        yield ctypes.cast(ctypes.c_char_p(data), ctypes.POINTER(ctypes.c_uint8)), len(data)
+        return
+
+    view = memoryview(data).cast('B')
+    length = view.nbytes
+    if not view.readonly:
+        yield ctypes.cast((ctypes.c_uint8 * length).from_buffer(view), ctypes.POINTER(ctypes.c_uint8)), length
+        return
+    if _PyObject_GetBuffer is None:
+        yield (ctypes.c_uint8 * length).from_buffer_copy(view), length
+        return
+
+    pinned = _PyBuffer()
+    _PyObject_GetBuffer(view, ctypes.byref(pinned), _PyBUF_SIMPLE)
+    try:
+        yield ctypes.cast(pinned.buf, ctypes.POINTER(ctypes.c_uint8)), length
+    finally:
+        _PyBuffer_Release(ctypes.byref(pinned))
+
+
+def native_buffer_view(data_ptr, length: int) -> memoryview:
+    """Wrap a library-allocated buffer in a read-only memoryview without copying
+
+    Ownership moves to the view: video_free is called when it is collected.
+    """
+    if not data_ptr:
+        return memoryview(b'')
+    array = ctypes.cast(data_ptr, ctypes.POINTER(ctypes.c_uint8 * length)).contents
+    weakref.finalize(array, _video_free, ctypes.addressof(array), length)
+    return memoryview(array).cast('B').toreadonly()
+
+
+def plane_shape(info: VideoPlaneInfo) -> Tuple[int, int, int]:
+    """Get (rows, columns, bytes per pixel) of a frame plane
+
+    Raises if a view of that shape would reach past the end of the plane.
+    """
+    row_bytes = info.width * info.bytes_per_pixel
+    if info.height and (info.height - 1) * info.stride + row_bytes > info.size:
+        raise VideoException(VideoError.INVALID_FORMAT, "Plane layout exceeds the plane buffer")
+    return info.height, info.width, info.bytes_per_pixel
+
+
+class _PlaneBuffer:
+    """Exposes native plane memory to NumPy and keeps the owning frame alive"""
+
+    def __init__(self, owner, ptr: int, shape: Tuple[int, int, int], linesize: int):
+        self._owner = owner
+        self.__array_interface__ = {
+            'version': 3,
+            'typestr': '|u1',
+            'data': (ptr, False),
+            'shape': shape,
+            'strides': (linesize, shape[2], 1),
+        }
+
+
+class _OutHandle(threading.local):
+    """Per-thread out-parameter reused by calls that return a new handle
+
+    Saves constructing a c_void_p and a byref() on every call; the value is
+    copied out immediately after each call.
+    """
+
+    def __init__(self):
+        self.handle = ctypes.c_void_p()
+        self.ref = ctypes.byref(self.handle)
+
+
+_out_handle = _OutHandle()
+
+
 def check_error(code: int):
     """Raise exception if error code is not OK"""
     if code != VideoError.OK:
         raise VideoException(code)
 
 
+def raise_last_error():
+    """Raise exception for the last call that failed by returning NULL"""
+    raise VideoException(_lib.video_get_last_error_code())
+
+
 # ============================================================================
 # Enums
 # ============================================================================
@@ -185,12 +428,28 @@ class AudioFormat(IntEnum):
 
 
 class PixelFormat(IntEnum):
-    RGB24 = 0
-    RGBA32 = 1
-    YUV420P = 2
-    YUV422P = 3
-    YUV444P = 4
-    GRAY8 = 5
+    """Pixel formats (mirrors video_pixel_format_t)"""
+    YUV420P = 0
+    YUV422P = 1
+    YUV444P = 2
+    YUV420P10LE = 3
+    YUV420P10BE = 4
+    YUV422P10LE = 5
+    YUV444P10LE = 6
+    NV12 = 7
+    NV21 = 8
+    RGB24 = 9
+    BGR24 = 10
+    RGBA32 = 11
+    BGRA32 = 12
+    ARGB32 = 13
+    ABGR32 = 14
+    RGB48LE = 15
+    RGBA64LE = 16
+    GRAY8 = 17
+    GRAY16LE = 18
+    YUYV422 = 19
+    UYVY422 = 20
 
 
 class VideoCodec(IntEnum):
@@ -215,6 +474,32 @@ class RotationAngle(IntEnum):
     ROTATE_270 = 3
 
 
+class FilterOp(IntEnum):
+    SCALE = 0
+    CROP = 1
+    GRAYSCALE = 2
+    BLUR = 3
+    ROTATE = 4
+
+
+def build_ops(ops) -> ctypes.Array:
+    """Build a VideoOp array from tuples like ("scale", 1280, 720, ScaleAlgorithm.LANCZOS)"""
+    array = (VideoOp * len(ops))()
+    for op, (name, *args) in zip(array, ops):
+        kind = FilterOp[name.upper()]
+        op.kind = kind
+        if kind == FilterOp.SCALE:
+            op.i0, op.i1 = args[0], args[1]
+            op.i2 = args[2] if len(args) > 2 else ScaleAlgorithm.LANCZOS
+        elif kind == FilterOp.CROP:
+            op.i0, op.i1, op.i2, op.i3 = args
+        elif kind == FilterOp.BLUR:
+            op.f0 = args[0]
+        elif kind == FilterOp.ROTATE:
+            op.i0 = args[0]
+    return array
+
+
 # ============================================================================
 # Python API
 # ============================================================================
@@ -222,141 +507,255 @@ class RotationAngle(IntEnum):
 class Audio:
     """Audio file wrapper"""
 
-    def __init__(self, handle: ctypes.c_void_p):
+    def __init__(self, handle: int):
         self._handle = handle
 
     @classmethod
-    def load(cls, path: str) -> 'Audio':
-        """Load audio from file"""
-        handle = ctypes.c_void_p()
-        code = _lib.video_audio_load(path.encode('utf-8'), ctypes.byref(handle))
+    def load(cls, path: Union[str, bytes, os.PathLike]) -> 'Audio':
+        """Load audio from file
+
+        Bytes paths are passed through as-is; anything else goes through
+        os.fsencode.
+        """
+        return cls.load_encoded(path if isinstance(path, bytes) else os.fsencode(path))
+
+    @classmethod
+    def load_encoded(cls, path_bytes: bytes) -> 'Audio':
+        """Load audio from an already encoded file path, skipping encoding"""
+        out = _out_handle
+        code = _video_audio_load(path_bytes, out.ref)
         check_error(code)
-        return cls(handle)
+        return cls(out.handle.value)
 
     @classmethod
-    def load_from_memory(cls, data: bytes) -> 'Audio':
-        """Load audio from memory buffer"""
-        handle = ctypes.c_void_p()
-        buffer = (ctypes.c_uint8 * len(data)).from_buffer_copy(data)
-        code = _lib.video_audio_load_from_memory(buffer, len(data), ctypes.byref(handle))
+    def load_from_memory(cls, data) -> 'Audio':
+        """Load audio from memory buffer (bytes, bytearray, memoryview, mmap...)
+
+        The buffer is passed to the native side without an intermediate copy
+        (except for read-only buffers on non-CPython interpreters).
+        """
+        out = _out_handle
+        with buffer_pointer(data) as (buffer, length):
+            code = _video_audio_load_from_memory(buffer, length, out.ref)
         check_error(code)
-        return cls(handle)
+        return cls(out.handle.value)
 
-    def save(self, path: str):
-        """Save audio to file"""
-        code = _lib.video_audio_save(self._handle, path.encode('utf-8'))
+    def save(self, path: Union[str, bytes, os.PathLike]):
+        """Save audio to file (bytes paths are passed through as-is)"""
+        if not isinstance(path, bytes):
+            path = os.fsencode(path)
+        code = _video_audio_save(self._handle, path)
         check_error(code)
 
-    def encode(self, format: AudioFormat) -> bytes:
-        """Encode audio to bytes"""
+    def encode(self, format: AudioFormat) -> memoryview:
+        """Encode audio, returning a read-only view of the native output buffer
+
+        The buffer is freed with video_free once the view is garbage collected;
+        call bytes() on it if a copy that outlives the view is needed.
+        """
         data_ptr = ctypes.POINTER(ctypes.c_uint8)()
         data_len = ctypes.c_size_t()
-        code = _lib.video_audio_encode(self._handle, format, ctypes.byref(data_ptr), ctypes.byref(data_len))
+        code = _video_audio_encode(self._handle, format, ctypes.byref(data_ptr), ctypes.byref(data_len))
         check_error(code)
-
-        # Copy data to Python bytes
-        result = bytes(data_ptr[:data_len.value])
-        return result
+        return native_buffer_view(data_ptr, data_len.value)
 
     @property
     def duration(self) -> float:
         """Get audio duration in seconds"""
-        return _lib.video_audio_duration(self._handle)
+        return _video_audio_duration(self._handle)
 
     @property
     def sample_rate(self) -> int:
         """Get sample rate in Hz"""
-        return _lib.video_audio_sample_rate(self._handle)
+        return _video_audio_sample_rate(self._handle)
 
     @property
     def channels(self) -> int:
         """Get channel count"""
-        return _lib.video_audio_channels(self._handle)
+        return _video_audio_channels(self._handle)
 
     @property
     def total_samples(self) -> int:
         """Get total sample count"""
-        return _lib.video_audio_total_samples(self._handle)
+        return _video_audio_total_samples(self._handle)
 
     def __del__(self):
         if hasattr(self, '_handle') and self._handle:
-            _lib.video_audio_free(self._handle)
+            _video_audio_free(self._handle)
+
+
+class FrameInfo(NamedTuple):
+    """Frame metadata read in a single native call
+
+    pixel_format is a PixelFormat, or the raw int for formats this module
+    doesn't know yet.
+    """
+    width: int
+    height: int
+    stride: int
+    pixel_format: Union[PixelFormat, int]
+    pts_us: int
+
+
+_PIXEL_FORMATS = {int(fmt): fmt for fmt in PixelFormat}
 
 
 class VideoFrame:
     """Video frame wrapper"""
 
-    def __init__(self, handle: ctypes.c_void_p):
+    def __init__(self, handle: int):
         self._handle = handle
 
     @classmethod
     def create(cls, width: int, height: int, pixel_format: PixelFormat) -> 'VideoFrame':
         """Create a new video frame"""
-        handle = ctypes.c_void_p()
-        code = _lib.video_frame_create(width, height, pixel_format, ctypes.byref(handle))
+        out = _out_handle
+        code = _video_frame_create(width, height, pixel_format, out.ref)
         check_error(code)
-        return cls(handle)
+        return cls(out.handle.value)
+
+    # Metadata never changes for a given handle, so fetch every field with
+    # one native call and serve width/height/pixel_format from the result
+    @cached_property
+    def info(self) -> FrameInfo:
+        """Get frame metadata"""
+        raw = VideoFrameInfo()
+        _video_frame_info(self._handle, ctypes.byref(raw))
+        return FrameInfo(raw.width, raw.height, raw.stride,
+                         _PIXEL_FORMATS.get(raw.pixel_format, raw.pixel_format), raw.pts_us)
 
     @property
     def width(self) -> int:
         """Get frame width"""
-        return _lib.video_frame_width(self._handle)
+        return self.info.width
 
     @property
     def height(self) -> int:
         """Get frame height"""
-        return _lib.video_frame_height(self._handle)
+        return self.info.height
 
     def scale(self, width: int, height: int, algorithm: ScaleAlgorithm = ScaleAlgorithm.LANCZOS) -> 'VideoFrame':
         """Scale frame to new dimensions"""
-        out_handle = ctypes.c_void_p()
-        code = _lib.video_filter_scale(self._handle, width, height, algorithm, ctypes.byref(out_handle))
-        check_error(code)
-        return VideoFrame(out_handle)
+        if USE_GPU and algorithm == ScaleAlgorithm.LANCZOS:
+            handle = _video_filter_scale_gpu(self._handle, width, height)
+        else:
+            handle = _video_filter_scale(self._handle, width, height, algorithm)
+        if not handle:
+            raise_last_error()
+        return VideoFrame(handle)
 
     def crop(self, x: int, y: int, width: int, height: int) -> 'VideoFrame':
         """Crop frame"""
-        out_handle = ctypes.c_void_p()
-        code = _lib.video_filter_crop(self._handle, x, y, width, height, ctypes.byref(out_handle))
-        check_error(code)
-        return VideoFrame(out_handle)
+        handle = _video_filter_crop(self._handle, x, y, width, height)
+        if not handle:
+            raise_last_error()
+        return VideoFrame(handle)
 
     def grayscale(self) -> 'VideoFrame':
         """Convert to grayscale"""
-        out_handle = ctypes.c_void_p()
-        code = _lib.video_filter_grayscale(self._handle, ctypes.byref(out_handle))
-        check_error(code)
-        return VideoFrame(out_handle)
+        handle = _video_filter_grayscale(self._handle)
+        if not handle:
+            raise_last_error()
+        return VideoFrame(handle)
 
     def blur(self, sigma: float) -> 'VideoFrame':
         """Apply gaussian blur"""
-        out_handle = ctypes.c_void_p()
-        code = _lib.video_filter_blur(self._handle, sigma, ctypes.byref(out_handle))
-        check_error(code)
-        return VideoFrame(out_handle)
+        if USE_GPU:
+            handle = _video_filter_blur_gpu(self._handle, sigma)
+        else:
+            handle = _video_filter_blur(self._handle, sigma)
+        if not handle:
+            raise_last_error()
+        return VideoFrame(handle)
 
     def rotate(self, angle: RotationAngle) -> 'VideoFrame':
         """Rotate frame"""
-        out_handle = ctypes.c_void_p()
-        code = _lib.video_filter_rotate(self._handle, angle, ctypes.byref(out_handle))
+        handle = _video_filter_rotate(self._handle, angle)
+        if not handle:
+            raise_last_error()
+        return VideoFrame(handle)
+
+    @staticmethod
+    def scale_batch(frames, width: int, height: int,
+                    algorithm: ScaleAlgorithm = ScaleAlgorithm.LANCZOS) -> list:
+        """Scale many frames to the same dimensions in one native call"""
+        n = len(frames)
+        in_handles = (ctypes.c_void_p * n)(*[f._handle for f in frames])
+        out_handles = (ctypes.c_void_p * n)()
+        code = _video_filter_scale_batch(in_handles, n, width, height, algorithm, out_handles)
         check_error(code)
-        return VideoFrame(out_handle)
+        return [VideoFrame(h) for h in out_handles]
+
+    def apply(self, ops) -> 'VideoFrame':
+        """Apply a chain of filters in one native call
+
+        `ops` is a list of tuples such as ("scale", 1280, 720, ScaleAlgorithm.LANCZOS),
+        ("crop", x, y, w, h), ("grayscale",), ("blur", sigma), ("rotate", angle),
+        or an array previously returned by build_ops() for reuse across frames.
+        """
+        if not isinstance(ops, ctypes.Array):
+            ops = build_ops(ops)
+        handle = _video_filter_pipeline(self._handle, ops, len(ops))
+        if not handle:
+            raise_last_error()
+        return VideoFrame(handle)
+
+    @property
+    def pixel_format(self) -> Union[PixelFormat, int]:
+        """Get frame pixel format"""
+        return self.info.pixel_format
+
+    def as_numpy(self, plane: int = 0):
+        """View a plane's pixels as a (rows, columns, channels) uint8 NumPy array
+
+        The array shares memory with the native frame (no copy) and keeps the
+        frame alive; writes to it modify the frame.
+        """
+        import numpy as np
+
+        info = VideoPlaneInfo()
+        code = _video_frame_plane_info(self._handle, plane, ctypes.byref(info))
+        check_error(code)
+        ptr = _video_frame_data(self._handle, plane)
+        if not ptr:
+            raise VideoException(VideoError.INVALID_ARGUMENT, f"Frame has no plane {plane}")
+        return np.asarray(_PlaneBuffer(self, ptr, plane_shape(info), info.stride))
 
     def __del__(self):
         if hasattr(self, '_handle') and self._handle:
-            _lib.video_frame_free(self._handle)
+            _video_frame_free(self._handle)
+
+
+# Prefer the compiled extension when available; the ctypes classes above stay
+# as the fallback for development builds.
+try:
+    import _video_ext
+except ImportError:
+    _video_ext = None
+
+if _video_ext is not None:
+    _video_ext.set_exception_type(VideoException)
+    _video_ext.set_pixel_format_type(PixelFormat)
+    Audio = _video_ext.Audio
+    VideoFrame = _video_ext.VideoFrame
 
 
 class CodecInfo:
-    """Codec information utilities"""
+    """Codec information utilities
+
+    Answers depend only on the codec id, so each is fetched from the library
+    once per process and served from a cache afterwards.
+    """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def name(codec: VideoCodec) -> str:
         """Get codec name"""
         name = _lib.video_codec_name(codec)
         return name.decode('utf-8')
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def is_supported(codec: VideoCodec) -> bool:
         """Check if codec is supported"""
         return _lib.video_codec_is_supported(codec)
@@ -377,6 +776,11 @@ def cleanup():
     _lib.video_cleanup()
 
 
+def trim_frame_pool():
+    """Release frame buffers the library keeps cached for reuse"""
+    _lib.video_frame_pool_trim()
+
+
 def version() -> Tuple[int, int, int]:
     """Get library version as (major, minor, patch)"""
     return (
@@ -432,6 +836,15 @@ if __name__ == "__main__":
         frame = VideoFrame.create(1920, 1080, PixelFormat.RGB24)
         print(f"Created frame: {frame.width}x{frame.height}")
 
+        # Direct pixel access (requires NumPy), no copy
+        try:
+            pixels = frame.as_numpy()
+            pixels[:, :, 0] = 255  # Fill the red channel in place
+            print(f"Pixel view: shape={pixels.shape}")
+            del pixels
+        except ImportError:
+            pass
+
         # Chain filters
         processed = (frame
                     .scale(1280, 720, ScaleAlgorithm.LANCZOS)
@@ -441,6 +854,16 @@ if __name__ == "__main__":
 
         print(f"Processed frame: {processed.width}x{processed.height}")
 
+        # Same chain in a single native call
+        pipeline = build_ops([
+            ("scale", 1280, 720, ScaleAlgorithm.LANCZOS),
+            ("crop", 100, 100, 1080, 520),
+            ("grayscale",),
+            ("blur", 1.5),
+        ])
+        processed = frame.apply(pipeline)
+        print(f"Pipeline frame: {processed.width}x{processed.height}")
+
         del processed
         del frame
     except VideoException as e:
@@ -36,10 +36,18 @@ typedef enum {
 
 /**
  * Get the last error message
+ * Error state is tracked per thread.
  * @return Null-terminated error message string
  */
 const char* video_get_last_error(void);
 
+/**
+ * Get the error code of the last failed call that returns a handle
+ * (filters return NULL on failure instead of an error code)
+ * @return Error code
+ */
+video_error_t video_get_last_error_code(void);
+
 // ============================================================================
 // Initialization and Cleanup
 // ============================================================================
@@ -53,7 +61,9 @@ video_error_t video_init(void);
 
 /**
  * Cleanup and free all resources used by the library
- * Call this when you're done using the library
+ * Call this when you're done using the library. Releases cached frame
+ * buffers; frames still alive may be freed afterwards with video_frame_free.
+ * Must not run concurrently with other library calls.
  */
 void video_cleanup(void);
 
@@ -142,7 +152,7 @@ video_error_t video_audio_save(void* handle, const char* path);
  * Encode audio to bytes in specified format
  * @param handle Audio handle
  * @param format Audio format (0=WAV, 1=MP3, 2=AAC, 3=FLAC, 4=Opus, 5=Vorbis)
- * @param out_data Output data pointer
+ * @param out_data Output data pointer (caller must free with video_free)
  * @param out_len Output data length
  * @return VIDEO_OK on success, error code otherwise
  */
@@ -186,11 +196,38 @@ void video_audio_free(void* handle);
 // Video Frame API
 // ============================================================================
 
+/**
+ * Pixel formats (values match the library's native format enum)
+ */
+typedef enum {
+    VIDEO_PIXEL_YUV420P = 0,
+    VIDEO_PIXEL_YUV422P = 1,
+    VIDEO_PIXEL_YUV444P = 2,
+    VIDEO_PIXEL_YUV420P10LE = 3,
+    VIDEO_PIXEL_YUV420P10BE = 4,
+    VIDEO_PIXEL_YUV422P10LE = 5,
+    VIDEO_PIXEL_YUV444P10LE = 6,
+    VIDEO_PIXEL_NV12 = 7,
+    VIDEO_PIXEL_NV21 = 8,
+    VIDEO_PIXEL_RGB24 = 9,
+    VIDEO_PIXEL_BGR24 = 10,
+    VIDEO_PIXEL_RGBA32 = 11,
+    VIDEO_PIXEL_BGRA32 = 12,
+    VIDEO_PIXEL_ARGB32 = 13,
+    VIDEO_PIXEL_ABGR32 = 14,
+    VIDEO_PIXEL_RGB48LE = 15,
+    VIDEO_PIXEL_RGBA64LE = 16,
+    VIDEO_PIXEL_GRAY8 = 17,
+    VIDEO_PIXEL_GRAY16LE = 18,
+    VIDEO_PIXEL_YUYV422 = 19,
+    VIDEO_PIXEL_UYVY422 = 20
+} video_pixel_format_t;
+
 /**
  * Create a new video frame
  * @param width Frame width in pixels
  * @param height Frame height in pixels
- * @param pixel_format Pixel format (0=RGB24, 1=RGBA32, 2=YUV420P, etc.)
+ * @param pixel_format Pixel format (a video_pixel_format_t value)
  * @param out_handle Output handle to frame object
  * @return VIDEO_OK on success, error code otherwise
  */
@@ -217,6 +254,24 @@ uint32_t video_frame_height(void* handle);
  */
 int32_t video_frame_pixel_format(void* handle);
 
+/**
+ * Frame metadata, filled by video_frame_info
+ */
+typedef struct {
+    uint32_t width;
+    uint32_t height;
+    uint32_t stride;       // Linesize of plane 0 in bytes
+    int32_t pixel_format;
+    int64_t pts_us;        // Presentation timestamp in microseconds
+} video_frame_info_t;
+
+/**
+ * Get all frame metadata in one call
+ * @param handle Frame handle
+ * @param out_info Output metadata
+ */
+void video_frame_info(void* handle, video_frame_info_t* out_info);
+
 /**
  * Get frame data pointer for plane
  * @param handle Frame handle
@@ -233,12 +288,41 @@ uint8_t* video_frame_data(void* handle, uint8_t plane);
  */
 size_t video_frame_linesize(void* handle, uint8_t plane);
 
+/**
+ * Plane layout, filled by video_frame_plane_info
+ * Row y of the plane starts at y * stride and holds width * bytes_per_pixel
+ * bytes; the whole plane is size bytes starting at video_frame_data.
+ */
+typedef struct {
+    uint32_t width;            // Pixels per row (after chroma subsampling)
+    uint32_t height;           // Rows
+    uint32_t stride;           // Bytes between row starts
+    uint32_t bytes_per_pixel;  // Bytes per pixel in this plane
+    size_t size;               // Bytes in the plane
+} video_plane_info_t;
+
+/**
+ * Get the layout of one plane
+ * @param handle Frame handle
+ * @param plane Plane index
+ * @param out_info Output layout
+ * @return VIDEO_OK, or VIDEO_INVALID_ARGUMENT if the plane doesn't exist
+ */
+video_error_t video_frame_plane_info(void* handle, uint8_t plane, video_plane_info_t* out_info);
+
 /**
  * Free video frame
+ * The frame's buffers are returned to the library's frame pool and reused
+ * by later frames of the same width, height and pixel format.
  * @param handle Frame handle to free
  */
 void video_frame_free(void* handle);
 
+/**
+ * Release all frame buffers cached by the frame pool
+ */
+void video_frame_pool_trim(void);
+
 // ============================================================================
 // Video Filters
 // ============================================================================
@@ -249,11 +333,23 @@ void video_frame_free(void* handle);
  * @param dst_width Destination width
  * @param dst_height Destination height
  * @param algorithm Scale algorithm (0=Nearest, 1=Bilinear, 2=Bicubic, 3=Lanczos)
- * @param out_handle Output frame handle
- * @return VIDEO_OK on success, error code otherwise
+ * @return New frame handle, or NULL on error (see video_get_last_error_code)
  */
-video_error_t video_filter_scale(void* src_handle, uint32_t dst_width, uint32_t dst_height,
-                                 int32_t algorithm, void** out_handle);
+void* video_filter_scale(void* src_handle, uint32_t dst_width, uint32_t dst_height,
+                         int32_t algorithm);
+
+/**
+ * Scale with Lanczos on the GPU (Metal on macOS)
+ * Falls back to video_filter_scale with Lanczos when no GPU is usable or the
+ * frame is not a packed single-plane format (GRAY8, RGB24, BGR24, RGBA32,
+ * BGRA32). Both paths sample the same source positions; results may differ
+ * by rounding.
+ * @param src_handle Source frame handle
+ * @param dst_width Destination width
+ * @param dst_height Destination height
+ * @return New frame handle, or NULL on error (see video_get_last_error_code)
+ */
+void* video_filter_scale_gpu(void* src_handle, uint32_t dst_width, uint32_t dst_height);
 
 /**
  * Apply crop filter to video frame
@@ -262,37 +358,95 @@ video_error_t video_filter_scale(void* src_handle, uint32_t dst_width, uint32_t
  * @param y Crop Y position
  * @param width Crop width
  * @param height Crop height
- * @param out_handle Output frame handle
- * @return VIDEO_OK on success, error code otherwise
+ * @return New frame handle, or NULL on error (see video_get_last_error_code)
  */
-video_error_t video_filter_crop(void* src_handle, uint32_t x, uint32_t y,
-                                uint32_t width, uint32_t height, void** out_handle);
+void* video_filter_crop(void* src_handle, uint32_t x, uint32_t y,
+                        uint32_t width, uint32_t height);
 
 /**
  * Apply grayscale filter to video frame
  * @param src_handle Source frame handle
- * @param out_handle Output frame handle
- * @return VIDEO_OK on success, error code otherwise
+ * @return New frame handle, or NULL on error (see video_get_last_error_code)
  */
-video_error_t video_filter_grayscale(void* src_handle, void** out_handle);
+void* video_filter_grayscale(void* src_handle);
 
 /**
  * Apply blur filter to video frame
  * @param src_handle Source frame handle
  * @param sigma Blur sigma (higher = more blur)
- * @param out_handle Output frame handle
- * @return VIDEO_OK on success, error code otherwise
+ * @return New frame handle, or NULL on error (see video_get_last_error_code)
+ */
+void* video_filter_blur(void* src_handle, float sigma);
+
+/**
+ * Apply blur on the GPU (Metal on macOS)
+ * Runs the same box blur as video_filter_blur (same kernel, passes, edge
+ * clamping and rounding), so the output is identical. Falls back to
+ * video_filter_blur under the same conditions as video_filter_scale_gpu.
+ * @param src_handle Source frame handle
+ * @param sigma Blur sigma (higher = more blur)
+ * @return New frame handle, or NULL on error (see video_get_last_error_code)
  */
-video_error_t video_filter_blur(void* src_handle, float sigma, void** out_handle);
+void* video_filter_blur_gpu(void* src_handle, float sigma);
 
 /**
  * Apply rotate filter to video frame
  * @param src_handle Source frame handle
  * @param angle Rotation angle (0=0°, 1=90°, 2=180°, 3=270°)
- * @param out_handle Output frame handle
+ * @return New frame handle, or NULL on error (see video_get_last_error_code)
+ */
+void* video_filter_rotate(void* src_handle, int32_t angle);
+
+/**
+ * Filter operation kinds for video_filter_pipeline
+ */
+typedef enum {
+    VIDEO_OP_SCALE = 0,
+    VIDEO_OP_CROP = 1,
+    VIDEO_OP_GRAYSCALE = 2,
+    VIDEO_OP_BLUR = 3,
+    VIDEO_OP_ROTATE = 4
+} video_op_kind_t;
+
+/**
+ * Filter operation descriptor
+ *   VIDEO_OP_SCALE:     i0=width, i1=height, i2=algorithm
+ *   VIDEO_OP_CROP:      i0=x, i1=y, i2=width, i3=height
+ *   VIDEO_OP_GRAYSCALE: no arguments
+ *   VIDEO_OP_BLUR:      f0=sigma
+ *   VIDEO_OP_ROTATE:    i0=angle
+ */
+typedef struct {
+    int32_t kind;
+    int32_t i0, i1, i2, i3;
+    float f0;
+} video_op_t;
+
+/**
+ * Apply a chain of filters in a single call
+ * Intermediate frames are freed internally. Chains made of scale (nearest or
+ * bilinear), crop, grayscale and blur, in that order, on RGB/BGR(A) frames
+ * are fused into one strip-tiled pass that writes only the final frame.
+ * @param src_handle Source frame handle
+ * @param ops Array of filter operations, applied in order
+ * @param n_ops Number of operations (must be > 0)
+ * @return New frame handle, or NULL on error (see video_get_last_error_code)
+ */
+void* video_filter_pipeline(void* src_handle, const video_op_t* ops, size_t n_ops);
+
+/**
+ * Scale a batch of frames to the same dimensions in a single call
+ * @param src_handles Array of source frame handles
+ * @param n Number of frames
+ * @param dst_width Destination width
+ * @param dst_height Destination height
+ * @param algorithm Scale algorithm (0=Nearest, 1=Bilinear, 2=Bicubic, 3=Lanczos)
+ * @param out_handles Output array of n frame handles (all NULL on failure)
  * @return VIDEO_OK on success, error code otherwise
  */
-video_error_t video_filter_rotate(void* src_handle, int32_t angle, void** out_handle);
+video_error_t video_filter_scale_batch(void* const* src_handles, size_t n,
+                                       uint32_t dst_width, uint32_t dst_height,
+                                       int32_t algorithm, void** out_handles);
 
 // ============================================================================
 // Media File API
@@ -0,0 +1,466 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Home Video Library - Native Python Extension
+Calls the C API directly, without going through ctypes/libffi
+
+Long-running calls (file I/O, encoding, filters) release the GIL, so frames
+can be processed in parallel from a thread pool.
+"""
+
+from cpython.buffer cimport PyBUF_SIMPLE, PyObject_GetBuffer, PyBuffer_Release, PyBuffer_FillInfo
+from libc.stdint cimport int32_t, int64_t, uint8_t, uint32_t, uint64_t
+from libc.stdlib cimport malloc, free
+
+import os
+from collections import namedtuple
+
+
+# ============================================================================
+# C API
+# ============================================================================
+
+cdef extern from "video.h" nogil:
+    ctypedef int video_error_t
+
+    video_error_t VIDEO_OK
+    video_error_t video_get_last_error_code()
+
+    # Memory
+    void video_free(void* ptr, size_t size)
+
+    # Audio
+    video_error_t video_audio_load(const char* path, void** out_handle)
+    video_error_t video_audio_load_from_memory(const uint8_t* data, size_t data_len, void** out_handle)
+    video_error_t video_audio_save(void* handle, const char* path)
+    video_error_t video_audio_encode(void* handle, int32_t format, uint8_t** out_data, size_t* out_len)
+    double video_audio_duration(void* handle)
+    uint32_t video_audio_sample_rate(void* handle)
+    uint8_t video_audio_channels(void* handle)
+    uint64_t video_audio_total_samples(void* handle)
+    void video_audio_free(void* handle)
+
+    # Video Frame
+    video_error_t video_frame_create(uint32_t width, uint32_t height, int32_t pixel_format, void** out_handle)
+    uint32_t video_frame_width(void* handle)
+    uint32_t video_frame_height(void* handle)
+    int32_t video_frame_pixel_format(void* handle)
+    ctypedef struct video_frame_info_t:
+        uint32_t width
+        uint32_t height
+        uint32_t stride
+        int32_t pixel_format
+        int64_t pts_us
+    void video_frame_info(void* handle, video_frame_info_t* out_info)
+    uint8_t* video_frame_data(void* handle, uint8_t plane)
+    size_t video_frame_linesize(void* handle, uint8_t plane)
+    ctypedef struct video_plane_info_t:
+        uint32_t width
+        uint32_t height
+        uint32_t stride
+        uint32_t bytes_per_pixel
+        size_t size
+    video_error_t video_frame_plane_info(void* handle, uint8_t plane, video_plane_info_t* out_info)
+    void video_frame_free(void* handle)
+
+    # Filters (return the new frame handle, or NULL on error)
+    void* video_filter_scale(void* src_handle, uint32_t dst_width, uint32_t dst_height,
+                             int32_t algorithm)
+    void* video_filter_scale_gpu(void* src_handle, uint32_t dst_width, uint32_t dst_height)
+    void* video_filter_crop(void* src_handle, uint32_t x, uint32_t y,
+                            uint32_t width, uint32_t height)
+    void* video_filter_grayscale(void* src_handle)
+    void* video_filter_blur(void* src_handle, float sigma)
+    void* video_filter_blur_gpu(void* src_handle, float sigma)
+    void* video_filter_rotate(void* src_handle, int32_t angle)
+
+    ctypedef struct video_op_t:
+        int32_t kind
+        int32_t i0, i1, i2, i3
+        float f0
+
+    void* video_filter_pipeline(void* src_handle, const video_op_t* ops, size_t n_ops)
+
+    video_error_t video_filter_scale_batch(void* const* src_handles, size_t n,
+                                           uint32_t dst_width, uint32_t dst_height,
+                                           int32_t algorithm, void** out_handles)
+
+
+# Set HOME_VIDEO_GPU=1 to run Lanczos scaling and blur on the GPU where the
+# native library supports it; it falls back to the CPU kernels otherwise.
+# GPU blur output is identical to the CPU blur; GPU Lanczos samples the same
+# positions as the CPU scaler but may differ from it by rounding.
+cdef bint _use_gpu = os.environ.get('HOME_VIDEO_GPU', '') not in ('', '0')
+
+
+# ============================================================================
+# Error Handling
+# ============================================================================
+
+# Replaced by the pure-Python module with its VideoException so both
+# backends raise the same type.
+_exception_type = RuntimeError
+
+
+def set_exception_type(exc):
+    """Set the exception class raised for non-OK error codes"""
+    global _exception_type
+    _exception_type = exc
+
+
+# Native pixel format code -> enum member; codes missing here stay raw ints
+_pixel_formats = {}
+
+
+def set_pixel_format_type(enum_type):
+    """Set the enum that known pixel format codes are returned as"""
+    global _pixel_formats
+    _pixel_formats = {int(fmt): fmt for fmt in enum_type}
+
+
+cdef inline int _check(video_error_t code) except -1:
+    if code != VIDEO_OK:
+        raise _exception_type(code)
+    return 0
+
+
+cdef inline int _check_handle(void* handle) except -1:
+    if handle == NULL:
+        raise _exception_type(video_get_last_error_code())
+    return 0
+
+
+_OP_KINDS = {'scale': 0, 'crop': 1, 'grayscale': 2, 'blur': 3, 'rotate': 4}
+
+
+cdef int _fill_op(video_op_t* op, object spec) except -1:
+    # Any sequence, like build_ops() in the ctypes bindings
+    name, *args = spec
+    op.kind = _OP_KINDS[name.lower()]
+    op.i0 = op.i1 = op.i2 = op.i3 = 0
+    op.f0 = 0
+    if op.kind == 0:
+        op.i0, op.i1 = args[0], args[1]
+        op.i2 = args[2] if len(args) > 2 else 3
+    elif op.kind == 1:
+        op.i0, op.i1, op.i2, op.i3 = args
+    elif op.kind == 3:
+        op.f0 = args[0]
+    elif op.kind == 4:
+        op.i0 = args[0]
+    return 0
+
+
+# ============================================================================
+# Native Buffers
+# ============================================================================
+
+cdef class _NativeBuffer:
+    """Read-only buffer over library-allocated memory, freed with video_free"""
+
+    cdef uint8_t* _data
+    cdef Py_ssize_t _len
+
+    @staticmethod
+    cdef _NativeBuffer _wrap(uint8_t* data, size_t length):
+        cdef _NativeBuffer buf = _NativeBuffer.__new__(_NativeBuffer)
+        buf._data = data
+        buf._len = length
+        return buf
+
+    def __getbuffer__(self, Py_buffer* view, int flags):
+        PyBuffer_FillInfo(view, self, self._data, self._len, 1, flags)
+
+    def __releasebuffer__(self, Py_buffer* view):
+        pass
+
+    def __dealloc__(self):
+        if self._data != NULL:
+            video_free(self._data, self._len)
+            self._data = NULL
+
+
+cdef class _PlaneBuffer:
+    """Exposes native plane memory to NumPy and keeps the owning frame alive"""
+
+    cdef object _owner
+    cdef dict _interface
+
+    def __cinit__(self, owner, size_t ptr, tuple shape, size_t linesize):
+        self._owner = owner
+        self._interface = {
+            'version': 3,
+            'typestr': '|u1',
+            'data': (ptr, False),
+            'shape': shape,
+            'strides': (linesize, shape[2], 1),
+        }
+
+    @property
+    def __array_interface__(self):
+        return self._interface
+
+
+# ============================================================================
+# Python API
+# ============================================================================
+
+cdef class Audio:
+    """Audio file wrapper"""
+
+    cdef void* _handle
+
+    @staticmethod
+    cdef Audio _wrap(void* handle):
+        cdef Audio audio = Audio.__new__(Audio)
+        audio._handle = handle
+        return audio
+
+    @classmethod
+    def load(cls, path):
+        """Load audio from file (str, bytes or os.PathLike)"""
+        return cls.load_encoded(path if isinstance(path, bytes) else os.fsencode(path))
+
+    @classmethod
+    def load_encoded(cls, bytes path_bytes):
+        """Load audio from an already encoded file path, skipping encoding"""
+        cdef void* handle = NULL
+        cdef const char* c_path = path_bytes
+        cdef video_error_t code
+        with nogil:
+            code = video_audio_load(c_path, &handle)
+        _check(code)
+        return Audio._wrap(handle)
+
+    @classmethod
+    def load_from_memory(cls, const uint8_t[::1] data):
+        """Load audio from memory buffer"""
+        cdef void* handle = NULL
+        cdef const uint8_t* ptr = &data[0] if data.shape[0] else NULL
+        cdef size_t length = data.shape[0]
+        cdef video_error_t code
+        with nogil:
+            code = video_audio_load_from_memory(ptr, length, &handle)
+        _check(code)
+        return Audio._wrap(handle)
+
+    def save(self, path):
+        """Save audio to file (str, bytes or os.PathLike)"""
+        cdef bytes encoded = path if isinstance(path, bytes) else os.fsencode(path)
+        cdef const char* c_path = encoded
+        cdef video_error_t code
+        with nogil:
+            code = video_audio_save(self._handle, c_path)
+        _check(code)
+
+    cpdef object encode(self, int32_t format):
+        """Encode audio, returning a read-only view of the native output buffer"""
+        cdef uint8_t* data = NULL
+        cdef size_t data_len = 0
+        cdef video_error_t code
+        with nogil:
+            code = video_audio_encode(self._handle, format, &data, &data_len)
+        _check(code)
+        return memoryview(_NativeBuffer._wrap(data, data_len))
+
+    @property
+    def duration(self):
+        """Get audio duration in seconds"""
+        return video_audio_duration(self._handle)
+
+    @property
+    def sample_rate(self):
+        """Get sample rate in Hz"""
+        return video_audio_sample_rate(self._handle)
+
+    @property
+    def channels(self):
+        """Get channel count"""
+        return video_audio_channels(self._handle)
+
+    @property
+    def total_samples(self):
+        """Get total sample count"""
+        return video_audio_total_samples(self._handle)
+
+    def __dealloc__(self):
+        if self._handle != NULL:
+            video_audio_free(self._handle)
+            self._handle = NULL
+
+
+FrameInfo = namedtuple('FrameInfo', ['width', 'height', 'stride', 'pixel_format', 'pts_us'])
+
+
+cdef class VideoFrame:
+    """Video frame wrapper"""
+
+    cdef void* _handle
+    cdef object _info
+
+    @staticmethod
+    cdef VideoFrame _wrap(void* handle):
+        cdef VideoFrame frame = VideoFrame.__new__(VideoFrame)
+        frame._handle = handle
+        return frame
+
+    @classmethod
+    def create(cls, uint32_t width, uint32_t height, int32_t pixel_format):
+        """Create a new video frame"""
+        cdef void* handle = NULL
+        _check(video_frame_create(width, height, pixel_format, &handle))
+        return VideoFrame._wrap(handle)
+
+    @property
+    def info(self):
+        """Get frame metadata, read once per frame"""
+        cdef video_frame_info_t raw
+        if self._info is None:
+            video_frame_info(self._handle, &raw)
+            self._info = FrameInfo(raw.width, raw.height, raw.stride,
+                                   _pixel_formats.get(raw.pixel_format, raw.pixel_format),
+                                   raw.pts_us)
+        return self._info
+
+    @property
+    def width(self):
+        """Get frame width"""
+        return self.info.width
+
+    @property
+    def height(self):
+        """Get frame height"""
+        return self.info.height
+
+    @property
+    def pixel_format(self):
+        """Get frame pixel format (a raw int for unknown codes)"""
+        return self.info.pixel_format
+
+    def as_numpy(self, uint8_t plane=0):
+        """View a plane's pixels as a (rows, columns, channels) uint8 NumPy array
+
+        The array shares memory with the native frame (no copy) and keeps the
+        frame alive; writes to it modify the frame.
+        """
+        import numpy as np
+
+        cdef video_plane_info_t info
+        cdef uint8_t* ptr
+
+        _check(video_frame_plane_info(self._handle, plane, &info))
+        ptr = video_frame_data(self._handle, plane)
+        if ptr == NULL:
+            raise _exception_type(-1, f"Frame has no plane {plane}")
+        if info.height > 0 and (<size_t>(info.height - 1) * info.stride
+                                + <size_t>info.width * info.bytes_per_pixel > info.size):
+            raise _exception_type(-4, "Plane layout exceeds the plane buffer")
+
+        return np.asarray(_PlaneBuffer(self, <size_t>ptr,
+                                       (info.height, info.width, info.bytes_per_pixel),
+                                       info.stride))
+
+    cpdef VideoFrame scale(self, uint32_t width, uint32_t height, int32_t algorithm=3):
+        """Scale frame to new dimensions"""
+        cdef void* out
+        with nogil:
+            if _use_gpu and algorithm == 3:  # LANCZOS
+                out = video_filter_scale_gpu(self._handle, width, height)
+            else:
+                out = video_filter_scale(self._handle, width, height, algorithm)
+        _check_handle(out)
+        return VideoFrame._wrap(out)
+
+    cpdef VideoFrame crop(self, uint32_t x, uint32_t y, uint32_t width, uint32_t height):
+        """Crop frame"""
+        cdef void* out
+        with nogil:
+            out = video_filter_crop(self._handle, x, y, width, height)
+        _check_handle(out)
+        return VideoFrame._wrap(out)
+
+    cpdef VideoFrame grayscale(self):
+        """Convert to grayscale"""
+        cdef void* out
+        with nogil:
+            out = video_filter_grayscale(self._handle)
+        _check_handle(out)
+        return VideoFrame._wrap(out)
+
+    cpdef VideoFrame blur(self, float sigma):
+        """Apply gaussian blur"""
+        cdef void* out
+        with nogil:
+            if _use_gpu:
+                out = video_filter_blur_gpu(self._handle, sigma)
+            else:
+                out = video_filter_blur(self._handle, sigma)
+        _check_handle(out)
+        return VideoFrame._wrap(out)
+
+    cpdef VideoFrame rotate(self, int32_t angle):
+        """Rotate frame"""
+        cdef void* out
+        with nogil:
+            out = video_filter_rotate(self._handle, angle)
+        _check_handle(out)
+        return VideoFrame._wrap(out)
+
+    @staticmethod
+    def scale_batch(frames, uint32_t width, uint32_t height, int32_t algorithm=3):
+        """Scale many frames to the same dimensions in one native call"""
+        cdef Py_ssize_t i, n = len(frames)
+        cdef void** handles = <void**>malloc(max(2 * n, 1) * sizeof(void*))
+        cdef void** outs = handles + n
+        cdef video_error_t code
+        if handles == NULL:
+            raise MemoryError()
+        try:
+            for i in range(n):
+                handles[i] = (<VideoFrame?>frames[i])._handle
+            with nogil:
+                code = video_filter_scale_batch(handles, n, width, height, algorithm, outs)
+            _check(code)
+            return [VideoFrame._wrap(outs[i]) for i in range(n)]
+        finally:
+            free(handles)
+
+    def apply(self, ops):
+        """Apply a chain of filters in one native call
+
+        `ops` is a list of op tuples or a prebuilt video_op_t array (anything
+        exporting a buffer, such as the ctypes array from build_ops()).
+        """
+        cdef void* out = NULL
+        cdef Py_buffer view
+        cdef video_op_t* built
+        cdef Py_ssize_t i, n
+
+        if isinstance(ops, (list, tuple)):
+            n = len(ops)
+            if n == 0:
+                raise ValueError("filter pipeline is empty")
+            built = <video_op_t*>malloc(n * sizeof(video_op_t))
+            if built == NULL:
+                raise MemoryError()
+            try:
+                for i in range(n):
+                    _fill_op(&built[i], ops[i])
+                with nogil:
+                    out = video_filter_pipeline(self._handle, built, n)
+            finally:
+                free(built)
+        else:
+            PyObject_GetBuffer(ops, &view, PyBUF_SIMPLE)
+            try:
+                with nogil:
+                    out = video_filter_pipeline(self._handle, <const video_op_t*>view.buf,
+                                                view.len // sizeof(video_op_t))
+            finally:
+                PyBuffer_Release(&view)
+        _check_handle(out)
+        return VideoFrame._wrap(out)
+
+    def __dealloc__(self):
+        if self._handle != NULL:
+            video_frame_free(self._handle)
+            self._handle = NULL
@@ -0,0 +1,43 @@
+"""PixelFormat in the Python bindings must mirror video_pixel_format_t
+
+Parsed from source so the test runs without building the native library.
+"""
+
+import ast
+import re
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+HEADER = ROOT / 'include' / 'video.h'
+BINDINGS = ROOT / 'examples' / 'python_bindings.py'
+
+
+def header_pixel_formats():
+    text = HEADER.read_text()
+    return {name: int(value) for name, value in re.findall(r'VIDEO_PIXEL_(\w+)\s*=\s*(\d+)', text)}
+
+
+def binding_pixel_formats():
+    tree = ast.parse(BINDINGS.read_text())
+    cls = next(node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == 'PixelFormat')
+    return {
+        stmt.targets[0].id: stmt.value.value
+        for stmt in cls.body
+        if isinstance(stmt, ast.Assign) and isinstance(stmt.value, ast.Constant)
+    }
+
+
+def test_pixel_format_matches_header():
+    header = header_pixel_formats()
+    assert header, "no video_pixel_format_t values found in video.h"
+    assert binding_pixel_formats() == header
+
+
+def test_pixel_format_pinned_values():
+    formats = binding_pixel_formats()
+    assert formats['YUV420P'] == 0
+    assert formats['NV12'] == 7
+    assert formats['RGB24'] == 9
+    assert formats['RGBA32'] == 11
+    assert formats['GRAY8'] == 17
+    assert formats['UYVY422'] == 20
@@ -22,6 +22,13 @@ pub const Handle = struct {
 var debug_allocator = std.heap.DebugAllocator(.{}).init;
 pub const allocator = debug_allocator.allocator();
 
+/// Recycling allocator for video frames and their handles
+/// Freed frame buffers are kept per (width, height, format) so filter chains
+/// reuse a small set of hot buffers instead of allocating a new frame each call.
+const frame_pool_max_per_size = 8;
+var frame_pool = video.BufferPool.init(allocator, frame_pool_max_per_size);
+pub const frame_allocator = frame_pool.allocator();
+
 // ============================================================================
 // Error Handling
 // ============================================================================
@@ -45,25 +52,38 @@ pub const HomeError = enum(c_int) {
             error.FileNotFound => .file_not_found,
             error.InvalidFormat, error.UnsupportedFormat => .invalid_format,
             error.UnsupportedCodec => .unsupported_codec,
+            error.InvalidArgument => .invalid_argument,
             else => .unknown_error,
         };
     }
 };
 
-/// Last error message (for debugging)
-var last_error_msg: [256]u8 = undefined;
-var last_error_len: usize = 0;
+/// Last error message and code, per thread so concurrent callers
+/// don't see each other's failures
+threadlocal var last_error_msg: [256]u8 = undefined;
+threadlocal var last_error_len: usize = 0;
+threadlocal var last_error_code: HomeError = .ok;
 
 pub fn setLastError(msg: []const u8) void {
-    last_error_len = @min(msg.len, last_error_msg.len);
+    last_error_len = @min(msg.len, last_error_msg.len - 1);
     @memcpy(last_error_msg[0..last_error_len], msg[0..last_error_len]);
 }
 
+/// Record a failure for functions that signal errors by returning null
+pub fn setLastErrorCode(code: HomeError, msg: []const u8) void {
+    last_error_code = code;
+    setLastError(msg);
+}
+
 pub export fn video_get_last_error() [*:0]const u8 {
     last_error_msg[last_error_len] = 0;
     return @ptrCast(&last_error_msg);
 }
 
+pub export fn video_get_last_error_code() HomeError {
+    return last_error_code;
+}
+
 // ============================================================================
 // String Handling
 // ============================================================================
@@ -218,7 +238,7 @@ pub const HomeVideoFrame = struct {
     fn deinitVoid(ptr: *anyopaque) void {
         const self: *HomeVideoFrame = @ptrCast(@alignCast(ptr));
         self.frame.deinit();
-        allocator.destroy(self);
+        frame_allocator.destroy(self);
     }
 };
 
@@ -229,15 +249,18 @@ pub export fn video_frame_create(
     pixel_format: c_int,
     out_handle: *?*anyopaque,
 ) HomeError {
-    const pix_fmt: video.PixelFormat = @enumFromInt(pixel_format);
+    const pix_fmt = std.meta.intToEnum(video.PixelFormat, pixel_format) catch {
+        setLastError("Unknown pixel format");
+        return .invalid_argument;
+    };
 
-    const home_frame = allocator.create(HomeVideoFrame) catch {
+    const home_frame = frame_allocator.create(HomeVideoFrame) catch {
         setLastError("Out of memory");
         return .out_of_memory;
     };
 
-    home_frame.frame = video.VideoFrame.init(allocator, width, height, pix_fmt) catch |err| {
-        allocator.destroy(home_frame);
+    home_frame.frame = video.VideoFrame.init(frame_allocator, width, height, pix_fmt) catch |err| {
+        frame_allocator.destroy(home_frame);
         setLastError("Failed to create video frame");
         return HomeError.fromVideoError(err);
     };
@@ -264,25 +287,92 @@ pub export fn video_frame_pixel_format(handle: *anyopaque) c_int {
     return @intFromEnum(self.frame.format);
 }
 
+/// Frame metadata (mirrors video_frame_info_t in video.h)
+pub const FrameInfo = extern struct {
+    width: u32,
+    height: u32,
+    stride: u32,
+    pixel_format: i32,
+    pts_us: i64,
+};
+
+/// Get all frame metadata in one call
+pub export fn video_frame_info(handle: *anyopaque, out_info: *FrameInfo) void {
+    const self: *HomeVideoFrame = @ptrCast(@alignCast(handle));
+    out_info.* = .{
+        .width = self.frame.width,
+        .height = self.frame.height,
+        .stride = self.frame.strides[0],
+        .pixel_format = @intFromEnum(self.frame.format),
+        .pts_us = self.frame.pts.us,
+    };
+}
+
 /// Get frame data pointer for plane
 pub export fn video_frame_data(handle: *anyopaque, plane: u8) ?[*]u8 {
     const self: *HomeVideoFrame = @ptrCast(@alignCast(handle));
-    if (plane >= self.frame.plane_count) return null;
-    return self.frame.data[plane].ptr;
+    const data = self.frame.getPlane(plane) orelse return null;
+    return data.ptr;
 }
 
 /// Get frame linesize for plane
 pub export fn video_frame_linesize(handle: *anyopaque, plane: u8) usize {
     const self: *HomeVideoFrame = @ptrCast(@alignCast(handle));
-    if (plane >= self.frame.plane_count) return 0;
-    return self.frame.linesize[plane];
+    if (plane >= self.frame.num_planes) return 0;
+    return self.frame.strides[plane];
+}
+
+/// Plane layout (mirrors video_plane_info_t in video.h)
+pub const PlaneInfo = extern struct {
+    width: u32,
+    height: u32,
+    stride: u32,
+    bytes_per_pixel: u32,
+    size: usize,
+};
+
+/// Bytes one pixel of a plane occupies (a U/V pair for interleaved chroma)
+fn planeBytesPerPixel(format: video.PixelFormat, plane: u8) u32 {
+    return switch (format) {
+        .nv12, .nv21 => if (plane == 0) 1 else 2,
+        else => if (format.isPlanar())
+            (if (format.bitDepth() > 8) 2 else 1)
+        else
+            @intFromFloat(format.bytesPerPixel().?),
+    };
+}
+
+/// Get the layout of one plane, so callers can view its memory safely
+/// Fails with invalid_argument if the plane doesn't exist.
+pub export fn video_frame_plane_info(handle: *anyopaque, plane: u8, out_info: *PlaneInfo) HomeError {
+    const self: *HomeVideoFrame = @ptrCast(@alignCast(handle));
+    if (plane >= self.frame.num_planes) {
+        setLastError("Frame has no such plane");
+        return .invalid_argument;
+    }
+
+    const info = PlaneInfo{
+        .width = self.frame.getPlaneWidth(plane),
+        .height = self.frame.getPlaneHeight(plane),
+        .stride = self.frame.strides[plane],
+        .bytes_per_pixel = planeBytesPerPixel(self.frame.format, plane),
+        .size = self.frame.getPlaneSize(plane),
+    };
+    if (@as(usize, info.width) * info.bytes_per_pixel > info.stride) {
+        setLastError("Plane rows are wider than the stride");
+        return .invalid_format;
+    }
+
+    out_info.* = info;
+    return .ok;
 }
 
 /// Free video frame
+/// The frame's buffers go back to the frame pool for reuse.
 pub export fn video_frame_free(handle: *anyopaque) void {
     const self: *HomeVideoFrame = @ptrCast(@alignCast(handle));
     self.frame.deinit();
-    allocator.destroy(self);
+    frame_allocator.destroy(self);
 }
 
 // ============================================================================
@@ -290,145 +380,385 @@ pub export fn video_frame_free(handle: *anyopaque) void {
 // ============================================================================
 
 /// Apply scale filter to video frame
+/// Returns the new frame handle, or null on error.
 pub export fn video_filter_scale(
     src_handle: *anyopaque,
     dst_width: u32,
     dst_height: u32,
     algorithm: c_int,
-    out_handle: *?*anyopaque,
-) HomeError {
+) ?*anyopaque {
     const src: *HomeVideoFrame = @ptrCast(@alignCast(src_handle));
     const scale_algo: video.ScaleAlgorithm = @enumFromInt(algorithm);
 
-    const home_frame = allocator.create(HomeVideoFrame) catch {
-        setLastError("Out of memory");
-        return .out_of_memory;
+    const home_frame = frame_allocator.create(HomeVideoFrame) catch {
+        setLastErrorCode(.out_of_memory, "Out of memory");
+        return null;
     };
 
-    var filter = video.ScaleFilter{
-        .width = dst_width,
-        .height = dst_height,
-        .algorithm = scale_algo,
-    };
+    const filter = video.ScaleFilter.init(frame_allocator, dst_width, dst_height, scale_algo);
 
-    home_frame.frame = filter.apply(allocator, &src.frame) catch |err| {
-        allocator.destroy(home_frame);
-        setLastError("Failed to apply scale filter");
-        return HomeError.fromVideoError(err);
+    home_frame.frame = filter.apply(&src.frame) catch |err| {
+        frame_allocator.destroy(home_frame);
+        setLastErrorCode(HomeError.fromVideoError(err), "Failed to apply scale filter");
+        return null;
     };
 
-    out_handle.* = home_frame;
-    return .ok;
+    return home_frame;
+}
+
+/// Scale with Lanczos on the GPU when one is available
+/// Falls back to the CPU Lanczos filter when there is no usable GPU, the
+/// format isn't a packed single-plane format, or the GPU path fails.
+/// Returns the new frame handle, or null on error.
+pub export fn video_filter_scale_gpu(
+    src_handle: *anyopaque,
+    dst_width: u32,
+    dst_height: u32,
+) ?*anyopaque {
+    const src: *HomeVideoFrame = @ptrCast(@alignCast(src_handle));
+
+    const gpu_frame = video.gpu_filters.scaleLanczos(frame_allocator, &src.frame, dst_width, dst_height) catch null;
+    if (gpu_frame) |result| {
+        var result_frame = result;
+        const home_frame = frame_allocator.create(HomeVideoFrame) catch {
+            result_frame.deinit();
+            setLastErrorCode(.out_of_memory, "Out of memory");
+            return null;
+        };
+        home_frame.frame = result_frame;
+        return home_frame;
+    }
+
+    return video_filter_scale(src_handle, dst_width, dst_height, @intFromEnum(video.ScaleAlgorithm.lanczos));
 }
 
 /// Apply crop filter to video frame
+/// Returns the new frame handle, or null on error.
 pub export fn video_filter_crop(
     src_handle: *anyopaque,
     x: u32,
     y: u32,
     width: u32,
     height: u32,
-    out_handle: *?*anyopaque,
-) HomeError {
+) ?*anyopaque {
     const src: *HomeVideoFrame = @ptrCast(@alignCast(src_handle));
 
-    const home_frame = allocator.create(HomeVideoFrame) catch {
-        setLastError("Out of memory");
-        return .out_of_memory;
+    const home_frame = frame_allocator.create(HomeVideoFrame) catch {
+        setLastErrorCode(.out_of_memory, "Out of memory");
+        return null;
     };
 
-    var filter = video.CropFilter{
-        .x = x,
-        .y = y,
-        .width = width,
-        .height = height,
-    };
+    const filter = video.CropFilter.init(frame_allocator, x, y, width, height);
 
-    home_frame.frame = filter.apply(allocator, &src.frame) catch |err| {
-        allocator.destroy(home_frame);
-        setLastError("Failed to apply crop filter");
-        return HomeError.fromVideoError(err);
+    home_frame.frame = filter.apply(&src.frame) catch |err| {
+        frame_allocator.destroy(home_frame);
+        setLastErrorCode(HomeError.fromVideoError(err), "Failed to apply crop filter");
+        return null;
     };
 
-    out_handle.* = home_frame;
-    return .ok;
+    return home_frame;
 }
 
 /// Apply grayscale filter
+/// Returns the new frame handle, or null on error.
 pub export fn video_filter_grayscale(
     src_handle: *anyopaque,
-    out_handle: *?*anyopaque,
-) HomeError {
+) ?*anyopaque {
     const src: *HomeVideoFrame = @ptrCast(@alignCast(src_handle));
 
-    const home_frame = allocator.create(HomeVideoFrame) catch {
-        setLastError("Out of memory");
-        return .out_of_memory;
+    const home_frame = frame_allocator.create(HomeVideoFrame) catch {
+        setLastErrorCode(.out_of_memory, "Out of memory");
+        return null;
     };
 
-    var filter = video.GrayscaleFilter{};
+    const filter = video.GrayscaleFilter.init(frame_allocator);
 
-    home_frame.frame = filter.apply(allocator, &src.frame) catch |err| {
-        allocator.destroy(home_frame);
-        setLastError("Failed to apply grayscale filter");
-        return HomeError.fromVideoError(err);
+    home_frame.frame = filter.apply(&src.frame) catch |err| {
+        frame_allocator.destroy(home_frame);
+        setLastErrorCode(HomeError.fromVideoError(err), "Failed to apply grayscale filter");
+        return null;
     };
 
-    out_handle.* = home_frame;
-    return .ok;
+    return home_frame;
 }
 
 /// Apply blur filter
+/// Returns the new frame handle, or null on error.
 pub export fn video_filter_blur(
     src_handle: *anyopaque,
     sigma: f32,
-    out_handle: *?*anyopaque,
-) HomeError {
+) ?*anyopaque {
     const src: *HomeVideoFrame = @ptrCast(@alignCast(src_handle));
 
-    const home_frame = allocator.create(HomeVideoFrame) catch {
-        setLastError("Out of memory");
-        return .out_of_memory;
+    const home_frame = frame_allocator.create(HomeVideoFrame) catch {
+        setLastErrorCode(.out_of_memory, "Out of memory");
+        return null;
     };
 
-    var filter = video.BlurFilter{ .sigma = sigma };
+    const filter = video.BlurFilter.initSigma(frame_allocator, sigma);
 
-    home_frame.frame = filter.apply(allocator, &src.frame) catch |err| {
-        allocator.destroy(home_frame);
-        setLastError("Failed to apply blur filter");
-        return HomeError.fromVideoError(err);
+    home_frame.frame = filter.apply(&src.frame) catch |err| {
+        frame_allocator.destroy(home_frame);
+        setLastErrorCode(HomeError.fromVideoError(err), "Failed to apply blur filter");
+        return null;
     };
 
-    out_handle.* = home_frame;
-    return .ok;
+    return home_frame;
+}
+
+/// Apply blur on the GPU when one is available
+/// Runs the same box blur as video_filter_blur, so results are identical.
+/// Falls back to the CPU blur filter under the same conditions as
+/// video_filter_scale_gpu.
+/// Returns the new frame handle, or null on error.
+pub export fn video_filter_blur_gpu(
+    src_handle: *anyopaque,
+    sigma: f32,
+) ?*anyopaque {
+    const src: *HomeVideoFrame = @ptrCast(@alignCast(src_handle));
+
+    const filter = video.BlurFilter.initSigma(frame_allocator, sigma);
+    const gpu_frame = video.gpu_filters.blur(frame_allocator, &src.frame, &filter) catch null;
+    if (gpu_frame) |result| {
+        var result_frame = result;
+        const home_frame = frame_allocator.create(HomeVideoFrame) catch {
+            result_frame.deinit();
+            setLastErrorCode(.out_of_memory, "Out of memory");
+            return null;
+        };
+        home_frame.frame = result_frame;
+        return home_frame;
+    }
+
+    return video_filter_blur(src_handle, sigma);
 }
 
 /// Apply rotate filter
+/// Returns the new frame handle, or null on error.
 pub export fn video_filter_rotate(
     src_handle: *anyopaque,
     angle: c_int,
-    out_handle: *?*anyopaque,
-) HomeError {
+) ?*anyopaque {
     const src: *HomeVideoFrame = @ptrCast(@alignCast(src_handle));
     const rotation: video.RotationAngle = @enumFromInt(angle);
 
-    const home_frame = allocator.create(HomeVideoFrame) catch {
-        setLastError("Out of memory");
-        return .out_of_memory;
+    const home_frame = frame_allocator.create(HomeVideoFrame) catch {
+        setLastErrorCode(.out_of_memory, "Out of memory");
+        return null;
     };
 
-    var filter = video.RotateFilter{ .angle = rotation };
+    const filter = video.RotateFilter.init(frame_allocator, rotation);
 
-    home_frame.frame = filter.apply(allocator, &src.frame) catch |err| {
-        allocator.destroy(home_frame);
-        setLastError("Failed to apply rotate filter");
-        return HomeError.fromVideoError(err);
+    home_frame.frame = filter.apply(&src.frame) catch |err| {
+        frame_allocator.destroy(home_frame);
+        setLastErrorCode(HomeError.fromVideoError(err), "Failed to apply rotate filter");
+        return null;
     };
 
-    out_handle.* = home_frame;
+    return home_frame;
+}
+
+/// Filter operation kinds for video_filter_pipeline
+pub const VideoOpKind = enum(i32) {
+    scale = 0,
+    crop = 1,
+    grayscale = 2,
+    blur = 3,
+    rotate = 4,
+};
+
+/// Filter operation descriptor (mirrors video_op_t in video.h)
+///   scale:     i0=width, i1=height, i2=algorithm
+///   crop:      i0=x, i1=y, i2=width, i3=height
+///   grayscale: no arguments
+///   blur:      f0=sigma
+///   rotate:    i0=angle
+pub const VideoOp = extern struct {
+    kind: i32,
+    i0: i32,
+    i1: i32,
+    i2: i32,
+    i3: i32,
+    f0: f32,
+};
+
+/// Op arguments come straight from the caller, so negative sizes and
+/// out-of-range enum values are rejected rather than cast
+fn opSize(value: i32) !u32 {
+    return std.math.cast(u32, value) orelse error.InvalidArgument;
+}
+
+fn opEnum(comptime E: type, value: i32) !E {
+    return std.meta.intToEnum(E, value) catch error.InvalidArgument;
+}
+
+fn applyFilterOp(src: *const video.VideoFrame, op: VideoOp) !video.VideoFrame {
+    switch (try opEnum(VideoOpKind, op.kind)) {
+        .scale => {
+            const filter = video.ScaleFilter.init(frame_allocator, try opSize(op.i0), try opSize(op.i1), try opEnum(video.ScaleAlgorithm, op.i2));
+            return filter.apply(src);
+        },
+        .crop => {
+            const filter = video.CropFilter.init(frame_allocator, try opSize(op.i0), try opSize(op.i1), try opSize(op.i2), try opSize(op.i3));
+            return filter.apply(src);
+        },
+        .grayscale => {
+            const filter = video.GrayscaleFilter.init(frame_allocator);
+            return filter.apply(src);
+        },
+        .blur => {
+            const filter = video.BlurFilter.initSigma(frame_allocator, op.f0);
+            return filter.apply(src);
+        },
+        .rotate => {
+            const filter = video.RotateFilter.init(frame_allocator, try opEnum(video.RotationAngle, op.i0));
+            return filter.apply(src);
+        },
+    }
+}
+
+/// Run a chain one filter at a time, freeing each intermediate frame
+fn applyFilterChain(src: *const video.VideoFrame, ops: []const VideoOp) !video.VideoFrame {
+    var current = try applyFilterOp(src, ops[0]);
+    errdefer current.deinit();
+
+    for (ops[1..]) |op| {
+        const next = try applyFilterOp(&current, op);
+        current.deinit();
+        current = next;
+    }
+
+    return current;
+}
+
+/// Build a fused filter for chains that are an in-order subset of
+/// scale -> crop -> grayscale -> blur, or null if the chain can't be fused
+fn fusedFilterFor(src: *const video.VideoFrame, ops: []const VideoOp) ?video.FusedFilter {
+    if (ops.len < 2) return null;
+
+    var filter = video.FusedFilter.init(frame_allocator);
+    var next_kind: i32 = @intFromEnum(VideoOpKind.scale);
+
+    for (ops) |op| {
+        if (op.kind < next_kind or op.kind > @intFromEnum(VideoOpKind.blur)) return null;
+        next_kind = op.kind + 1;
+
+        switch (@as(VideoOpKind, @enumFromInt(op.kind))) {
+            .scale => {
+                if (op.i0 < 0 or op.i1 < 0) return null;
+                filter.scale = .{
+                    .width = @intCast(op.i0),
+                    .height = @intCast(op.i1),
+                    .algorithm = std.meta.intToEnum(video.ScaleAlgorithm, op.i2) catch return null,
+                };
+            },
+            .crop => {
+                if (op.i0 < 0 or op.i1 < 0 or op.i2 < 0 or op.i3 < 0) return null;
+                filter.crop = .{
+                    .x = @intCast(op.i0),
+                    .y = @intCast(op.i1),
+                    .width = @intCast(op.i2),
+                    .height = @intCast(op.i3),
+                };
+            },
+            .grayscale => filter.grayscale = true,
+            .blur => {
+                const blur = video.BlurFilter.initSigma(frame_allocator, op.f0);
+                filter.blur = video.FusedFilter.BlurStage.fromBlurFilter(&blur);
+            },
+            .rotate => unreachable,
+        }
+    }
+
+    if (!filter.supports(src.format)) return null;
+    return filter;
+}
+
+/// Apply a chain of filters in a single call
+/// Intermediate frames are freed internally and never cross the FFI boundary.
+/// Chains of scale/crop/grayscale/blur (in that order) on packed RGB frames
+/// run as one fused strip-tiled pass without intermediate frames.
+/// Returns the new frame handle, or null on error.
+pub export fn video_filter_pipeline(
+    src_handle: *anyopaque,
+    ops: [*]const VideoOp,
+    n_ops: usize,
+) ?*anyopaque {
+    const src: *HomeVideoFrame = @ptrCast(@alignCast(src_handle));
+
+    if (n_ops == 0) {
+        setLastErrorCode(.invalid_argument, "Filter pipeline is empty");
+        return null;
+    }
+
+    const home_frame = frame_allocator.create(HomeVideoFrame) catch {
+        setLastErrorCode(.out_of_memory, "Out of memory");
+        return null;
+    };
+
+    const chain = ops[0..n_ops];
+    const result = if (fusedFilterFor(&src.frame, chain)) |fused|
+        fused.apply(&src.frame)
+    else
+        applyFilterChain(&src.frame, chain);
+
+    home_frame.frame = result catch |err| {
+        frame_allocator.destroy(home_frame);
+        setLastErrorCode(HomeError.fromVideoError(err), "Failed to apply filter pipeline");
+        return null;
+    };
+
+    return home_frame;
+}
+
+/// Scale a batch of frames to the same dimensions in a single call
+/// On failure every output produced so far is freed and all out_handles are null.
+pub export fn video_filter_scale_batch(
+    src_handles: [*]const *anyopaque,
+    n: usize,
+    dst_width: u32,
+    dst_height: u32,
+    algorithm: c_int,
+    out_handles: [*]?*anyopaque,
+) HomeError {
+    const scale_algo = std.meta.intToEnum(video.ScaleAlgorithm, algorithm) catch {
+        setLastError("Invalid scale algorithm");
+        return .invalid_argument;
+    };
+
+    const filter = video.ScaleFilter.init(frame_allocator, dst_width, dst_height, scale_algo);
+
+    for (0..n) |i| out_handles[i] = null;
+
+    for (0..n) |i| {
+        const src: *HomeVideoFrame = @ptrCast(@alignCast(src_handles[i]));
+
+        const home_frame = frame_allocator.create(HomeVideoFrame) catch {
+            freeFrameHandles(out_handles[0..i]);
+            setLastError("Out of memory");
+            return .out_of_memory;
+        };
+
+        home_frame.frame = filter.apply(&src.frame) catch |err| {
+            frame_allocator.destroy(home_frame);
+            freeFrameHandles(out_handles[0..i]);
+            setLastError("Failed to apply scale filter");
+            return HomeError.fromVideoError(err);
+        };
+
+        out_handles[i] = home_frame;
+    }
+
     return .ok;
 }
 
+fn freeFrameHandles(handles: []?*anyopaque) void {
+    for (handles) |*handle| {
+        if (handle.*) |h| video_frame_free(h);
+        handle.* = null;
+    }
+}
+
 // ============================================================================
 // Container Demuxing
 // ============================================================================
@@ -605,9 +935,18 @@ pub export fn video_init() HomeError {
     return .ok;
 }
 
+/// Release frame buffers cached by the frame pool
+pub export fn video_frame_pool_trim() void {
+    frame_pool.trim();
+}
+
+/// Release global caches and report leaks
+/// Frames may still be live afterwards, so the pool is re-created empty and
+/// the backing allocator stays valid; later video_frame_free calls are safe.
 pub export fn video_cleanup() void {
-    // Perform any global cleanup
-    _ = gpa.deinit();
+    frame_pool.deinit();
+    frame_pool = video.BufferPool.init(allocator, frame_pool_max_per_size);
+    _ = debug_allocator.detectLeaks();
 }
 
 // ============================================================================
@@ -624,3 +963,126 @@ pub export fn video_alloc(size: usize) ?[*]u8 {
 pub export fn video_free(ptr: [*]u8, size: usize) void {
     allocator.free(ptr[0..size]);
 }
+
+// ============================================================================
+// Tests
+// ============================================================================
+
+fn testOp(kind: VideoOpKind, args: [4]i32, f0: f32) VideoOp {
+    return .{ .kind = @intFromEnum(kind), .i0 = args[0], .i1 = args[1], .i2 = args[2], .i3 = args[3], .f0 = f0 };
+}
+
+test "fused pipeline matches filter-by-filter pipeline" {
+    var src = try video.VideoFrame.init(frame_allocator, 48, 36, .rgb24);
+    defer src.deinit();
+    for (src.data, 0..) |*byte, i| {
+        byte.* = @truncate(i *% 31 +% (i / 5));
+    }
+
+    const ops = [_]VideoOp{
+        testOp(.scale, .{ 64, 40, @intFromEnum(video.ScaleAlgorithm.bilinear), 0 }, 0),
+        testOp(.crop, .{ 4, 2, 50, 30 }, 0),
+        testOp(.grayscale, .{ 0, 0, 0, 0 }, 0),
+        testOp(.blur, .{ 0, 0, 0, 0 }, 2.5),
+    };
+
+    const fused = fusedFilterFor(&src, &ops) orelse return error.TestUnexpectedResult;
+    var fused_frame = try fused.apply(&src);
+    defer fused_frame.deinit();
+    var chained = try applyFilterChain(&src, &ops);
+    defer chained.deinit();
+
+    try std.testing.expectEqual(chained.width, fused_frame.width);
+    try std.testing.expectEqual(chained.height, fused_frame.height);
+    const row_bytes = @as(usize, chained.width) * 3;
+    for (0..chained.height) |y| {
+        try std.testing.expectEqualSlices(
+            u8,
+            chained.data[y * chained.strides[0] ..][0..row_bytes],
+            fused_frame.data[y * fused_frame.strides[0] ..][0..row_bytes],
+        );
+    }
+}
+
+test "pipeline rejects invalid op arguments" {
+    var src = try video.VideoFrame.init(frame_allocator, 16, 16, .rgb24);
+    defer src.deinit();
+
+    const bad = [_]VideoOp{
+        .{ .kind = 99, .i0 = 0, .i1 = 0, .i2 = 0, .i3 = 0, .f0 = 0 },
+        .{ .kind = -1, .i0 = 0, .i1 = 0, .i2 = 0, .i3 = 0, .f0 = 0 },
+        testOp(.scale, .{ -8, 8, 0, 0 }, 0),
+        testOp(.scale, .{ 8, 8, 42, 0 }, 0),
+        testOp(.crop, .{ 0, -1, 8, 8 }, 0),
+        testOp(.rotate, .{ 7, 0, 0, 0 }, 0),
+    };
+    for (bad) |op| {
+        try std.testing.expectError(error.InvalidArgument, applyFilterOp(&src, op));
+    }
+}
+
+test "plane info stays inside each plane" {
+    const formats = [_]video.PixelFormat{ .yuv420p, .yuv422p, .nv12, .rgb24, .rgba32, .gray8, .yuyv422 };
+    for (formats) |format| {
+        var handle: ?*anyopaque = null;
+        try std.testing.expectEqual(HomeError.ok, video_frame_create(33, 17, @intFromEnum(format), &handle));
+        defer video_frame_free(handle.?);
+
+        const self: *HomeVideoFrame = @ptrCast(@alignCast(handle.?));
+        var plane: u8 = 0;
+        while (plane < self.frame.num_planes) : (plane += 1) {
+            var info: PlaneInfo = undefined;
+            try std.testing.expectEqual(HomeError.ok, video_frame_plane_info(handle.?, plane, &info));
+            const last_row_end = @as(usize, info.height - 1) * info.stride + @as(usize, info.width) * info.bytes_per_pixel;
+            try std.testing.expect(last_row_end <= info.size);
+            try std.testing.expectEqual(self.frame.getPlane(plane).?.len, info.size);
+        }
+
+        var info: PlaneInfo = undefined;
+        try std.testing.expectEqual(HomeError.invalid_argument, video_frame_plane_info(handle.?, self.frame.num_planes, &info));
+    }
+}
+
+test "scale batch rejects an invalid algorithm" {
+    var handle: ?*anyopaque = null;
+    try std.testing.expectEqual(HomeError.ok, video_frame_create(16, 16, @intFromEnum(video.PixelFormat.rgb24), &handle));
+    defer video_frame_free(handle.?);
+
+    const srcs = [_]*anyopaque{handle.?};
+    var outs = [_]?*anyopaque{null};
+    for ([_]c_int{ -1, 42 }) |algorithm| {
+        try std.testing.expectEqual(HomeError.invalid_argument, video_filter_scale_batch(&srcs, srcs.len, 8, 8, algorithm, &outs));
+        try std.testing.expectEqual(@as(?*anyopaque, null), outs[0]);
+    }
+}
+
+test "native pixel format values match video_pixel_format_t" {
+    // Values are part of the C ABI (video.h) and the Python PixelFormat enum
+    const expected = [_]struct { video.PixelFormat, c_int }{
+        .{ .yuv420p, 0 },
+        .{ .yuv422p, 1 },
+        .{ .yuv444p, 2 },
+        .{ .yuv420p10le, 3 },
+        .{ .yuv420p10be, 4 },
+        .{ .yuv422p10le, 5 },
+        .{ .yuv444p10le, 6 },
+        .{ .nv12, 7 },
+        .{ .nv21, 8 },
+        .{ .rgb24, 9 },
+        .{ .bgr24, 10 },
+        .{ .rgba32, 11 },
+        .{ .bgra32, 12 },
+        .{ .argb32, 13 },
+        .{ .abgr32, 14 },
+        .{ .rgb48le, 15 },
+        .{ .rgba64le, 16 },
+        .{ .gray8, 17 },
+        .{ .gray16le, 18 },
+        .{ .yuyv422, 19 },
+        .{ .uyvy422, 20 },
+    };
+    try std.testing.expectEqual(@typeInfo(video.PixelFormat).@"enum".fields.len, expected.len);
+    for (expected) |entry| {
+        try std.testing.expectEqual(entry[1], @as(c_int, @intFromEnum(entry[0])));
+    }
+}
@@ -309,6 +309,176 @@ pub const PacketPool = struct {
     }
 };
 
+/// Allocator that recycles freed buffers of the same size and alignment
+/// Frame buffers for a given (width, height, format) always have the same
+/// size, so any code that allocates frames through this allocator draws from
+/// a per-shape freelist instead of going back to the backing allocator.
+/// Each freelist holds at most `max_per_size` buffers and all freelists
+/// together hold at most `max_bytes`; when a new size would exceed that,
+/// buffers of other sizes are evicted first, so a stream of changing
+/// resolutions can't grow the cache without bound.
+pub const BufferPool = struct {
+    backing: std.mem.Allocator,
+    free_lists: std.AutoHashMapUnmanaged(Key, std.ArrayListUnmanaged([*]u8)) = .{},
+    max_per_size: usize,
+    max_bytes: usize,
+    cached_bytes: usize = 0,
+    mutex: std.Thread.Mutex = .{},
+
+    /// Default cap on cached bytes (eight 1080p RGBA frames)
+    pub const default_max_bytes: usize = 8 * 1920 * 1080 * 4;
+
+    const Self = @This();
+
+    const Key = struct {
+        len: usize,
+        alignment: std.mem.Alignment,
+    };
+
+    const vtable = std.mem.Allocator.VTable{
+        .alloc = alloc,
+        .resize = resize,
+        .remap = remap,
+        .free = free,
+    };
+
+    pub fn init(backing: std.mem.Allocator, max_per_size: usize) Self {
+        return initWithLimit(backing, max_per_size, default_max_bytes);
+    }
+
+    pub fn initWithLimit(backing: std.mem.Allocator, max_per_size: usize, max_bytes: usize) Self {
+        return .{
+            .backing = backing,
+            .max_per_size = max_per_size,
+            .max_bytes = max_bytes,
+        };
+    }
+
+    pub fn deinit(self: *Self) void {
+        self.trim();
+        self.free_lists.deinit(self.backing);
+    }
+
+    pub fn allocator(self: *Self) std.mem.Allocator {
+        return .{ .ptr = self, .vtable = &vtable };
+    }
+
+    /// Return all cached buffers to the backing allocator
+    pub fn trim(self: *Self) void {
+        self.mutex.lock();
+        defer self.mutex.unlock();
+
+        var it = self.free_lists.iterator();
+        while (it.next()) |entry| {
+            const key = entry.key_ptr.*;
+            for (entry.value_ptr.items) |ptr| {
+                self.backing.rawFree(ptr[0..key.len], key.alignment, @returnAddress());
+            }
+            entry.value_ptr.deinit(self.backing);
+        }
+        self.free_lists.clearRetainingCapacity();
+        self.cached_bytes = 0;
+    }
+
+    /// Number of buffers currently cached across all sizes
+    pub fn cachedCount(self: *Self) usize {
+        self.mutex.lock();
+        defer self.mutex.unlock();
+
+        var count: usize = 0;
+        var it = self.free_lists.valueIterator();
+        while (it.next()) |list| count += list.items.len;
+        return count;
+    }
+
+    /// Total size of the buffers currently cached
+    pub fn cachedBytes(self: *Self) usize {
+        self.mutex.lock();
+        defer self.mutex.unlock();
+        return self.cached_bytes;
+    }
+
+    fn alloc(ctx: *anyopaque, len: usize, alignment: std.mem.Alignment, ret_addr: usize) ?[*]u8 {
+        const self: *Self = @ptrCast(@alignCast(ctx));
+        {
+            self.mutex.lock();
+            defer self.mutex.unlock();
+
+            if (self.free_lists.getPtr(.{ .len = len, .alignment = alignment })) |list| {
+                if (list.pop()) |ptr| {
+                    self.cached_bytes -= len;
+                    return ptr;
+                }
+            }
+        }
+        return self.backing.rawAlloc(len, alignment, ret_addr);
+    }
+
+    fn resize(ctx: *anyopaque, memory: []u8, alignment: std.mem.Alignment, new_len: usize, ret_addr: usize) bool {
+        const self: *Self = @ptrCast(@alignCast(ctx));
+        return self.backing.rawResize(memory, alignment, new_len, ret_addr);
+    }
+
+    fn remap(ctx: *anyopaque, memory: []u8, alignment: std.mem.Alignment, new_len: usize, ret_addr: usize) ?[*]u8 {
+        const self: *Self = @ptrCast(@alignCast(ctx));
+        return self.backing.rawRemap(memory, alignment, new_len, ret_addr);
+    }
+
+    fn free(ctx: *anyopaque, memory: []u8, alignment: std.mem.Alignment, ret_addr: usize) void {
+        const self: *Self = @ptrCast(@alignCast(ctx));
+        {
+            self.mutex.lock();
+            defer self.mutex.unlock();
+
+            if (self.cache(memory, alignment)) return;
+        }
+        self.backing.rawFree(memory, alignment, ret_addr);
+    }
+
+    /// Put a freed buffer on its freelist, evicting other sizes to stay
+    /// under `max_bytes` (caller holds `mutex`). False if it can't be kept.
+    fn cache(self: *Self, memory: []u8, alignment: std.mem.Alignment) bool {
+        if (memory.len > self.max_bytes) return false;
+
+        const key = Key{ .len = memory.len, .alignment = alignment };
+        const existing = self.free_lists.getPtr(key);
+        if (existing) |list| {
+            if (list.items.len >= self.max_per_size) return false;
+        }
+
+        if (existing == null or self.cached_bytes + memory.len > self.max_bytes) {
+            self.evict(key, memory.len);
+        }
+        if (self.cached_bytes + memory.len > self.max_bytes) return false;
+
+        const gop = self.free_lists.getOrPut(self.backing, key) catch return false;
+        if (!gop.found_existing) gop.value_ptr.* = .{};
+        gop.value_ptr.append(self.backing, memory.ptr) catch return false;
+        self.cached_bytes += memory.len;
+        return true;
+    }
+
+    /// Drop empty freelists and release other sizes' buffers until `needed`
+    /// more bytes fit (caller holds `mutex`)
+    fn evict(self: *Self, keep: Key, needed: usize) void {
+        var it = self.free_lists.iterator();
+        while (it.next()) |entry| {
+            const key = entry.key_ptr.*;
+            if (std.meta.eql(key, keep)) continue;
+
+            const list = entry.value_ptr;
+            if (list.items.len > 0 and self.cached_bytes + needed <= self.max_bytes) continue;
+
+            for (list.items) |ptr| {
+                self.backing.rawFree(ptr[0..key.len], key.alignment, @returnAddress());
+            }
+            self.cached_bytes -= key.len * list.items.len;
+            list.deinit(self.backing);
+            self.free_lists.removeByPtr(entry.key_ptr);
+        }
+    }
+};
+
 /// Ring buffer for streaming
 pub fn RingBuffer(comptime T: type) type {
     return struct {
@@ -456,6 +626,64 @@ test "VideoFramePool" {
     try std.testing.expectEqual(@as(usize, 0), pool_stats.in_use);
 }
 
+test "BufferPool recycles buffers of the same size" {
+    const allocator = std.testing.allocator;
+
+    var pool = BufferPool.init(allocator, 4);
+    defer pool.deinit();
+    const pooled = pool.allocator();
+
+    const a = try pooled.alloc(u8, 1024);
+    const a_ptr = a.ptr;
+    pooled.free(a);
+    try std.testing.expectEqual(@as(usize, 1), pool.cachedCount());
+
+    const b = try pooled.alloc(u8, 1024);
+    try std.testing.expectEqual(a_ptr, b.ptr);
+    try std.testing.expectEqual(@as(usize, 0), pool.cachedCount());
+
+    const c = try pooled.alloc(u8, 512);
+    pooled.free(b);
+    pooled.free(c);
+    try std.testing.expectEqual(@as(usize, 2), pool.cachedCount());
+
+    pool.trim();
+    try std.testing.expectEqual(@as(usize, 0), pool.cachedCount());
+}
+
+test "BufferPool evicts other sizes to stay under its byte cap" {
+    const allocator = std.testing.allocator;
+
+    var pool = BufferPool.initWithLimit(allocator, 4, 2048);
+    defer pool.deinit();
+    const pooled = pool.allocator();
+
+    // Two sizes fit under the cap together
+    const a = try pooled.alloc(u8, 1024);
+    const b = try pooled.alloc(u8, 512);
+    pooled.free(a);
+    pooled.free(b);
+    try std.testing.expectEqual(@as(usize, 1536), pool.cachedBytes());
+
+    // A third size pushes the others out instead of growing the cache
+    const c = try pooled.alloc(u8, 1800);
+    pooled.free(c);
+    try std.testing.expectEqual(@as(usize, 1), pool.cachedCount());
+    try std.testing.expectEqual(@as(usize, 1800), pool.cachedBytes());
+
+    // Buffers larger than the cap go straight back to the backing allocator
+    const d = try pooled.alloc(u8, 4096);
+    pooled.free(d);
+    try std.testing.expectEqual(@as(usize, 1800), pool.cachedBytes());
+
+    // Many distinct sizes never exceed the cap
+    for (1..64) |i| {
+        const buf = try pooled.alloc(u8, i * 100);
+        pooled.free(buf);
+        try std.testing.expect(pool.cachedBytes() <= 2048);
+    }
+}
+
 test "RingBuffer" {
     const allocator = std.testing.allocator;
 
@@ -9,6 +9,7 @@ pub const transform = @import("video/transform.zig");
 pub const convolution = @import("video/convolution.zig");
 pub const deinterlace = @import("video/deinterlace.zig");
 pub const denoise = @import("video/denoise.zig");
+pub const fused = @import("video/fused.zig");
 
 // Scale filter
 pub const ScaleFilter = scale.ScaleFilter;
@@ -56,6 +57,9 @@ pub const FieldSeparator = deinterlace.FieldSeparator;
 pub const DenoiseFilter = denoise.DenoiseFilter;
 pub const DenoiseMethod = denoise.DenoiseMethod;
 
+// Fused scale/crop/grayscale/blur
+pub const FusedFilter = fused.FusedFilter;
+
 // ============================================================================
 // Tests
 // ============================================================================
@@ -69,4 +73,5 @@ test "Video filters imports" {
     _ = convolution;
     _ = deinterlace;
     _ = denoise;
+    _ = fused;
 }
@@ -111,7 +111,7 @@ pub const ColorFilter = struct {
     /// Apply color adjustment to a video frame
     pub fn apply(self: *const Self, input: *const VideoFrame) !VideoFrame {
         if (self.adjustment.isIdentity()) {
-            return try input.clone(self.allocator);
+            return try input.clone();
         }
 
         var output = try VideoFrame.init(
@@ -131,18 +131,15 @@ pub const ColorFilter = struct {
         }
 
         output.pts = input.pts;
-        output.dts = input.dts;
         output.duration = input.duration;
         return output;
     }
 
     fn applyRgb(self: *const Self, input: *const VideoFrame, output: *VideoFrame, bytes_per_pixel: usize) !void {
-        if (input.data[0] == null or output.data[0] == null) return;
-
-        const src = input.data[0].?;
-        const dst = output.data[0].?;
-        const src_stride = input.linesize[0];
-        const dst_stride = output.linesize[0];
+        const src = input.getPlane(0) orelse return;
+        const dst = output.getPlane(0) orelse return;
+        const src_stride: usize = input.strides[0];
+        const dst_stride: usize = output.strides[0];
         const adj = &self.adjustment;
 
         for (0..input.height) |y| {
@@ -195,8 +192,8 @@ pub const ColorFilter = struct {
         const adj = &self.adjustment;
 
         // Apply brightness and contrast to Y plane
-        if (input.data[0]) |src| {
-            if (output.data[0]) |dst| {
+        if (input.getPlane(0)) |src| {
+            if (output.getPlane(0)) |dst| {
                 for (0..src.len) |i| {
                     if (i >= dst.len) break;
 
@@ -215,8 +212,8 @@ pub const ColorFilter = struct {
 
         // Apply saturation to UV planes
         for (1..3) |plane_idx| {
-            if (input.data[plane_idx]) |src| {
-                if (output.data[plane_idx]) |dst| {
+            if (input.getPlane(@intCast(plane_idx))) |src| {
+                if (output.getPlane(@intCast(plane_idx))) |dst| {
                     for (0..src.len) |i| {
                         if (i >= dst.len) break;
 
@@ -235,10 +232,8 @@ pub const ColorFilter = struct {
     }
 
     fn applyGrayscale(self: *const Self, input: *const VideoFrame, output: *VideoFrame) !void {
-        if (input.data[0] == null or output.data[0] == null) return;
-
-        const src = input.data[0].?;
-        const dst = output.data[0].?;
+        const src = input.getPlane(0) orelse return;
+        const dst = output.getPlane(0) orelse return;
         const adj = &self.adjustment;
 
         for (0..src.len) |i| {
@@ -278,9 +273,9 @@ pub const InvertFilter = struct {
         errdefer output.deinit();
 
         // Invert Y/RGB plane
-        if (input.data[0]) |src| {
-            if (output.data[0]) |dst| {
-                const bytes_per_pixel = switch (input.format) {
+        if (input.getPlane(0)) |src| {
+            if (output.getPlane(0)) |dst| {
+                const bytes_per_pixel: usize = switch (input.format) {
                     .rgba32, .bgra32, .argb32, .abgr32 => 4,
                     .rgb24, .bgr24 => 3,
                     else => 1,
@@ -301,8 +296,8 @@ pub const InvertFilter = struct {
 
         // Copy UV planes unchanged (invert only luminance)
         for (1..3) |plane_idx| {
-            if (input.data[plane_idx]) |src| {
-                if (output.data[plane_idx]) |dst| {
+            if (input.getPlane(@intCast(plane_idx))) |src| {
+                if (output.getPlane(@intCast(plane_idx))) |dst| {
                     const len = @min(src.len, dst.len);
                     @memcpy(dst[0..len], src[0..len]);
                 }
@@ -310,7 +305,6 @@ pub const InvertFilter = struct {
         }
 
         output.pts = input.pts;
-        output.dts = input.dts;
         output.duration = input.duration;
         return output;
     }
@@ -320,6 +314,86 @@ pub const InvertFilter = struct {
 // Grayscale Filter
 // ============================================================================
 
+// ITU-R BT.601 luminance weights in 8.8 fixed point (0.299, 0.587, 0.114).
+// They sum to 256, so the rounded result always fits in a u8.
+const luma_r: u16 = 77;
+const luma_g: u16 = 150;
+const luma_b: u16 = 29;
+
+/// ITU-R BT.601 luminance of an RGB pixel
+pub fn luma(r: u8, g: u8, b: u8) u8 {
+    const y = (luma_r * @as(u16, r) + luma_g * @as(u16, g) + luma_b * @as(u16, b) + 128) >> 8;
+    return @intCast(y);
+}
+
+/// Pixels converted per vector step: one native register of u8 lanes
+const gray_lanes = std.simd.suggestVectorLength(u8) orelse 16;
+
+/// Shuffle mask picking channel `channel` of each of `gray_lanes` packed pixels
+fn channelMask(comptime bytes_per_pixel: usize, comptime channel: usize) @Vector(gray_lanes, i32) {
+    var mask: [gray_lanes]i32 = undefined;
+    for (0..gray_lanes) |k| mask[k] = @intCast(k * bytes_per_pixel + channel);
+    return mask;
+}
+
+/// Shuffle mask writing each gray value to R, G and B and, for four-channel
+/// formats, taking alpha from the second shuffle operand
+fn interleaveMask(comptime bytes_per_pixel: usize) @Vector(gray_lanes * bytes_per_pixel, i32) {
+    var mask: [gray_lanes * bytes_per_pixel]i32 = undefined;
+    for (0..gray_lanes) |k| {
+        for (0..bytes_per_pixel) |c| {
+            mask[k * bytes_per_pixel + c] = if (c == 3) ~@as(i32, @intCast(k)) else @intCast(k);
+        }
+    }
+    return mask;
+}
+
+/// Convert packed RGB(A)/BGR(A) pixels to gray, keeping alpha
+///
+/// Loads `gray_lanes` pixels at a time, deinterleaves the channels with
+/// byte shuffles and computes the luma with 16-bit fixed-point math, which
+/// LLVM lowers to SSE/AVX2/AVX-512 or NEON. The tail uses scalar luma().
+fn grayscalePacked(comptime bytes_per_pixel: usize, comptime is_bgr: bool, src: []const u8, dst: []u8) void {
+    const r_off = if (is_bgr) 2 else 0;
+    const b_off = if (is_bgr) 0 else 2;
+    const chunk = gray_lanes * bytes_per_pixel;
+    const Wide = @Vector(gray_lanes, u16);
+
+    const r_mask = comptime channelMask(bytes_per_pixel, r_off);
+    const g_mask = comptime channelMask(bytes_per_pixel, 1);
+    const b_mask = comptime channelMask(bytes_per_pixel, b_off);
+    const a_mask = comptime channelMask(bytes_per_pixel, bytes_per_pixel - 1);
+    const out_mask = comptime interleaveMask(bytes_per_pixel);
+
+    const len = @min(src.len, dst.len) / bytes_per_pixel * bytes_per_pixel;
+
+    var i: usize = 0;
+    while (i + chunk <= len) : (i += chunk) {
+        const px: @Vector(chunk, u8) = src[i..][0..chunk].*;
+
+        const r: Wide = @intCast(@shuffle(u8, px, undefined, r_mask));
+        const g: Wide = @intCast(@shuffle(u8, px, undefined, g_mask));
+        const b: Wide = @intCast(@shuffle(u8, px, undefined, b_mask));
+        const y: @Vector(gray_lanes, u8) = @intCast((r * @as(Wide, @splat(luma_r)) +
+            g * @as(Wide, @splat(luma_g)) +
+            b * @as(Wide, @splat(luma_b)) +
+            @as(Wide, @splat(128))) >> @splat(8));
+
+        const alpha = @shuffle(u8, px, undefined, a_mask);
+        dst[i..][0..chunk].* = @shuffle(u8, y, alpha, out_mask);
+    }
+
+    while (i < len) : (i += bytes_per_pixel) {
+        const gray = luma(src[i + r_off], src[i + 1], src[i + b_off]);
+        dst[i] = gray;
+        dst[i + 1] = gray;
+        dst[i + 2] = gray;
+        if (bytes_per_pixel == 4) {
+            dst[i + 3] = src[i + 3];
+        }
+    }
+}
+
 pub const GrayscaleFilter = struct {
     allocator: std.mem.Allocator,
 
@@ -350,39 +424,19 @@ pub const GrayscaleFilter = struct {
         );
         errdefer output.deinit();
 
-        if (input.data[0]) |src| {
-            if (output.data[0]) |dst| {
-                const bytes_per_pixel: usize = switch (input.format) {
-                    .rgba32, .bgra32, .argb32, .abgr32 => 4,
-                    else => 3,
-                };
-
-                const is_bgr = input.format == .bgr24 or input.format == .bgra32;
-
-                var i: usize = 0;
-                while (i + bytes_per_pixel <= src.len and i + bytes_per_pixel <= dst.len) {
-                    const r: f32 = @floatFromInt(src[i + if (is_bgr) 2 else 0]);
-                    const g: f32 = @floatFromInt(src[i + 1]);
-                    const b: f32 = @floatFromInt(src[i + if (is_bgr) 0 else 2]);
-
-                    // ITU-R BT.601 luminance weights
-                    const gray: u8 = @intFromFloat(@round(0.299 * r + 0.587 * g + 0.114 * b));
-
-                    dst[i] = gray;
-                    dst[i + 1] = gray;
-                    dst[i + 2] = gray;
-
-                    if (bytes_per_pixel == 4) {
-                        dst[i + 3] = src[i + 3];
-                    }
-
-                    i += bytes_per_pixel;
+        if (input.getPlane(0)) |src| {
+            if (output.getPlane(0)) |dst| {
+                switch (input.format) {
+                    .rgb24 => grayscalePacked(3, false, src, dst),
+                    .bgr24 => grayscalePacked(3, true, src, dst),
+                    .rgba32 => grayscalePacked(4, false, src, dst),
+                    .bgra32 => grayscalePacked(4, true, src, dst),
+                    else => unreachable,
                 }
             }
         }
 
         output.pts = input.pts;
-        output.dts = input.dts;
         output.duration = input.duration;
         return output;
     }
@@ -397,8 +451,8 @@ pub const GrayscaleFilter = struct {
         errdefer output.deinit();
 
         // Copy Y plane
-        if (input.data[0]) |src| {
-            if (output.data[0]) |dst| {
+        if (input.getPlane(0)) |src| {
+            if (output.getPlane(0)) |dst| {
                 const len = @min(src.len, dst.len);
                 @memcpy(dst[0..len], src[0..len]);
             }
@@ -406,13 +460,12 @@ pub const GrayscaleFilter = struct {
 
         // Set UV planes to neutral (128)
         for (1..3) |plane_idx| {
-            if (output.data[plane_idx]) |dst| {
+            if (output.getPlane(@intCast(plane_idx))) |dst| {
                 @memset(dst, 128);
             }
         }
 
         output.pts = input.pts;
-        output.dts = input.dts;
         output.duration = input.duration;
         return output;
     }
@@ -460,3 +513,33 @@ test "GrayscaleFilter initialization" {
     const allocator = std.testing.allocator;
     _ = GrayscaleFilter.init(allocator);
 }
+
+test "Grayscale vector path matches scalar luma" {
+    // Enough pixels for several vector steps plus a scalar tail
+    const pixels = gray_lanes * 3 + 5;
+    var src: [pixels * 4]u8 = undefined;
+    var dst: [pixels * 4]u8 = undefined;
+    for (&src, 0..) |*byte, i| byte.* = @truncate(i *% 151 +% 7);
+
+    grayscalePacked(4, true, &src, &dst);
+
+    for (0..pixels) |p| {
+        const i = p * 4;
+        const gray = luma(src[i + 2], src[i + 1], src[i]);
+        try std.testing.expectEqualSlices(u8, &.{ gray, gray, gray, src[i + 3] }, dst[i..][0..4]);
+    }
+
+    grayscalePacked(3, false, src[0 .. pixels * 3], dst[0 .. pixels * 3]);
+
+    for (0..pixels) |p| {
+        const i = p * 3;
+        const gray = luma(src[i], src[i + 1], src[i + 2]);
+        try std.testing.expectEqualSlices(u8, &.{ gray, gray, gray }, dst[i..][0..3]);
+    }
+}
+
+test "luma fixed point" {
+    try std.testing.expectEqual(@as(u8, 0), luma(0, 0, 0));
+    try std.testing.expectEqual(@as(u8, 255), luma(255, 255, 255));
+    try std.testing.expectEqual(@as(u8, 77), luma(255, 0, 0));
+}
@@ -52,6 +52,83 @@ pub const Kernel = struct {
     }
 };
 
+// ============================================================================
+// Integer Kernel
+// ============================================================================
+
+/// Fixed-point form of a Kernel for 8-bit pixels
+///
+/// All predefined kernels have integer taps, divisor and bias, so the
+/// convolution can accumulate u8 * i32 products in i32 and finish with one
+/// rounded division (a shift for power-of-two divisors). That keeps the taps
+/// and accumulator in integer registers and gives the same result as the
+/// f32 path, which rounds sum / divisor + bias to nearest.
+pub const IntKernel = struct {
+    taps: [max_taps]i32,
+    width: usize,
+    height: usize,
+    divisor: i32,
+    bias: i32,
+    /// log2(divisor) when the divisor is a positive power of two
+    shift: ?u5,
+
+    pub const max_taps = 49; // up to 7x7
+
+    /// Convert a kernel, or return null if it has fractional values or
+    /// too many taps
+    pub fn fromKernel(kernel: *const Kernel) ?IntKernel {
+        if (kernel.data.len > max_taps) return null;
+
+        var result = IntKernel{
+            .taps = undefined,
+            .width = kernel.width,
+            .height = kernel.height,
+            .divisor = toInt(kernel.divisor) orelse return null,
+            .bias = toInt(kernel.bias) orelse return null,
+            .shift = null,
+        };
+        // Every partial sum of u8 * tap products must fit the i32 accumulator
+        var abs_sum: u64 = 0;
+        for (kernel.data, 0..) |v, i| {
+            result.taps[i] = toInt(v) orelse return null;
+            abs_sum += @abs(result.taps[i]);
+        }
+        if (abs_sum * 255 > std.math.maxInt(i32)) return null;
+        if (result.divisor == 0) return null;
+        if (result.divisor > 0 and std.math.isPowerOfTwo(result.divisor)) {
+            result.shift = @intCast(std.math.log2_int(u32, @intCast(result.divisor)));
+        }
+        return result;
+    }
+
+    pub fn get(self: *const IntKernel, x: usize, y: usize) i32 {
+        return self.taps[y * self.width + x];
+    }
+
+    /// Scale an accumulated sum back to a pixel
+    /// Computes round(sum / divisor + bias) with rounding half away from zero,
+    /// in the same order as the f32 path: the bias is folded into the
+    /// numerator as bias * divisor before the single rounded division.
+    pub fn finish(self: *const IntKernel, sum: i32) u8 {
+        const n = @as(i64, sum) + @as(i64, self.bias) * self.divisor;
+        const magnitude: i64 = @intCast(@abs(n));
+        const negative = (n < 0) != (self.divisor < 0);
+        const d: i64 = @abs(self.divisor);
+
+        const q = if (self.shift) |s|
+            (magnitude + (d >> 1)) >> s
+        else
+            @divTrunc(magnitude + (d >> 1), d);
+
+        return @intCast(std.math.clamp(if (negative) -q else q, 0, 255));
+    }
+
+    fn toInt(v: f32) ?i32 {
+        if (v != @round(v) or @abs(v) > 1 << 20) return null;
+        return @intFromFloat(v);
+    }
+};
+
 // ============================================================================
 // Predefined Kernels
 // ============================================================================
@@ -175,64 +252,24 @@ pub const ConvolutionFilter = struct {
 
         const bytes_per_pixel = getBytesPerPixel(input.format);
 
-        if (input.data[0]) |src| {
-            if (output.data[0]) |dst| {
-                const src_stride = input.linesize[0];
-                const dst_stride = output.linesize[0];
-
-                const kw = self.kernel.width;
-                const kh = self.kernel.height;
-                const kw_half = kw / 2;
-                const kh_half = kh / 2;
-
-                for (0..input.height) |y| {
-                    for (0..input.width) |x| {
-                        for (0..bytes_per_pixel) |ch| {
-                            // Skip alpha channel
-                            if (bytes_per_pixel == 4 and ch == 3) {
-                                const offset = y * dst_stride + x * bytes_per_pixel + ch;
-                                const src_offset = y * src_stride + x * bytes_per_pixel + ch;
-                                if (offset < dst.len and src_offset < src.len) {
-                                    dst[offset] = src[src_offset];
-                                }
-                                continue;
-                            }
-
-                            var sum: f32 = 0;
-
-                            for (0..kh) |ky| {
-                                for (0..kw) |kx| {
-                                    const sy = @as(i64, @intCast(y)) + @as(i64, @intCast(ky)) - @as(i64, @intCast(kh_half));
-                                    const sx = @as(i64, @intCast(x)) + @as(i64, @intCast(kx)) - @as(i64, @intCast(kw_half));
+        // Integer kernels (all predefined ones) accumulate in i32
+        const int_kernel = IntKernel.fromKernel(&self.kernel);
 
-                                    // Clamp to image bounds
-                                    const csy: usize = @intCast(@max(0, @min(@as(i64, @intCast(input.height)) - 1, sy)));
-                                    const csx: usize = @intCast(@max(0, @min(@as(i64, @intCast(input.width)) - 1, sx)));
-
-                                    const src_offset = csy * src_stride + csx * bytes_per_pixel + ch;
-                                    if (src_offset < src.len) {
-                                        const pixel: f32 = @floatFromInt(src[src_offset]);
-                                        sum += pixel * self.kernel.get(kx, ky);
-                                    }
-                                }
-                            }
+        if (input.getPlane(0)) |src| {
+            if (output.getPlane(0)) |dst| {
+                const src_plane = ConvPlane{ .data = src, .stride = input.strides[0], .width = input.width, .height = input.height };
+                const dst_plane = ConvPlane{ .data = dst, .stride = output.strides[0], .width = output.width, .height = output.height };
 
-                            const result = sum / self.kernel.divisor + self.kernel.bias;
-                            const dst_offset = y * dst_stride + x * bytes_per_pixel + ch;
-                            if (dst_offset < dst.len) {
-                                dst[dst_offset] = @intFromFloat(@round(@max(0, @min(255, result))));
-                            }
-                        }
-                    }
-                }
+                const done = if (int_kernel) |*ik| runSpecialized(ik, bytes_per_pixel, src_plane, dst_plane) else false;
+                if (!done) self.convolvePlane(int_kernel, src_plane, dst_plane, bytes_per_pixel);
             }
         }
 
         // Copy chroma planes unchanged for YUV formats
         if (isYuvPlanar(input.format)) {
             for (1..3) |plane_idx| {
-                if (input.data[plane_idx]) |src_plane| {
-                    if (output.data[plane_idx]) |dst_plane| {
+                if (input.getPlane(@intCast(plane_idx))) |src_plane| {
+                    if (output.getPlane(@intCast(plane_idx))) |dst_plane| {
                         const len = @min(src_plane.len, dst_plane.len);
                         @memcpy(dst_plane[0..len], src_plane[0..len]);
                     }
@@ -241,12 +278,147 @@ pub const ConvolutionFilter = struct {
         }
 
         output.pts = input.pts;
-        output.dts = input.dts;
         output.duration = input.duration;
         return output;
     }
+
+    /// Convolve one plane for any pixel size, checking bounds per byte
+    /// Fallback for float kernels and layouts the specialized kernels reject.
+    fn convolvePlane(self: *const Self, int_kernel: ?IntKernel, src: ConvPlane, dst: ConvPlane, bytes_per_pixel: usize) void {
+        const kw = self.kernel.width;
+        const kh = self.kernel.height;
+        const kw_half = kw / 2;
+        const kh_half = kh / 2;
+
+        for (0..src.height) |y| {
+            for (0..src.width) |x| {
+                for (0..bytes_per_pixel) |ch| {
+                    // Skip alpha channel
+                    if (bytes_per_pixel == 4 and ch == 3) {
+                        const offset = y * dst.stride + x * bytes_per_pixel + ch;
+                        const src_offset = y * src.stride + x * bytes_per_pixel + ch;
+                        if (offset < dst.data.len and src_offset < src.data.len) {
+                            dst.data[offset] = src.data[src_offset];
+                        }
+                        continue;
+                    }
+
+                    var int_sum: i32 = 0;
+                    var sum: f32 = 0;
+
+                    for (0..kh) |ky| {
+                        for (0..kw) |kx| {
+                            // Clamp to image bounds
+                            const csy = clampIndex(y + ky, kh_half, src.height - 1);
+                            const csx = clampIndex(x + kx, kw_half, src.width - 1);
+
+                            const src_offset = csy * src.stride + csx * bytes_per_pixel + ch;
+                            if (src_offset < src.data.len) {
+                                if (int_kernel) |*ik| {
+                                    int_sum += @as(i32, src.data[src_offset]) * ik.get(kx, ky);
+                                } else {
+                                    const pixel: f32 = @floatFromInt(src.data[src_offset]);
+                                    sum += pixel * self.kernel.get(kx, ky);
+                                }
+                            }
+                        }
+                    }
+
+                    const dst_offset = y * dst.stride + x * bytes_per_pixel + ch;
+                    if (dst_offset < dst.data.len) {
+                        if (int_kernel) |*ik| {
+                            dst.data[dst_offset] = ik.finish(int_sum);
+                        } else {
+                            const result = sum / self.kernel.divisor + self.kernel.bias;
+                            dst.data[dst_offset] = @intFromFloat(@round(@max(0, @min(255, result))));
+                        }
+                    }
+                }
+            }
+        }
+    }
+};
+
+// ============================================================================
+// Specialized Convolution Kernels
+// ============================================================================
+
+/// One 8-bit plane as seen by the convolution kernels
+const ConvPlane = struct {
+    data: []u8,
+    stride: usize,
+    width: usize,
+    height: usize,
+
+    /// Whether every row of `width` pixels lies inside `data`
+    fn fits(self: ConvPlane, bytes_per_pixel: usize) bool {
+        if (self.width == 0 or self.height == 0) return false;
+        const row_bytes = self.width * bytes_per_pixel;
+        return row_bytes <= self.stride and (self.height - 1) * self.stride + row_bytes <= self.data.len;
+    }
 };
 
+const IntPlaneKernel = *const fn (ik: *const IntKernel, src: ConvPlane, dst: ConvPlane) void;
+
+/// Integer convolution with the pixel size known at compile time
+/// The channel loop unrolls, the alpha passthrough for 4-byte pixels is
+/// resolved at compile time, and rows are pre-checked by `fits` so the inner
+/// loops carry no per-byte bounds tests. Results match convolvePlane exactly.
+fn IntConvolution(comptime bytes_per_pixel: usize) type {
+    return struct {
+        fn run(ik: *const IntKernel, src: ConvPlane, dst: ConvPlane) void {
+            const kw_half = ik.width / 2;
+            const kh_half = ik.height / 2;
+
+            for (0..dst.height) |y| {
+                const src_row = src.data[y * src.stride ..];
+                const dst_row = dst.data[y * dst.stride ..];
+                for (0..dst.width) |x| {
+                    inline for (0..bytes_per_pixel) |ch| {
+                        if (bytes_per_pixel == 4 and ch == 3) {
+                            dst_row[x * 4 + 3] = src_row[x * 4 + 3];
+                        } else {
+                            var sum: i32 = 0;
+                            for (0..ik.height) |ky| {
+                                const sy = clampIndex(y + ky, kh_half, src.height - 1);
+                                const tap_row = src.data[sy * src.stride ..];
+                                for (0..ik.width) |kx| {
+                                    const sx = clampIndex(x + kx, kw_half, src.width - 1);
+                                    sum += @as(i32, tap_row[sx * bytes_per_pixel + ch]) * ik.get(kx, ky);
+                                }
+                            }
+                            dst_row[x * bytes_per_pixel + ch] = ik.finish(sum);
+                        }
+                    }
+                }
+            }
+        }
+    };
+}
+
+const int_kernels = [_]IntPlaneKernel{
+    &IntConvolution(1).run,
+    &IntConvolution(2).run,
+    &IntConvolution(3).run,
+    &IntConvolution(4).run,
+};
+
+/// Run the specialized integer kernel for this pixel size, if any
+/// Returns false (leaving `dst` untouched) when there is no kernel for the
+/// pixel size or the planes don't have the expected layout.
+fn runSpecialized(ik: *const IntKernel, bytes_per_pixel: usize, src: ConvPlane, dst: ConvPlane) bool {
+    if (bytes_per_pixel == 0 or bytes_per_pixel > int_kernels.len) return false;
+    if (src.width != dst.width or src.height != dst.height) return false;
+    if (!src.fits(bytes_per_pixel) or !dst.fits(bytes_per_pixel)) return false;
+    int_kernels[bytes_per_pixel - 1](ik, src, dst);
+    return true;
+}
+
+/// Clamp the tap position `pos - half` to 0..max without leaving usize
+inline fn clampIndex(pos: usize, half: usize, max: usize) usize {
+    return @min(pos -| half, max);
+}
+
 // ============================================================================
 // Blur Filter
 // ============================================================================
@@ -264,21 +436,35 @@ pub const BlurFilter = struct {
         };
     }
 
-    /// Apply box blur
-    pub fn apply(self: *const Self, input: *const VideoFrame) !VideoFrame {
-        const kernel = switch (self.radius) {
+    /// Create a blur approximating a Gaussian of the given sigma
+    /// The sigma is rounded up to a whole box radius in 1..10; every path that
+    /// takes a sigma (single filter, pipeline, fused pipeline) goes through here.
+    pub fn initSigma(allocator: std.mem.Allocator, sigma: f32) Self {
+        return init(allocator, @intFromFloat(@ceil(std.math.clamp(sigma, 1, 10))));
+    }
+
+    /// Box kernel used for this radius
+    pub fn boxKernel(self: *const Self) Kernel {
+        return switch (self.radius) {
             1, 2 => Kernels.box_blur_3x3,
             else => Kernels.box_blur_5x5,
         };
+    }
 
-        var filter = ConvolutionFilter.init(self.allocator, kernel);
+    /// Number of box kernel passes used for this radius
+    pub fn passes(self: *const Self) usize {
+        return 1 + (self.radius - 1) / 2;
+    }
+
+    /// Apply box blur
+    pub fn apply(self: *const Self, input: *const VideoFrame) !VideoFrame {
+        const filter = ConvolutionFilter.init(self.allocator, self.boxKernel());
 
         // Apply multiple times for larger radius
         var result = try filter.apply(input);
         errdefer result.deinit();
 
-        const iterations = (self.radius - 1) / 2;
-        for (0..iterations) |_| {
+        for (1..self.passes()) |_| {
             const next = try filter.apply(&result);
             result.deinit();
             result = next;
@@ -294,7 +480,7 @@ pub const BlurFilter = struct {
             else => Kernels.gaussian_blur_5x5,
         };
 
-        var filter = ConvolutionFilter.init(self.allocator, kernel);
+        const filter = ConvolutionFilter.init(self.allocator, kernel);
         return try filter.apply(input);
     }
 };
@@ -318,7 +504,7 @@ pub const SharpenFilter = struct {
 
     pub fn apply(self: *const Self, input: *const VideoFrame) !VideoFrame {
         const kernel = if (self.strength > 1.0) Kernels.sharpen_strong else Kernels.sharpen;
-        var filter = ConvolutionFilter.init(self.allocator, kernel);
+        const filter = ConvolutionFilter.init(self.allocator, kernel);
         return try filter.apply(input);
     }
 };
@@ -349,8 +535,8 @@ pub const EdgeDetectionFilter = struct {
         switch (self.mode) {
             .sobel => {
                 // Apply Sobel X and Y, combine results
-                var filter_x = ConvolutionFilter.init(self.allocator, Kernels.sobel_x);
-                var filter_y = ConvolutionFilter.init(self.allocator, Kernels.sobel_y);
+                const filter_x = ConvolutionFilter.init(self.allocator, Kernels.sobel_x);
+                const filter_y = ConvolutionFilter.init(self.allocator, Kernels.sobel_y);
 
                 var result_x = try filter_x.apply(input);
                 defer result_x.deinit();
@@ -361,7 +547,7 @@ pub const EdgeDetectionFilter = struct {
                 return try self.combineSobel(&result_x, &result_y);
             },
             .laplacian => {
-                var filter = ConvolutionFilter.init(self.allocator, Kernels.laplacian);
+                const filter = ConvolutionFilter.init(self.allocator, Kernels.laplacian);
                 return try filter.apply(input);
             },
         }
@@ -376,9 +562,9 @@ pub const EdgeDetectionFilter = struct {
         );
         errdefer output.deinit();
 
-        if (frame_x.data[0]) |src_x| {
-            if (frame_y.data[0]) |src_y| {
-                if (output.data[0]) |dst| {
+        if (frame_x.getPlane(0)) |src_x| {
+            if (frame_y.getPlane(0)) |src_y| {
+                if (output.getPlane(0)) |dst| {
                     for (0..@min(src_x.len, @min(src_y.len, dst.len))) |i| {
                         const vx = @as(f32, @floatFromInt(src_x[i])) - 128;
                         const vy = @as(f32, @floatFromInt(src_y[i])) - 128;
@@ -390,7 +576,6 @@ pub const EdgeDetectionFilter = struct {
         }
 
         output.pts = frame_x.pts;
-        output.dts = frame_x.dts;
         output.duration = frame_x.duration;
         return output;
     }
@@ -434,6 +619,35 @@ test "Kernel get" {
     try std.testing.expectApproxEqAbs(@as(f32, 1), kernel.get(0, 0), 0.001);
 }
 
+test "IntKernel matches float rounding" {
+    const kernels = [_]Kernel{
+        Kernels.box_blur_3x3,
+        Kernels.gaussian_blur_5x5,
+        Kernels.sobel_x,
+        Kernels.unsharp_mask,
+        // Even divisor with a bias: halves must round after adding the bias
+        Kernel.initWithDivisor(&[_]f32{ 1, -1 }, 2, 1, 2, 100),
+        Kernel.initWithDivisor(&[_]f32{ 3, 1 }, 2, 1, -4, -7),
+    };
+
+    for (kernels) |kernel| {
+        const ik = IntKernel.fromKernel(&kernel).?;
+        var sum: i32 = -255 * 600;
+        while (sum <= 255 * 600) : (sum += 37) {
+            const f: f32 = @as(f32, @floatFromInt(sum)) / kernel.divisor + kernel.bias;
+            const expected: u8 = @intFromFloat(@round(@max(0, @min(255, f))));
+            try std.testing.expectEqual(expected, ik.finish(sum));
+        }
+    }
+
+    const fractional = Kernel.initWithDivisor(&[_]f32{ 0.5, 0.5 }, 2, 1, 1, 0);
+    try std.testing.expect(IntKernel.fromKernel(&fractional) == null);
+
+    // 9 * 2^20 * 255 would overflow the i32 accumulator
+    const huge = Kernel.initWithDivisor(&([_]f32{1 << 20} ** 9), 3, 3, 1, 0);
+    try std.testing.expect(IntKernel.fromKernel(&huge) == null);
+}
+
 test "BlurFilter initialization" {
     const allocator = std.testing.allocator;
     const filter = BlurFilter.init(allocator, 3);
@@ -444,6 +658,13 @@ test "BlurFilter initialization" {
     try std.testing.expectEqual(@as(u8, 10), filter_high.radius);
 }
 
+test "BlurFilter from sigma" {
+    const allocator = std.testing.allocator;
+    try std.testing.expectEqual(@as(u8, 1), BlurFilter.initSigma(allocator, 0.2).radius);
+    try std.testing.expectEqual(@as(u8, 3), BlurFilter.initSigma(allocator, 2.5).radius);
+    try std.testing.expectEqual(@as(u8, 10), BlurFilter.initSigma(allocator, 40).radius);
+}
+
 test "SharpenFilter initialization" {
     const allocator = std.testing.allocator;
     const filter = SharpenFilter.init(allocator, 0.5);
@@ -468,3 +689,43 @@ test "Predefined kernels" {
     try std.testing.expectEqual(@as(usize, 5), Kernels.gaussian_blur_5x5.width);
     try std.testing.expectApproxEqAbs(@as(f32, 256), Kernels.gaussian_blur_5x5.divisor, 0.001);
 }
+
+test "specialized convolution kernels match the generic path" {
+    const kernels = [_]Kernel{
+        Kernels.box_blur_3x3,
+        Kernels.box_blur_5x5,
+        Kernels.gaussian_blur_5x5,
+        Kernels.sobel_x,
+        Kernels.unsharp_mask,
+    };
+    const width = 13;
+    const height = 7;
+
+    inline for (1..5) |bpp| {
+        const stride = width * bpp + 5;
+        var src_data: [stride * height]u8 = undefined;
+        for (&src_data, 0..) |*byte, i| byte.* = @truncate(i *% 97 +% (i >> 2));
+
+        for (kernels) |kernel| {
+            const filter = ConvolutionFilter.init(std.testing.allocator, kernel);
+            const ik = IntKernel.fromKernel(&kernel).?;
+
+            var expected_data = [_]u8{0} ** (stride * height);
+            var actual_data = [_]u8{0} ** (stride * height);
+            const src = ConvPlane{ .data = &src_data, .stride = stride, .width = width, .height = height };
+            const expected = ConvPlane{ .data = &expected_data, .stride = stride, .width = width, .height = height };
+            const actual = ConvPlane{ .data = &actual_data, .stride = stride, .width = width, .height = height };
+
+            filter.convolvePlane(ik, src, expected, bpp);
+            try std.testing.expect(runSpecialized(&ik, bpp, src, actual));
+            try std.testing.expectEqualSlices(u8, &expected_data, &actual_data);
+        }
+    }
+
+    // Planes too short for their rows fall back to the generic path
+    var data = [_]u8{0} ** 16;
+    const short = ConvPlane{ .data = &data, .stride = 8, .width = 8, .height = 3 };
+    const ik = IntKernel.fromKernel(&Kernels.box_blur_3x3).?;
+    try std.testing.expect(!runSpecialized(&ik, 1, short, short));
+    try std.testing.expect(!runSpecialized(&ik, 5, short, short));
+}
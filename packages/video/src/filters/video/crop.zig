@@ -69,11 +69,11 @@ pub const CropFilter = struct {
         errdefer output.deinit();
 
         // Copy Y plane (or RGB)
-        if (input.data[0]) |src_plane| {
-            if (output.data[0]) |dst_plane| {
+        if (input.getPlane(0)) |src_plane| {
+            if (output.getPlane(0)) |dst_plane| {
                 const bytes_per_pixel = getBytesPerPixel(input.format);
-                const src_stride = input.linesize[0];
-                const dst_stride = output.linesize[0];
+                const src_stride: usize = input.strides[0];
+                const dst_stride: usize = output.strides[0];
 
                 for (0..self.height) |dst_y| {
                     const src_y = self.y + @as(u32, @intCast(dst_y));
@@ -101,10 +101,10 @@ pub const CropFilter = struct {
             const chroma_height = getChromaDimY(input.format, self.height);
 
             for (1..3) |plane_idx| {
-                if (input.data[plane_idx]) |src_plane| {
-                    if (output.data[plane_idx]) |dst_plane| {
-                        const src_stride = input.linesize[plane_idx];
-                        const dst_stride = output.linesize[plane_idx];
+                if (input.getPlane(@intCast(plane_idx))) |src_plane| {
+                    if (output.getPlane(@intCast(plane_idx))) |dst_plane| {
+                        const src_stride: usize = input.strides[plane_idx];
+                        const dst_stride: usize = output.strides[plane_idx];
 
                         for (0..chroma_height) |dst_y| {
                             const src_y_idx = chroma_y + dst_y;
@@ -126,7 +126,6 @@ pub const CropFilter = struct {
         }
 
         output.pts = input.pts;
-        output.dts = input.dts;
         output.duration = input.duration;
         return output;
     }
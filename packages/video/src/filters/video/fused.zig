@@ -0,0 +1,471 @@
+// Home Video Library - Fused Filter
+// Scale, crop, grayscale and blur in a single strip-tiled pass
+
+const std = @import("std");
+const types = @import("../../core/types.zig");
+const frame = @import("../../core/frame.zig");
+const err = @import("../../core/error.zig");
+const scale = @import("scale.zig");
+const color = @import("color.zig");
+const convolution = @import("convolution.zig");
+
+const VideoError = err.VideoError;
+const VideoFrame = frame.VideoFrame;
+const PixelFormat = types.PixelFormat;
+const ScaleAlgorithm = scale.ScaleAlgorithm;
+const Kernel = convolution.Kernel;
+const IntKernel = convolution.IntKernel;
+
+// ============================================================================
+// Fused Filter
+// ============================================================================
+
+/// Runs scale -> crop -> grayscale -> blur as one pass over the output.
+///
+/// Chaining the individual filters writes a full intermediate frame per
+/// stage. This filter instead samples the scaled/cropped/grayscale pixels
+/// on the fly, one strip of rows at a time, and blurs each strip from a
+/// small buffer that keeps the rows the kernel needs above and below it.
+/// Only the final frame is written to memory. Output is identical to
+/// applying the stages one after another.
+pub const FusedFilter = struct {
+    /// Optional scale stage (nearest or bilinear)
+    scale: ?ScaleStage = null,
+    /// Optional crop stage, in scaled coordinates
+    crop: ?CropStage = null,
+    /// Convert to grayscale
+    grayscale: bool = false,
+    /// Optional blur stage
+    blur: ?BlurStage = null,
+    /// Output rows produced per strip; the strip plus blur halo should fit in L2
+    strip_rows: usize = 64,
+    allocator: std.mem.Allocator,
+
+    const Self = @This();
+
+    pub const ScaleStage = struct {
+        width: u32,
+        height: u32,
+        algorithm: ScaleAlgorithm,
+    };
+
+    pub const CropStage = struct {
+        x: u32,
+        y: u32,
+        width: u32,
+        height: u32,
+    };
+
+    pub const BlurStage = struct {
+        kernel: Kernel,
+        passes: usize,
+
+        pub fn fromBlurFilter(filter: *const convolution.BlurFilter) BlurStage {
+            return .{ .kernel = filter.boxKernel(), .passes = filter.passes() };
+        }
+    };
+
+    pub fn init(allocator: std.mem.Allocator) Self {
+        return .{ .allocator = allocator };
+    }
+
+    /// Check whether frames of this format can go through the fused path
+    pub fn supports(self: *const Self, format: PixelFormat) bool {
+        switch (format) {
+            .rgb24, .bgr24, .rgba32, .bgra32 => {},
+            else => return false,
+        }
+        if (self.scale) |s| {
+            if (s.algorithm != .nearest and s.algorithm != .bilinear) return false;
+        }
+        return true;
+    }
+
+    /// Apply all configured stages to a video frame
+    pub fn apply(self: *const Self, input: *const VideoFrame) !VideoFrame {
+        if (!self.supports(input.format)) {
+            return VideoError.UnsupportedPixelFormat;
+        }
+        if (input.width == 0 or input.height == 0) {
+            return VideoError.InvalidDimensions;
+        }
+
+        const scaled_width = if (self.scale) |s| s.width else input.width;
+        const scaled_height = if (self.scale) |s| s.height else input.height;
+
+        const region = self.crop orelse CropStage{
+            .x = 0,
+            .y = 0,
+            .width = scaled_width,
+            .height = scaled_height,
+        };
+        if (region.x > scaled_width or region.width > scaled_width - region.x or
+            region.y > scaled_height or region.height > scaled_height - region.y)
+        {
+            return VideoError.InvalidDimensions;
+        }
+
+        var output = try VideoFrame.init(self.allocator, region.width, region.height, input.format);
+        errdefer output.deinit();
+
+        output.pts = input.pts;
+        output.duration = input.duration;
+
+        if (region.width == 0 or region.height == 0) return output;
+
+        const src = input.getPlane(0) orelse return VideoError.InvalidDimensions;
+        const dst = output.getPlane(0) orelse return VideoError.InvalidDimensions;
+
+        var sampler = try Sampler.init(self, input, src, region, scaled_width, scaled_height);
+        defer sampler.deinit(self.allocator);
+
+        if (self.blur) |blur| {
+            try self.runBlurred(&sampler, blur, dst, output.strides[0], region.height);
+        } else {
+            const dst_stride: usize = output.strides[0];
+            for (0..region.height) |y| {
+                sampler.fillRow(y, dst[y * dst_stride ..][0..sampler.row_bytes]);
+            }
+        }
+
+        return output;
+    }
+
+    /// Produce the output strip by strip, running every blur pass on a strip
+    /// buffer before moving on
+    fn runBlurred(
+        self: *const Self,
+        sampler: *const Sampler,
+        blur: BlurStage,
+        dst: []u8,
+        dst_stride: usize,
+        height: usize,
+    ) !void {
+        const int_kernel = IntKernel.fromKernel(&blur.kernel);
+        const half = blur.kernel.height / 2;
+        const halo = half * blur.passes;
+        const strip_rows = @max(1, self.strip_rows);
+        const buf_rows = @min(height, strip_rows + 2 * halo);
+
+        const buf_a = try self.allocator.alloc(u8, buf_rows * sampler.row_bytes);
+        defer self.allocator.free(buf_a);
+        const buf_b = try self.allocator.alloc(u8, buf_rows * sampler.row_bytes);
+        defer self.allocator.free(buf_b);
+
+        var y0: usize = 0;
+        while (y0 < height) : (y0 += strip_rows) {
+            const y1 = @min(y0 + strip_rows, height);
+
+            // Rows of the unblurred image this strip depends on
+            var prev_lo = y0 -| halo;
+            const prev_hi = @min(height, y1 + halo);
+            var prev = buf_a;
+            var next = buf_b;
+            for (prev_lo..prev_hi) |y| {
+                sampler.fillRow(y, prev[(y - prev_lo) * sampler.row_bytes ..][0..sampler.row_bytes]);
+            }
+
+            // Each pass shrinks the halo by one kernel radius
+            for (1..blur.passes + 1) |pass| {
+                const remaining = half * (blur.passes - pass);
+                const lo = y0 -| remaining;
+                const hi = @min(height, y1 + remaining);
+                const last = pass == blur.passes;
+
+                for (lo..hi) |y| {
+                    const out_row = if (last)
+                        dst[y * dst_stride ..][0..sampler.row_bytes]
+                    else
+                        next[(y - lo) * sampler.row_bytes ..][0..sampler.row_bytes];
+                    convolveRow(&blur.kernel, if (int_kernel) |*ik| ik else null, prev, prev_lo, y, height, sampler.width, sampler.bytes_per_pixel, out_row);
+                }
+
+                prev_lo = lo;
+                std.mem.swap([]u8, &prev, &next);
+            }
+        }
+    }
+};
+
+// ============================================================================
+// Helpers
+// ============================================================================
+
+/// Samples rows of the scaled, cropped and optionally grayscale image
+/// straight from the source frame
+const Sampler = struct {
+    src: []const u8,
+    src_stride: usize,
+    bytes_per_pixel: usize,
+    is_bgr: bool,
+    grayscale: bool,
+    algorithm: ScaleAlgorithm,
+    width: usize,
+    row_bytes: usize,
+
+    // Vertical mapping (output row -> source rows)
+    crop_y: usize,
+    src_height: usize,
+    scaled_height: usize,
+    scale_y: f32,
+
+    // Horizontal mapping, precomputed per output column
+    x0: []usize,
+    x1: []usize,
+    fx: []f32,
+
+    fn init(
+        filter: *const FusedFilter,
+        input: *const VideoFrame,
+        src: []const u8,
+        region: FusedFilter.CropStage,
+        scaled_width: u32,
+        scaled_height: u32,
+    ) !Sampler {
+        const bytes_per_pixel: usize = switch (input.format) {
+            .rgba32, .bgra32 => 4,
+            else => 3,
+        };
+        const identity = scaled_width == input.width and scaled_height == input.height;
+        const algorithm: ScaleAlgorithm = if (identity) .nearest else filter.scale.?.algorithm;
+
+        const x0 = try filter.allocator.alloc(usize, region.width);
+        errdefer filter.allocator.free(x0);
+        const x1 = try filter.allocator.alloc(usize, region.width);
+        errdefer filter.allocator.free(x1);
+        const fx = try filter.allocator.alloc(f32, region.width);
+        errdefer filter.allocator.free(fx);
+
+        const scale_x = @as(f32, @floatFromInt(input.width)) / @as(f32, @floatFromInt(scaled_width));
+        const max_src_x = input.width - 1;
+
+        for (0..region.width) |i| {
+            const dst_x = region.x + i;
+            if (identity) {
+                x0[i] = dst_x;
+                x1[i] = dst_x;
+                fx[i] = 0;
+            } else if (algorithm == .nearest) {
+                x0[i] = @min((dst_x * input.width) / scaled_width, max_src_x);
+                x1[i] = x0[i];
+                fx[i] = 0;
+            } else {
+                const src_xf = @as(f32, @floatFromInt(dst_x)) * scale_x;
+                x0[i] = @min(@as(usize, @intFromFloat(@floor(src_xf))), max_src_x);
+                x1[i] = @min(x0[i] + 1, max_src_x);
+                fx[i] = src_xf - @floor(src_xf);
+            }
+        }
+
+        return .{
+            .src = src,
+            .src_stride = input.strides[0],
+            .bytes_per_pixel = bytes_per_pixel,
+            .is_bgr = input.format == .bgr24 or input.format == .bgra32,
+            .grayscale = filter.grayscale,
+            .algorithm = algorithm,
+            .width = region.width,
+            .row_bytes = region.width * bytes_per_pixel,
+            .crop_y = region.y,
+            .src_height = input.height,
+            .scaled_height = scaled_height,
+            .scale_y = @as(f32, @floatFromInt(input.height)) / @as(f32, @floatFromInt(scaled_height)),
+            .x0 = x0,
+            .x1 = x1,
+            .fx = fx,
+        };
+    }
+
+    fn deinit(self: *Sampler, allocator: std.mem.Allocator) void {
+        allocator.free(self.x0);
+        allocator.free(self.x1);
+        allocator.free(self.fx);
+    }
+
+    /// Write output row `y` (before blur) into `out`
+    fn fillRow(self: *const Sampler, y: usize, out: []u8) void {
+        const bpp = self.bytes_per_pixel;
+        const dst_y = self.crop_y + y;
+        const max_src_y = self.src_height - 1;
+
+        if (self.algorithm == .nearest) {
+            const src_y = if (self.scaled_height == self.src_height)
+                dst_y
+            else
+                @min((dst_y * self.src_height) / self.scaled_height, max_src_y);
+            const row = self.src[src_y * self.src_stride ..];
+
+            for (0..self.width) |i| {
+                const s = self.x0[i] * bpp;
+                @memcpy(out[i * bpp ..][0..bpp], row[s..][0..bpp]);
+            }
+        } else {
+            const src_yf = @as(f32, @floatFromInt(dst_y)) * self.scale_y;
+            const src_y0: usize = @min(@as(usize, @intFromFloat(@floor(src_yf))), max_src_y);
+            const src_y1: usize = @min(src_y0 + 1, max_src_y);
+            const y_frac = src_yf - @floor(src_yf);
+            const row0 = self.src[src_y0 * self.src_stride ..];
+            const row1 = self.src[src_y1 * self.src_stride ..];
+
+            for (0..self.width) |i| {
+                const s0 = self.x0[i] * bpp;
+                const s1 = self.x1[i] * bpp;
+                for (0..bpp) |ch| {
+                    const p00: f32 = @floatFromInt(row0[s0 + ch]);
+                    const p10: f32 = @floatFromInt(row0[s1 + ch]);
+                    const p01: f32 = @floatFromInt(row1[s0 + ch]);
+                    const p11: f32 = @floatFromInt(row1[s1 + ch]);
+
+                    out[i * bpp + ch] = scale.bilinearSample(p00, p10, p01, p11, self.fx[i], y_frac);
+                }
+            }
+        }
+
+        if (self.grayscale) {
+            var i: usize = 0;
+            while (i < self.row_bytes) : (i += bpp) {
+                const gray = color.luma(
+                    out[i + if (self.is_bgr) 2 else 0],
+                    out[i + 1],
+                    out[i + if (self.is_bgr) 0 else 2],
+                );
+                out[i] = gray;
+                out[i + 1] = gray;
+                out[i + 2] = gray;
+            }
+        }
+    }
+};
+
+/// Convolve image row `y` from a strip buffer whose first row is image row
+/// `buf_lo`, clamping to the image edges like ConvolutionFilter does
+fn convolveRow(
+    kernel: *const Kernel,
+    int_kernel: ?*const IntKernel,
+    buf: []const u8,
+    buf_lo: usize,
+    y: usize,
+    height: usize,
+    width: usize,
+    bytes_per_pixel: usize,
+    out: []u8,
+) void {
+    const row_bytes = width * bytes_per_pixel;
+    const kw_half = kernel.width / 2;
+    const kh_half = kernel.height / 2;
+
+    for (0..width) |x| {
+        for (0..bytes_per_pixel) |ch| {
+            const offset = x * bytes_per_pixel + ch;
+
+            // Skip alpha channel
+            if (bytes_per_pixel == 4 and ch == 3) {
+                out[offset] = buf[(y - buf_lo) * row_bytes + offset];
+                continue;
+            }
+
+            var int_sum: i32 = 0;
+            var sum: f32 = 0;
+            for (0..kernel.height) |ky| {
+                const sy = std.math.clamp(@as(i64, @intCast(y + ky)) - @as(i64, @intCast(kh_half)), 0, @as(i64, @intCast(height - 1)));
+                const row = buf[(@as(usize, @intCast(sy)) - buf_lo) * row_bytes ..];
+
+                for (0..kernel.width) |kx| {
+                    const sx = std.math.clamp(@as(i64, @intCast(x + kx)) - @as(i64, @intCast(kw_half)), 0, @as(i64, @intCast(width - 1)));
+                    const pixel = row[@as(usize, @intCast(sx)) * bytes_per_pixel + ch];
+                    if (int_kernel) |ik| {
+                        int_sum += @as(i32, pixel) * ik.get(kx, ky);
+                    } else {
+                        sum += @as(f32, @floatFromInt(pixel)) * kernel.get(kx, ky);
+                    }
+                }
+            }
+
+            if (int_kernel) |ik| {
+                out[offset] = ik.finish(int_sum);
+            } else {
+                const result = sum / kernel.divisor + kernel.bias;
+                out[offset] = @intFromFloat(@round(@max(0, @min(255, result))));
+            }
+        }
+    }
+}
+
+// ============================================================================
+// Tests
+// ============================================================================
+
+fn fillTestPattern(f: *VideoFrame) void {
+    for (f.data, 0..) |*byte, i| {
+        byte.* = @truncate(i *% 37 +% (i / 7));
+    }
+}
+
+fn expectSamePixels(a: *const VideoFrame, b: *const VideoFrame) !void {
+    try std.testing.expectEqual(a.width, b.width);
+    try std.testing.expectEqual(a.height, b.height);
+    const row_bytes = @as(usize, a.width) * @as(usize, @intFromFloat(a.format.bytesPerPixel().?));
+    for (0..a.height) |y| {
+        try std.testing.expectEqualSlices(
+            u8,
+            a.data[y * a.strides[0] ..][0..row_bytes],
+            b.data[y * b.strides[0] ..][0..row_bytes],
+        );
+    }
+}
+
+test "FusedFilter supports" {
+    const allocator = std.testing.allocator;
+    var filter = FusedFilter.init(allocator);
+    try std.testing.expect(filter.supports(.rgba32));
+    try std.testing.expect(!filter.supports(.yuv420p));
+
+    filter.scale = .{ .width = 10, .height = 10, .algorithm = .lanczos };
+    try std.testing.expect(!filter.supports(.rgba32));
+}
+
+test "FusedFilter matches chained filters" {
+    const allocator = std.testing.allocator;
+
+    var input = try VideoFrame.init(allocator, 37, 29, .rgba32);
+    defer input.deinit();
+    fillTestPattern(&input);
+
+    const blur_filter = convolution.BlurFilter.init(allocator, 3);
+
+    var fused = FusedFilter.init(allocator);
+    fused.scale = .{ .width = 53, .height = 41, .algorithm = .bilinear };
+    fused.crop = .{ .x = 5, .y = 3, .width = 40, .height = 33 };
+    fused.grayscale = true;
+    fused.blur = FusedFilter.BlurStage.fromBlurFilter(&blur_filter);
+    fused.strip_rows = 8;
+
+    var result = try fused.apply(&input);
+    defer result.deinit();
+
+    // Reference: the same stages one after another
+    const scale_filter = scale.ScaleFilter.init(allocator, 53, 41, .bilinear);
+    var scaled = try scale_filter.apply(&input);
+    defer scaled.deinit();
+    const crop_filter = @import("crop.zig").CropFilter.init(allocator, 5, 3, 40, 33);
+    var cropped = try crop_filter.apply(&scaled);
+    defer cropped.deinit();
+    const gray_filter = color.GrayscaleFilter.init(allocator);
+    var gray = try gray_filter.apply(&cropped);
+    defer gray.deinit();
+    var expected = try blur_filter.apply(&gray);
+    defer expected.deinit();
+
+    try expectSamePixels(&expected, &result);
+}
+
+test "FusedFilter rejects out-of-bounds crop" {
+    const allocator = std.testing.allocator;
+
+    var input = try VideoFrame.init(allocator, 16, 16, .rgb24);
+    defer input.deinit();
+
+    var fused = FusedFilter.init(allocator);
+    fused.crop = .{ .x = 10, .y = 0, .width = 8, .height = 8 };
+    try std.testing.expectError(VideoError.InvalidDimensions, fused.apply(&input));
+}
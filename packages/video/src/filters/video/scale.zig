@@ -56,7 +56,7 @@ pub const ScaleFilter = struct {
     pub fn apply(self: *const Self, input: *const VideoFrame) !VideoFrame {
         if (input.width == self.width and input.height == self.height) {
             // No scaling needed, return a copy
-            return try input.clone(self.allocator);
+            return try input.clone();
         }
 
         return switch (self.algorithm) {
@@ -78,64 +78,49 @@ pub const ScaleFilter = struct {
         );
         errdefer output.deinit();
 
-        const src_width = input.width;
-        const src_height = input.height;
-        const dst_width = self.width;
-        const dst_height = self.height;
-
         // Process Y plane (or RGB if not planar)
-        if (input.data[0]) |src_plane| {
-            if (output.data[0]) |dst_plane| {
-                const src_stride = input.linesize[0];
-                const dst_stride = output.linesize[0];
-
-                for (0..dst_height) |dst_y| {
-                    const src_y = @min((dst_y * src_height) / dst_height, src_height - 1);
-
-                    for (0..dst_width) |dst_x| {
-                        const src_x = @min((dst_x * src_width) / dst_width, src_width - 1);
+        if (input.getPlane(0)) |src_plane| {
+            if (output.getPlane(0)) |dst_plane| {
+                const src = PlaneDesc{
+                    .data = src_plane,
+                    .stride = input.strides[0],
+                    .width = input.width,
+                    .height = input.height,
+                };
+                const dst = PlaneDesc{
+                    .data = dst_plane,
+                    .stride = output.strides[0],
+                    .width = self.width,
+                    .height = self.height,
+                };
 
-                        // For RGB, we need to handle multiple bytes per pixel
-                        const bytes_per_pixel = getBytesPerPixel(input.format);
-                        const src_offset = src_y * src_stride + src_x * bytes_per_pixel;
-                        const dst_offset = dst_y * dst_stride + dst_x * bytes_per_pixel;
-
-                        for (0..bytes_per_pixel) |i| {
-                            if (src_offset + i < src_plane.len and dst_offset + i < dst_plane.len) {
-                                dst_plane[dst_offset + i] = src_plane[src_offset + i];
-                            }
-                        }
-                    }
+                const bytes_per_pixel = getBytesPerPixel(input.format);
+                if (!runSpecialized(&nearest_kernels, bytes_per_pixel, src, dst)) {
+                    scalePlaneNearest(src, dst, bytes_per_pixel);
                 }
             }
         }
 
         // Process UV planes for YUV formats
         if (input.format == .yuv420p or input.format == .yuv422p or input.format == .yuv444p) {
-            const chroma_width = getChromaWidth(input.format, dst_width);
-            const chroma_height = getChromaHeight(input.format, dst_height);
-            const src_chroma_width = getChromaWidth(input.format, src_width);
-            const src_chroma_height = getChromaHeight(input.format, src_height);
-
             for (1..3) |plane_idx| {
-                if (input.data[plane_idx]) |src_plane| {
-                    if (output.data[plane_idx]) |dst_plane| {
-                        const src_stride = input.linesize[plane_idx];
-                        const dst_stride = output.linesize[plane_idx];
-
-                        for (0..chroma_height) |dst_y| {
-                            const src_y = @min((dst_y * src_chroma_height) / chroma_height, src_chroma_height - 1);
-
-                            for (0..chroma_width) |dst_x| {
-                                const src_x = @min((dst_x * src_chroma_width) / chroma_width, src_chroma_width - 1);
-
-                                const src_offset = src_y * src_stride + src_x;
-                                const dst_offset = dst_y * dst_stride + dst_x;
-
-                                if (src_offset < src_plane.len and dst_offset < dst_plane.len) {
-                                    dst_plane[dst_offset] = src_plane[src_offset];
-                                }
-                            }
+                if (input.getPlane(@intCast(plane_idx))) |src_plane| {
+                    if (output.getPlane(@intCast(plane_idx))) |dst_plane| {
+                        const src = PlaneDesc{
+                            .data = src_plane,
+                            .stride = input.strides[plane_idx],
+                            .width = getChromaWidth(input.format, input.width),
+                            .height = getChromaHeight(input.format, input.height),
+                        };
+                        const dst = PlaneDesc{
+                            .data = dst_plane,
+                            .stride = output.strides[plane_idx],
+                            .width = getChromaWidth(input.format, self.width),
+                            .height = getChromaHeight(input.format, self.height),
+                        };
+
+                        if (!runSpecialized(&nearest_kernels, 1, src, dst)) {
+                            scalePlaneNearest(src, dst, 1);
                         }
                     }
                 }
@@ -143,7 +128,6 @@ pub const ScaleFilter = struct {
         }
 
         output.pts = input.pts;
-        output.dts = input.dts;
         output.duration = input.duration;
         return output;
     }
@@ -158,54 +142,25 @@ pub const ScaleFilter = struct {
         );
         errdefer output.deinit();
 
-        const src_width: f32 = @floatFromInt(input.width);
-        const src_height: f32 = @floatFromInt(input.height);
-        const dst_width: f32 = @floatFromInt(self.width);
-        const dst_height: f32 = @floatFromInt(self.height);
-
-        const scale_x = src_width / dst_width;
-        const scale_y = src_height / dst_height;
-
         // Process Y plane (or RGB)
-        if (input.data[0]) |src_plane| {
-            if (output.data[0]) |dst_plane| {
-                const src_stride = input.linesize[0];
-                const dst_stride = output.linesize[0];
-                const bytes_per_pixel = getBytesPerPixel(input.format);
-                // Guard against zero-sized inputs where `width - 1` /
-                // `height - 1` would underflow usize below.
-                if (input.width == 0 or input.height == 0) return output;
-                const max_src_x = input.width - 1;
-                const max_src_y = input.height - 1;
+        if (input.getPlane(0)) |src_plane| {
+            if (output.getPlane(0)) |dst_plane| {
+                const src = PlaneDesc{
+                    .data = src_plane,
+                    .stride = input.strides[0],
+                    .width = input.width,
+                    .height = input.height,
+                };
+                const dst = PlaneDesc{
+                    .data = dst_plane,
+                    .stride = output.strides[0],
+                    .width = self.width,
+                    .height = self.height,
+                };
 
-                for (0..self.height) |dst_y| {
-                    const src_yf = @as(f32, @floatFromInt(dst_y)) * scale_y;
-                    const src_y0: usize = @min(@as(usize, @intFromFloat(@floor(src_yf))), max_src_y);
-                    const src_y1: usize = @min(src_y0 + 1, max_src_y);
-                    const y_frac = src_yf - @floor(src_yf);
-
-                    for (0..self.width) |dst_x| {
-                        const src_xf = @as(f32, @floatFromInt(dst_x)) * scale_x;
-                        const src_x0: usize = @min(@as(usize, @intFromFloat(@floor(src_xf))), max_src_x);
-                        const src_x1: usize = @min(src_x0 + 1, max_src_x);
-                        const x_frac = src_xf - @floor(src_xf);
-
-                        for (0..bytes_per_pixel) |i| {
-                            const p00 = getPixel(src_plane, src_x0, src_y0, src_stride, bytes_per_pixel, i);
-                            const p10 = getPixel(src_plane, src_x1, src_y0, src_stride, bytes_per_pixel, i);
-                            const p01 = getPixel(src_plane, src_x0, src_y1, src_stride, bytes_per_pixel, i);
-                            const p11 = getPixel(src_plane, src_x1, src_y1, src_stride, bytes_per_pixel, i);
-
-                            const top = lerp(p00, p10, x_frac);
-                            const bottom = lerp(p01, p11, x_frac);
-                            const result = lerp(top, bottom, y_frac);
-
-                            const dst_offset = dst_y * dst_stride + dst_x * bytes_per_pixel + i;
-                            if (dst_offset < dst_plane.len) {
-                                dst_plane[dst_offset] = @intFromFloat(@round(@max(0, @min(255, result))));
-                            }
-                        }
-                    }
+                const bytes_per_pixel = getBytesPerPixel(input.format);
+                if (!runSpecialized(&bilinear_kernels, bytes_per_pixel, src, dst)) {
+                    scalePlaneBilinear(src, dst, bytes_per_pixel);
                 }
             }
         }
@@ -216,7 +171,6 @@ pub const ScaleFilter = struct {
         }
 
         output.pts = input.pts;
-        output.dts = input.dts;
         output.duration = input.duration;
         return output;
     }
@@ -231,10 +185,10 @@ pub const ScaleFilter = struct {
         const scale_y = @as(f32, @floatFromInt(src_chroma_height)) / @as(f32, @floatFromInt(chroma_height));
 
         for (1..3) |plane_idx| {
-            if (input.data[plane_idx]) |src_plane| {
-                if (output.data[plane_idx]) |dst_plane| {
-                    const src_stride = input.linesize[plane_idx];
-                    const dst_stride = output.linesize[plane_idx];
+            if (input.getPlane(@intCast(plane_idx))) |src_plane| {
+                if (output.getPlane(@intCast(plane_idx))) |dst_plane| {
+                    const src_stride: usize = input.strides[plane_idx];
+                    const dst_stride: usize = output.strides[plane_idx];
 
                     for (0..chroma_height) |dst_y| {
                         const src_yf = @as(f32, @floatFromInt(dst_y)) * scale_y;
@@ -253,13 +207,9 @@ pub const ScaleFilter = struct {
                             const p01 = getPixel(src_plane, src_x0, src_y1, src_stride, 1, 0);
                             const p11 = getPixel(src_plane, src_x1, src_y1, src_stride, 1, 0);
 
-                            const top = lerp(p00, p10, x_frac);
-                            const bottom = lerp(p01, p11, x_frac);
-                            const result = lerp(top, bottom, y_frac);
-
                             const dst_offset = dst_y * dst_stride + dst_x;
                             if (dst_offset < dst_plane.len) {
-                                dst_plane[dst_offset] = @intFromFloat(@round(@max(0, @min(255, result))));
+                                dst_plane[dst_offset] = bilinearSample(p00, p10, p01, p11, x_frac, y_frac);
                             }
                         }
                     }
@@ -286,10 +236,10 @@ pub const ScaleFilter = struct {
         const scale_x = src_width / dst_width;
         const scale_y = src_height / dst_height;
 
-        if (input.data[0]) |src_plane| {
-            if (output.data[0]) |dst_plane| {
-                const src_stride = input.linesize[0];
-                const dst_stride = output.linesize[0];
+        if (input.getPlane(0)) |src_plane| {
+            if (output.getPlane(0)) |dst_plane| {
+                const src_stride: usize = input.strides[0];
+                const dst_stride: usize = output.strides[0];
                 const bytes_per_pixel = getBytesPerPixel(input.format);
 
                 for (0..self.height) |dst_y| {
@@ -335,7 +285,6 @@ pub const ScaleFilter = struct {
         }
 
         output.pts = input.pts;
-        output.dts = input.dts;
         output.duration = input.duration;
         return output;
     }
@@ -360,10 +309,10 @@ pub const ScaleFilter = struct {
 
         const a: i32 = @intFromFloat(self.lanczos_a);
 
-        if (input.data[0]) |src_plane| {
-            if (output.data[0]) |dst_plane| {
-                const src_stride = input.linesize[0];
-                const dst_stride = output.linesize[0];
+        if (input.getPlane(0)) |src_plane| {
+            if (output.getPlane(0)) |dst_plane| {
+                const src_stride: usize = input.strides[0];
+                const dst_stride: usize = output.strides[0];
                 const bytes_per_pixel = getBytesPerPixel(input.format);
 
                 for (0..self.height) |dst_y| {
@@ -419,7 +368,6 @@ pub const ScaleFilter = struct {
         }
 
         output.pts = input.pts;
-        output.dts = input.dts;
         output.duration = input.duration;
         return output;
     }
@@ -443,10 +391,10 @@ pub const ScaleFilter = struct {
         const scale_x = @as(f32, @floatFromInt(input.width)) / @as(f32, @floatFromInt(self.width));
         const scale_y = @as(f32, @floatFromInt(input.height)) / @as(f32, @floatFromInt(self.height));
 
-        if (input.data[0]) |src_plane| {
-            if (output.data[0]) |dst_plane| {
-                const src_stride = input.linesize[0];
-                const dst_stride = output.linesize[0];
+        if (input.getPlane(0)) |src_plane| {
+            if (output.getPlane(0)) |dst_plane| {
+                const src_stride: usize = input.strides[0];
+                const dst_stride: usize = output.strides[0];
                 const bytes_per_pixel = getBytesPerPixel(input.format);
 
                 for (0..self.height) |dst_y| {
@@ -490,12 +438,177 @@ pub const ScaleFilter = struct {
         }
 
         output.pts = input.pts;
-        output.dts = input.dts;
         output.duration = input.duration;
         return output;
     }
 };
 
+// ============================================================================
+// Specialized Kernels
+// ============================================================================
+
+/// One image plane as seen by the specialized kernels
+const PlaneDesc = struct {
+    data: []u8,
+    stride: usize,
+    width: usize,
+    height: usize,
+
+    /// Check that every pixel lies inside `data`, so the kernels can skip
+    /// per-pixel bounds checks
+    fn fits(self: PlaneDesc, bytes_per_pixel: usize) bool {
+        if (self.width == 0 or self.height == 0) return false;
+        if (self.stride < self.width * bytes_per_pixel) return false;
+        return (self.height - 1) * self.stride + self.width * bytes_per_pixel <= self.data.len;
+    }
+};
+
+const PlaneKernel = *const fn (src: PlaneDesc, dst: PlaneDesc) void;
+
+/// Nearest neighbor kernel for a fixed pixel size
+fn NearestKernel(comptime bytes_per_pixel: usize) type {
+    return struct {
+        fn run(src: PlaneDesc, dst: PlaneDesc) void {
+            for (0..dst.height) |dst_y| {
+                const src_y = @min((dst_y * src.height) / dst.height, src.height - 1);
+                const src_row = src.data[src_y * src.stride ..];
+                const dst_row = dst.data[dst_y * dst.stride ..];
+
+                for (0..dst.width) |dst_x| {
+                    const src_x = @min((dst_x * src.width) / dst.width, src.width - 1);
+                    dst_row[dst_x * bytes_per_pixel ..][0..bytes_per_pixel].* =
+                        src_row[src_x * bytes_per_pixel ..][0..bytes_per_pixel].*;
+                }
+            }
+        }
+    };
+}
+
+/// Bilinear kernel for a fixed pixel size, same math as scaleBilinear
+fn BilinearKernel(comptime bytes_per_pixel: usize) type {
+    return struct {
+        fn run(src: PlaneDesc, dst: PlaneDesc) void {
+            const scale_x = @as(f32, @floatFromInt(src.width)) / @as(f32, @floatFromInt(dst.width));
+            const scale_y = @as(f32, @floatFromInt(src.height)) / @as(f32, @floatFromInt(dst.height));
+            const max_src_x = src.width - 1;
+            const max_src_y = src.height - 1;
+
+            for (0..dst.height) |dst_y| {
+                const src_yf = @as(f32, @floatFromInt(dst_y)) * scale_y;
+                const src_y0: usize = @min(@as(usize, @intFromFloat(@floor(src_yf))), max_src_y);
+                const src_y1: usize = @min(src_y0 + 1, max_src_y);
+                const y_frac = src_yf - @floor(src_yf);
+                const row0 = src.data[src_y0 * src.stride ..];
+                const row1 = src.data[src_y1 * src.stride ..];
+                const dst_row = dst.data[dst_y * dst.stride ..];
+
+                for (0..dst.width) |dst_x| {
+                    const src_xf = @as(f32, @floatFromInt(dst_x)) * scale_x;
+                    const src_x0: usize = @min(@as(usize, @intFromFloat(@floor(src_xf))), max_src_x);
+                    const src_x1: usize = @min(src_x0 + 1, max_src_x);
+                    const x_frac = src_xf - @floor(src_xf);
+
+                    inline for (0..bytes_per_pixel) |i| {
+                        const p00: f32 = @floatFromInt(row0[src_x0 * bytes_per_pixel + i]);
+                        const p10: f32 = @floatFromInt(row0[src_x1 * bytes_per_pixel + i]);
+                        const p01: f32 = @floatFromInt(row1[src_x0 * bytes_per_pixel + i]);
+                        const p11: f32 = @floatFromInt(row1[src_x1 * bytes_per_pixel + i]);
+
+                        dst_row[dst_x * bytes_per_pixel + i] = bilinearSample(p00, p10, p01, p11, x_frac, y_frac);
+                    }
+                }
+            }
+        }
+    };
+}
+
+/// Dispatch tables indexed by bytes per pixel - 1
+/// Each entry is compiled for one pixel size, so the channel loop unrolls
+/// and the inner loop has no format branches.
+const nearest_kernels = [_]PlaneKernel{
+    &NearestKernel(1).run,
+    &NearestKernel(2).run,
+    &NearestKernel(3).run,
+    &NearestKernel(4).run,
+};
+
+const bilinear_kernels = [_]PlaneKernel{
+    &BilinearKernel(1).run,
+    &BilinearKernel(2).run,
+    &BilinearKernel(3).run,
+    &BilinearKernel(4).run,
+};
+
+/// Nearest neighbor for any pixel size, checking bounds per byte
+/// Used when the plane geometry rules out the specialized kernels.
+fn scalePlaneNearest(src: PlaneDesc, dst: PlaneDesc, bytes_per_pixel: usize) void {
+    if (src.width == 0 or src.height == 0 or dst.width == 0 or dst.height == 0) return;
+
+    for (0..dst.height) |dst_y| {
+        const src_y = @min((dst_y * src.height) / dst.height, src.height - 1);
+
+        for (0..dst.width) |dst_x| {
+            const src_x = @min((dst_x * src.width) / dst.width, src.width - 1);
+
+            const src_offset = src_y * src.stride + src_x * bytes_per_pixel;
+            const dst_offset = dst_y * dst.stride + dst_x * bytes_per_pixel;
+
+            for (0..bytes_per_pixel) |i| {
+                if (src_offset + i < src.data.len and dst_offset + i < dst.data.len) {
+                    dst.data[dst_offset + i] = src.data[src_offset + i];
+                }
+            }
+        }
+    }
+}
+
+/// Bilinear for any pixel size, checking bounds per byte
+fn scalePlaneBilinear(src: PlaneDesc, dst: PlaneDesc, bytes_per_pixel: usize) void {
+    // Guard against zero-sized planes where `width - 1` / `height - 1`
+    // would underflow usize below.
+    if (src.width == 0 or src.height == 0 or dst.width == 0 or dst.height == 0) return;
+
+    const scale_x = @as(f32, @floatFromInt(src.width)) / @as(f32, @floatFromInt(dst.width));
+    const scale_y = @as(f32, @floatFromInt(src.height)) / @as(f32, @floatFromInt(dst.height));
+    const max_src_x = src.width - 1;
+    const max_src_y = src.height - 1;
+
+    for (0..dst.height) |dst_y| {
+        const src_yf = @as(f32, @floatFromInt(dst_y)) * scale_y;
+        const src_y0: usize = @min(@as(usize, @intFromFloat(@floor(src_yf))), max_src_y);
+        const src_y1: usize = @min(src_y0 + 1, max_src_y);
+        const y_frac = src_yf - @floor(src_yf);
+
+        for (0..dst.width) |dst_x| {
+            const src_xf = @as(f32, @floatFromInt(dst_x)) * scale_x;
+            const src_x0: usize = @min(@as(usize, @intFromFloat(@floor(src_xf))), max_src_x);
+            const src_x1: usize = @min(src_x0 + 1, max_src_x);
+            const x_frac = src_xf - @floor(src_xf);
+
+            for (0..bytes_per_pixel) |i| {
+                const p00 = getPixel(src.data, src_x0, src_y0, src.stride, bytes_per_pixel, i);
+                const p10 = getPixel(src.data, src_x1, src_y0, src.stride, bytes_per_pixel, i);
+                const p01 = getPixel(src.data, src_x0, src_y1, src.stride, bytes_per_pixel, i);
+                const p11 = getPixel(src.data, src_x1, src_y1, src.stride, bytes_per_pixel, i);
+
+                const dst_offset = dst_y * dst.stride + dst_x * bytes_per_pixel + i;
+                if (dst_offset < dst.data.len) {
+                    dst.data[dst_offset] = bilinearSample(p00, p10, p01, p11, x_frac, y_frac);
+                }
+            }
+        }
+    }
+}
+
+/// Run the specialized kernel for a plane if the geometry allows it
+/// Returns false when the caller should use its generic loop instead.
+fn runSpecialized(table: []const PlaneKernel, bytes_per_pixel: usize, src: PlaneDesc, dst: PlaneDesc) bool {
+    if (bytes_per_pixel == 0 or bytes_per_pixel > table.len) return false;
+    if (!src.fits(bytes_per_pixel) or !dst.fits(bytes_per_pixel)) return false;
+    table[bytes_per_pixel - 1](src, dst);
+    return true;
+}
+
 // ============================================================================
 // Helper Functions
 // ============================================================================
@@ -535,6 +648,15 @@ fn lerp(a: f32, b: f32, t: f32) f32 {
     return a + (b - a) * t;
 }
 
+/// Blend four neighboring samples and round to a pixel value
+/// Shared by every bilinear path so they produce identical bytes.
+pub inline fn bilinearSample(p00: f32, p10: f32, p01: f32, p11: f32, x_frac: f32, y_frac: f32) u8 {
+    const top = lerp(p00, p10, x_frac);
+    const bottom = lerp(p01, p11, x_frac);
+    const result = lerp(top, bottom, y_frac);
+    return @intFromFloat(@round(@max(0, @min(255, result))));
+}
+
 fn clamp(val: i32, min_val: i32, max_val: i32) i32 {
     return @max(min_val, @min(max_val, val));
 }
@@ -602,3 +724,48 @@ test "Linear interpolation" {
     try std.testing.expectApproxEqAbs(@as(f32, 5.0), lerp(0, 10, 0.5), 0.001);
     try std.testing.expectApproxEqAbs(@as(f32, 10.0), lerp(0, 10, 1.0), 0.001);
 }
+
+fn fillTestPlane(data: []u8) void {
+    for (data, 0..) |*byte, i| {
+        byte.* = @truncate(i *% 37 +% (i / 7));
+    }
+}
+
+test "Specialized kernels match the generic paths" {
+    const sizes = [_][2]usize{ .{ 7, 5 }, .{ 3, 9 }, .{ 16, 16 } };
+
+    inline for (1..5) |bpp| {
+        for (sizes) |size| {
+            var src_data: [11 * 7 * 4]u8 = undefined;
+            fillTestPlane(&src_data);
+            const src = PlaneDesc{ .data = &src_data, .stride = 11 * bpp, .width = 11, .height = 7 };
+
+            const dst_stride = size[0] * bpp + 3;
+            var expected_data = [_]u8{0} ** (19 * 16 * 4 + 16);
+            var actual_data = [_]u8{0} ** (19 * 16 * 4 + 16);
+            const expected = PlaneDesc{ .data = &expected_data, .stride = dst_stride, .width = size[0], .height = size[1] };
+            const actual = PlaneDesc{ .data = &actual_data, .stride = dst_stride, .width = size[0], .height = size[1] };
+
+            scalePlaneNearest(src, expected, bpp);
+            try std.testing.expect(runSpecialized(&nearest_kernels, bpp, src, actual));
+            try std.testing.expectEqualSlices(u8, &expected_data, &actual_data);
+
+            @memset(&expected_data, 0);
+            @memset(&actual_data, 0);
+            scalePlaneBilinear(src, expected, bpp);
+            try std.testing.expect(runSpecialized(&bilinear_kernels, bpp, src, actual));
+            try std.testing.expectEqualSlices(u8, &expected_data, &actual_data);
+        }
+    }
+}
+
+test "Specialized kernels decline planes that don't fit" {
+    var src_data = [_]u8{0} ** 16;
+    var dst_data = [_]u8{0} ** 12;
+    const src = PlaneDesc{ .data = &src_data, .stride = 8, .width = 2, .height = 2 };
+    const dst = PlaneDesc{ .data = &dst_data, .stride = 6, .width = 2, .height = 2 };
+
+    const short = PlaneDesc{ .data = dst_data[0..10], .stride = 6, .width = 2, .height = 2 };
+    try std.testing.expect(!runSpecialized(&nearest_kernels, 3, src, short));
+    try std.testing.expect(!runSpecialized(&bilinear_kernels, 5, src, dst));
+}
@@ -69,27 +69,19 @@ pub const RotateFilter = struct {
         const bytes_per_pixel = getBytesPerPixel(input.format);
 
         // Rotate Y/RGB plane
-        if (input.data[0]) |src| {
-            if (output.data[0]) |dst| {
-                const src_stride = input.linesize[0];
-                const dst_stride = output.linesize[0];
-
-                for (0..input.height) |y| {
-                    for (0..input.width) |x| {
-                        // (x, y) -> (height - 1 - y, x) for 90° CW
-                        const new_x = input.height - 1 - y;
-                        const new_y = x;
-
-                        const src_offset = y * src_stride + x * bytes_per_pixel;
-                        const dst_offset = new_y * dst_stride + new_x * bytes_per_pixel;
-
-                        for (0..bytes_per_pixel) |i| {
-                            if (src_offset + i < src.len and dst_offset + i < dst.len) {
-                                dst[dst_offset + i] = src[src_offset + i];
-                            }
-                        }
-                    }
-                }
+        if (input.getPlane(0)) |src| {
+            if (output.getPlane(0)) |dst| {
+                rotatePlane(.rotate_90, .{
+                    .data = src,
+                    .stride = input.strides[0],
+                    .width = input.width,
+                    .height = input.height,
+                }, .{
+                    .data = dst,
+                    .stride = output.strides[0],
+                    .width = output.width,
+                    .height = output.height,
+                }, bytes_per_pixel);
             }
         }
 
@@ -99,7 +91,6 @@ pub const RotateFilter = struct {
         }
 
         output.pts = input.pts;
-        output.dts = input.dts;
         output.duration = input.duration;
         return output;
     }
@@ -115,26 +106,19 @@ pub const RotateFilter = struct {
 
         const bytes_per_pixel = getBytesPerPixel(input.format);
 
-        if (input.data[0]) |src| {
-            if (output.data[0]) |dst| {
-                const src_stride = input.linesize[0];
-                const dst_stride = output.linesize[0];
-
-                for (0..input.height) |y| {
-                    for (0..input.width) |x| {
-                        const new_x = input.width - 1 - x;
-                        const new_y = input.height - 1 - y;
-
-                        const src_offset = y * src_stride + x * bytes_per_pixel;
-                        const dst_offset = new_y * dst_stride + new_x * bytes_per_pixel;
-
-                        for (0..bytes_per_pixel) |i| {
-                            if (src_offset + i < src.len and dst_offset + i < dst.len) {
-                                dst[dst_offset + i] = src[src_offset + i];
-                            }
-                        }
-                    }
-                }
+        if (input.getPlane(0)) |src| {
+            if (output.getPlane(0)) |dst| {
+                rotatePlane(.rotate_180, .{
+                    .data = src,
+                    .stride = input.strides[0],
+                    .width = input.width,
+                    .height = input.height,
+                }, .{
+                    .data = dst,
+                    .stride = output.strides[0],
+                    .width = output.width,
+                    .height = output.height,
+                }, bytes_per_pixel);
             }
         }
 
@@ -143,7 +127,6 @@ pub const RotateFilter = struct {
         }
 
         output.pts = input.pts;
-        output.dts = input.dts;
         output.duration = input.duration;
         return output;
     }
@@ -159,27 +142,19 @@ pub const RotateFilter = struct {
 
         const bytes_per_pixel = getBytesPerPixel(input.format);
 
-        if (input.data[0]) |src| {
-            if (output.data[0]) |dst| {
-                const src_stride = input.linesize[0];
-                const dst_stride = output.linesize[0];
-
-                for (0..input.height) |y| {
-                    for (0..input.width) |x| {
-                        // (x, y) -> (y, width - 1 - x) for 270° CW (90° CCW)
-                        const new_x = y;
-                        const new_y = input.width - 1 - x;
-
-                        const src_offset = y * src_stride + x * bytes_per_pixel;
-                        const dst_offset = new_y * dst_stride + new_x * bytes_per_pixel;
-
-                        for (0..bytes_per_pixel) |i| {
-                            if (src_offset + i < src.len and dst_offset + i < dst.len) {
-                                dst[dst_offset + i] = src[src_offset + i];
-                            }
-                        }
-                    }
-                }
+        if (input.getPlane(0)) |src| {
+            if (output.getPlane(0)) |dst| {
+                rotatePlane(.rotate_270, .{
+                    .data = src,
+                    .stride = input.strides[0],
+                    .width = input.width,
+                    .height = input.height,
+                }, .{
+                    .data = dst,
+                    .stride = output.strides[0],
+                    .width = output.width,
+                    .height = output.height,
+                }, bytes_per_pixel);
             }
         }
 
@@ -188,7 +163,6 @@ pub const RotateFilter = struct {
         }
 
         output.pts = input.pts;
-        output.dts = input.dts;
         output.duration = input.duration;
         return output;
     }
@@ -199,24 +173,19 @@ pub const RotateFilter = struct {
         const chroma_height_in = getChromaHeight(input.format, input.height);
 
         for (1..3) |plane_idx| {
-            if (input.data[plane_idx]) |src| {
-                if (output.data[plane_idx]) |dst| {
-                    const src_stride = input.linesize[plane_idx];
-                    const dst_stride = output.linesize[plane_idx];
-
-                    for (0..chroma_height_in) |y| {
-                        for (0..chroma_width_in) |x| {
-                            const new_x = chroma_height_in - 1 - y;
-                            const new_y = x;
-
-                            const src_offset = y * src_stride + x;
-                            const dst_offset = new_y * dst_stride + new_x;
-
-                            if (src_offset < src.len and dst_offset < dst.len) {
-                                dst[dst_offset] = src[src_offset];
-                            }
-                        }
-                    }
+            if (input.getPlane(@intCast(plane_idx))) |src| {
+                if (output.getPlane(@intCast(plane_idx))) |dst| {
+                    rotatePlane(.rotate_90, .{
+                        .data = src,
+                        .stride = input.strides[plane_idx],
+                        .width = chroma_width_in,
+                        .height = chroma_height_in,
+                    }, .{
+                        .data = dst,
+                        .stride = output.strides[plane_idx],
+                        .width = chroma_height_in,
+                        .height = chroma_width_in,
+                    }, 1);
                 }
             }
         }
@@ -228,24 +197,19 @@ pub const RotateFilter = struct {
         const chroma_height = getChromaHeight(input.format, input.height);
 
         for (1..3) |plane_idx| {
-            if (input.data[plane_idx]) |src| {
-                if (output.data[plane_idx]) |dst| {
-                    const src_stride = input.linesize[plane_idx];
-                    const dst_stride = output.linesize[plane_idx];
-
-                    for (0..chroma_height) |y| {
-                        for (0..chroma_width) |x| {
-                            const new_x = chroma_width - 1 - x;
-                            const new_y = chroma_height - 1 - y;
-
-                            const src_offset = y * src_stride + x;
-                            const dst_offset = new_y * dst_stride + new_x;
-
-                            if (src_offset < src.len and dst_offset < dst.len) {
-                                dst[dst_offset] = src[src_offset];
-                            }
-                        }
-                    }
+            if (input.getPlane(@intCast(plane_idx))) |src| {
+                if (output.getPlane(@intCast(plane_idx))) |dst| {
+                    rotatePlane(.rotate_180, .{
+                        .data = src,
+                        .stride = input.strides[plane_idx],
+                        .width = chroma_width,
+                        .height = chroma_height,
+                    }, .{
+                        .data = dst,
+                        .stride = output.strides[plane_idx],
+                        .width = chroma_width,
+                        .height = chroma_height,
+                    }, 1);
                 }
             }
         }
@@ -257,24 +221,19 @@ pub const RotateFilter = struct {
         const chroma_height_in = getChromaHeight(input.format, input.height);
 
         for (1..3) |plane_idx| {
-            if (input.data[plane_idx]) |src| {
-                if (output.data[plane_idx]) |dst| {
-                    const src_stride = input.linesize[plane_idx];
-                    const dst_stride = output.linesize[plane_idx];
-
-                    for (0..chroma_height_in) |y| {
-                        for (0..chroma_width_in) |x| {
-                            const new_x = y;
-                            const new_y = chroma_width_in - 1 - x;
-
-                            const src_offset = y * src_stride + x;
-                            const dst_offset = new_y * dst_stride + new_x;
-
-                            if (src_offset < src.len and dst_offset < dst.len) {
-                                dst[dst_offset] = src[src_offset];
-                            }
-                        }
-                    }
+            if (input.getPlane(@intCast(plane_idx))) |src| {
+                if (output.getPlane(@intCast(plane_idx))) |dst| {
+                    rotatePlane(.rotate_270, .{
+                        .data = src,
+                        .stride = input.strides[plane_idx],
+                        .width = chroma_width_in,
+                        .height = chroma_height_in,
+                    }, .{
+                        .data = dst,
+                        .stride = output.strides[plane_idx],
+                        .width = chroma_height_in,
+                        .height = chroma_width_in,
+                    }, 1);
                 }
             }
         }
@@ -310,10 +269,10 @@ pub const FlipFilter = struct {
 
         const bytes_per_pixel = getBytesPerPixel(input.format);
 
-        if (input.data[0]) |src| {
-            if (output.data[0]) |dst| {
-                const src_stride = input.linesize[0];
-                const dst_stride = output.linesize[0];
+        if (input.getPlane(0)) |src| {
+            if (output.getPlane(0)) |dst| {
+                const src_stride: usize = input.strides[0];
+                const dst_stride: usize = output.strides[0];
 
                 for (0..input.height) |y| {
                     for (0..input.width) |x| {
@@ -344,7 +303,6 @@ pub const FlipFilter = struct {
         }
 
         output.pts = input.pts;
-        output.dts = input.dts;
         output.duration = input.duration;
         return output;
     }
@@ -354,10 +312,10 @@ pub const FlipFilter = struct {
         const chroma_height = getChromaHeight(input.format, input.height);
 
         for (1..3) |plane_idx| {
-            if (input.data[plane_idx]) |src| {
-                if (output.data[plane_idx]) |dst| {
-                    const src_stride = input.linesize[plane_idx];
-                    const dst_stride = output.linesize[plane_idx];
+            if (input.getPlane(@intCast(plane_idx))) |src| {
+                if (output.getPlane(@intCast(plane_idx))) |dst| {
+                    const src_stride: usize = input.strides[plane_idx];
+                    const dst_stride: usize = output.strides[plane_idx];
 
                     for (0..chroma_height) |y| {
                         for (0..chroma_width) |x| {
@@ -409,10 +367,10 @@ pub const TransposeFilter = struct {
 
         const bytes_per_pixel = getBytesPerPixel(input.format);
 
-        if (input.data[0]) |src| {
-            if (output.data[0]) |dst| {
-                const src_stride = input.linesize[0];
-                const dst_stride = output.linesize[0];
+        if (input.getPlane(0)) |src| {
+            if (output.getPlane(0)) |dst| {
+                const src_stride: usize = input.strides[0];
+                const dst_stride: usize = output.strides[0];
 
                 for (0..input.height) |y| {
                     for (0..input.width) |x| {
@@ -434,7 +392,6 @@ pub const TransposeFilter = struct {
         }
 
         output.pts = input.pts;
-        output.dts = input.dts;
         output.duration = input.duration;
         return output;
     }
@@ -445,10 +402,10 @@ pub const TransposeFilter = struct {
         const chroma_height_in = getChromaHeight(input.format, input.height);
 
         for (1..3) |plane_idx| {
-            if (input.data[plane_idx]) |src| {
-                if (output.data[plane_idx]) |dst| {
-                    const src_stride = input.linesize[plane_idx];
-                    const dst_stride = output.linesize[plane_idx];
+            if (input.getPlane(@intCast(plane_idx))) |src| {
+                if (output.getPlane(@intCast(plane_idx))) |dst| {
+                    const src_stride: usize = input.strides[plane_idx];
+                    const dst_stride: usize = output.strides[plane_idx];
 
                     for (0..chroma_height_in) |y| {
                         for (0..chroma_width_in) |x| {
@@ -466,6 +423,78 @@ pub const TransposeFilter = struct {
     }
 };
 
+// ============================================================================
+// Tiled Plane Rotation
+// ============================================================================
+
+/// Side of the square tiles rotatePlane works in
+/// A 64x64 tile of up to 4-byte pixels is 16 KiB on each side of the copy,
+/// so source and destination tiles stay in L1 together.
+const tile_size = 64;
+
+/// One image plane as seen by rotatePlane
+const Plane = struct {
+    data: []u8,
+    stride: usize,
+    width: usize,
+    height: usize,
+
+    /// Check that every pixel lies inside `data`
+    fn fits(self: Plane, bytes_per_pixel: usize) bool {
+        if (self.width == 0 or self.height == 0) return true;
+        if (self.stride < self.width * bytes_per_pixel) return false;
+        return (self.height - 1) * self.stride + self.width * bytes_per_pixel <= self.data.len;
+    }
+};
+
+/// Rotate `src` into `dst`, whose dimensions must already be the rotated ones
+/// Output is walked in tile_size x tile_size tiles so that the column-wise
+/// source reads of a 90/270 degree turn hit at most tile_size source rows,
+/// which stay cached while the destination tile is written row by row.
+/// The angle and pixel size are comptime, so every tile loop is monomorphic.
+fn rotatePlane(comptime angle: RotationAngle, src: Plane, dst: Plane, bytes_per_pixel: usize) void {
+    switch (bytes_per_pixel) {
+        inline 1, 3, 4 => |bpp| rotatePlaneTiled(angle, bpp, src, dst),
+        // getBytesPerPixel only returns the sizes above
+        else => unreachable,
+    }
+}
+
+fn rotatePlaneTiled(comptime angle: RotationAngle, comptime bpp: usize, src: Plane, dst: Plane) void {
+    const checked = !src.fits(bpp) or !dst.fits(bpp);
+
+    var tile_y: usize = 0;
+    while (tile_y < dst.height) : (tile_y += tile_size) {
+        const y_end = @min(tile_y + tile_size, dst.height);
+
+        var tile_x: usize = 0;
+        while (tile_x < dst.width) : (tile_x += tile_size) {
+            const x_end = @min(tile_x + tile_size, dst.width);
+
+            for (tile_y..y_end) |out_y| {
+                const dst_row = out_y * dst.stride;
+
+                for (tile_x..x_end) |out_x| {
+                    // Inverse mapping: which source pixel lands at (out_x, out_y)
+                    const src_x, const src_y = switch (angle) {
+                        .rotate_90 => .{ out_y, src.height - 1 - out_x },
+                        .rotate_180 => .{ src.width - 1 - out_x, src.height - 1 - out_y },
+                        .rotate_270 => .{ src.width - 1 - out_y, out_x },
+                    };
+
+                    const src_offset = src_y * src.stride + src_x * bpp;
+                    const dst_offset = dst_row + out_x * bpp;
+
+                    if (checked) {
+                        if (src_offset + bpp > src.data.len or dst_offset + bpp > dst.data.len) continue;
+                    }
+                    dst.data[dst_offset..][0..bpp].* = src.data[src_offset..][0..bpp].*;
+                }
+            }
+        }
+    }
+}
+
 // ============================================================================
 // Helper Functions
 // ============================================================================
@@ -545,3 +574,56 @@ test "Helper functions" {
     try std.testing.expectEqual(@as(usize, 960), getChromaWidth(.yuv420p, 1920));
     try std.testing.expectEqual(@as(usize, 540), getChromaHeight(.yuv420p, 1080));
 }
+
+test "Tiled rotation matches per-pixel mapping" {
+    const allocator = std.testing.allocator;
+
+    // Wider than one tile so the tile edges are exercised
+    var input = try VideoFrame.init(allocator, 70, 3, .rgb24);
+    defer input.deinit();
+    const src_stride: usize = input.strides[0];
+    for (0..input.height) |y| {
+        for (0..input.width * 3) |i| {
+            input.data[y * src_stride + i] = @truncate(i * 7 + y * 13);
+        }
+    }
+
+    const rotate90 = RotateFilter.init(allocator, .rotate_90);
+    var rotated = try rotate90.apply(&input);
+    defer rotated.deinit();
+    try std.testing.expectEqual(@as(u32, 3), rotated.width);
+    try std.testing.expectEqual(@as(u32, 70), rotated.height);
+
+    const dst_stride: usize = rotated.strides[0];
+    for (0..input.height) |y| {
+        for (0..input.width) |x| {
+            // (x, y) -> (height - 1 - y, x) for 90° CW
+            const dst_offset = x * dst_stride + (input.height - 1 - y) * 3;
+            const src_offset = y * src_stride + x * 3;
+            try std.testing.expectEqualSlices(u8, input.data[src_offset..][0..3], rotated.data[dst_offset..][0..3]);
+        }
+    }
+
+    const rotate270 = RotateFilter.init(allocator, .rotate_270);
+    var restored = try rotate270.apply(&rotated);
+    defer restored.deinit();
+    const row_bytes = @as(usize, input.width) * 3;
+    for (0..input.height) |y| {
+        try std.testing.expectEqualSlices(
+            u8,
+            input.data[y * src_stride ..][0..row_bytes],
+            restored.data[y * restored.strides[0] ..][0..row_bytes],
+        );
+    }
+
+    const rotate180 = RotateFilter.init(allocator, .rotate_180);
+    var flipped = try rotate180.apply(&input);
+    defer flipped.deinit();
+    for (0..input.height) |y| {
+        for (0..input.width) |x| {
+            const src_offset = y * src_stride + x * 3;
+            const dst_offset = (input.height - 1 - y) * flipped.strides[0] + (input.width - 1 - x) * 3;
+            try std.testing.expectEqualSlices(u8, input.data[src_offset..][0..3], flipped.data[dst_offset..][0..3]);
+        }
+    }
+}
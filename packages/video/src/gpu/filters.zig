@@ -0,0 +1,240 @@
+// Home Video Library - GPU Filters
+// Opt-in GPU offload for Lanczos scaling and box blur
+
+const std = @import("std");
+const builtin = @import("builtin");
+const frame = @import("../core/frame.zig");
+const convolution = @import("../filters/video/convolution.zig");
+
+const VideoFrame = frame.VideoFrame;
+const BlurFilter = convolution.BlurFilter;
+
+/// Whether this build has a GPU backend for the filters below
+pub const available = builtin.os.tag == .macos;
+
+const metal = if (available) @import("metal.zig") else struct {};
+
+// ============================================================================
+// Shared GPU Context
+// ============================================================================
+
+/// Device, queue and compiled pipelines, created on first use and kept for
+/// the life of the process so shader compilation is paid once
+const Context = struct {
+    device: metal.MetalDevice,
+    queue: metal.MetalCommandQueue,
+    encoder: metal.MetalComputeEncoder,
+};
+
+var context: ?*Context = null;
+var init_failed = false;
+var mutex: std.Thread.Mutex = .{};
+
+/// Get the shared context, creating it on first call (caller holds `mutex`)
+fn acquireContext() ?*Context {
+    if (context) |ctx| return ctx;
+    if (init_failed) return null;
+
+    const ctx = std.heap.page_allocator.create(Context) catch {
+        init_failed = true;
+        return null;
+    };
+
+    ctx.device = metal.MetalDevice.init(std.heap.page_allocator) catch {
+        std.heap.page_allocator.destroy(ctx);
+        init_failed = true;
+        return null;
+    };
+    ctx.queue = metal.MetalCommandQueue.init(&ctx.device) catch {
+        ctx.device.deinit();
+        std.heap.page_allocator.destroy(ctx);
+        init_failed = true;
+        return null;
+    };
+    ctx.encoder = metal.MetalComputeEncoder.init(std.heap.page_allocator, &ctx.device, &ctx.queue);
+
+    context = ctx;
+    return ctx;
+}
+
+// ============================================================================
+// Filters
+// ============================================================================
+
+/// Scale a frame with Lanczos-3 on the GPU
+/// Samples the same corner-aligned source positions as the CPU ScaleFilter.
+/// Returns null when no GPU is usable or the format isn't supported, so the
+/// caller can fall back to the CPU ScaleFilter.
+pub fn scaleLanczos(allocator: std.mem.Allocator, input: *const VideoFrame, width: u32, height: u32) !?VideoFrame {
+    if (comptime available) {
+        const channels = packedChannels(input) orelse return null;
+        if (width == 0 or height == 0) return null;
+        const src_size = try bufferSize(input.width, input.height, channels);
+        const dst_size = try bufferSize(width, height, channels);
+        if (!fitsShaderIndex(src_size) or !fitsShaderIndex(dst_size)) return null;
+
+        mutex.lock();
+        defer mutex.unlock();
+        const ctx = acquireContext() orelse return null;
+
+        var src_buf = try metal.MetalBuffer.init(&ctx.device, src_size);
+        defer src_buf.deinit();
+        var dst_buf = try metal.MetalBuffer.init(&ctx.device, dst_size);
+        defer dst_buf.deinit();
+
+        try uploadFrame(allocator, &src_buf, input, channels);
+        try ctx.encoder.lanczosScale(&src_buf, &dst_buf, input.width, input.height, width, height, channels);
+
+        var output = try VideoFrame.init(allocator, width, height, input.format);
+        errdefer output.deinit();
+        try downloadFrame(allocator, &dst_buf, &output, channels);
+
+        output.pts = input.pts;
+        output.duration = input.duration;
+        return output;
+    } else {
+        return null;
+    }
+}
+
+/// Run a CPU BlurFilter on the GPU
+/// Uses the filter's box kernel and pass count with the same edge clamping
+/// and integer rounding, so the output matches BlurFilter.apply exactly.
+/// Returns null when no GPU is usable, like scaleLanczos.
+pub fn blur(allocator: std.mem.Allocator, input: *const VideoFrame, filter: *const BlurFilter) !?VideoFrame {
+    if (comptime available) {
+        const channels = packedChannels(input) orelse return null;
+        if (input.width == 0 or input.height == 0) return null;
+        const size = try bufferSize(input.width, input.height, channels);
+        if (!fitsShaderIndex(size)) return null;
+
+        mutex.lock();
+        defer mutex.unlock();
+        const ctx = acquireContext() orelse return null;
+
+        var src_buf = try metal.MetalBuffer.init(&ctx.device, size);
+        defer src_buf.deinit();
+        var dst_buf = try metal.MetalBuffer.init(&ctx.device, size);
+        defer dst_buf.deinit();
+        var scratch_buf = try metal.MetalBuffer.init(&ctx.device, size);
+        defer scratch_buf.deinit();
+
+        try uploadFrame(allocator, &src_buf, input, channels);
+        const kernel_size: u32 = @intCast(filter.boxKernel().width);
+        const passes: u32 = @intCast(filter.passes());
+        try ctx.encoder.boxBlur(&src_buf, &dst_buf, &scratch_buf, input.width, input.height, channels, kernel_size, passes);
+
+        var output = try VideoFrame.init(allocator, input.width, input.height, input.format);
+        errdefer output.deinit();
+        try downloadFrame(allocator, &dst_buf, &output, channels);
+
+        output.pts = input.pts;
+        output.duration = input.duration;
+        return output;
+    } else {
+        return null;
+    }
+}
+
+// ============================================================================
+// Helpers
+// ============================================================================
+
+/// Bytes in a tightly packed width x height image, computed in usize
+fn bufferSize(width: u32, height: u32, channels: u32) !usize {
+    return std.math.mul(usize, try std.math.mul(usize, width, height), channels);
+}
+
+/// The shaders index pixels with 32-bit uints, so larger images stay on the CPU
+fn fitsShaderIndex(size: usize) bool {
+    return size <= std.math.maxInt(u32);
+}
+
+/// Channel count for single-plane packed formats, null for anything else
+fn packedChannels(input: *const VideoFrame) ?u32 {
+    return switch (input.format) {
+        .gray8 => 1,
+        .rgb24, .bgr24 => 3,
+        .rgba32, .bgra32 => 4,
+        else => null,
+    };
+}
+
+/// Copy plane 0 into a tightly packed GPU buffer
+fn uploadFrame(allocator: std.mem.Allocator, buf: anytype, input: *const VideoFrame, channels: u32) !void {
+    const src = input.getPlane(0) orelse return error.InvalidFrame;
+    const row_bytes = @as(usize, input.width) * channels;
+    const stride: usize = input.strides[0];
+
+    if (stride == row_bytes) {
+        return buf.upload(src[0 .. row_bytes * input.height]);
+    }
+
+    const tight = try allocator.alloc(u8, row_bytes * input.height);
+    defer allocator.free(tight);
+    for (0..input.height) |y| {
+        @memcpy(tight[y * row_bytes ..][0..row_bytes], src[y * stride ..][0..row_bytes]);
+    }
+    try buf.upload(tight);
+}
+
+/// Copy a tightly packed GPU buffer into plane 0
+fn downloadFrame(allocator: std.mem.Allocator, buf: anytype, output: *VideoFrame, channels: u32) !void {
+    const dst = output.getPlane(0) orelse return error.InvalidFrame;
+    const row_bytes = @as(usize, output.width) * channels;
+    const stride: usize = output.strides[0];
+
+    if (stride == row_bytes) {
+        return buf.download(dst[0 .. row_bytes * output.height]);
+    }
+
+    const tight = try allocator.alloc(u8, row_bytes * output.height);
+    defer allocator.free(tight);
+    try buf.download(tight);
+    for (0..output.height) |y| {
+        @memcpy(dst[y * stride ..][0..row_bytes], tight[y * row_bytes ..][0..row_bytes]);
+    }
+}
+
+// ============================================================================
+// Tests
+// ============================================================================
+
+test "GPU filters decline unsupported formats" {
+    const allocator = std.testing.allocator;
+    var input = try VideoFrame.init(allocator, 16, 16, .yuv420p);
+    defer input.deinit();
+
+    try std.testing.expect((try scaleLanczos(allocator, &input, 8, 8)) == null);
+    const filter = BlurFilter.init(allocator, 1);
+    try std.testing.expect((try blur(allocator, &input, &filter)) == null);
+}
+
+test "GPU blur matches the CPU blur" {
+    if (comptime !available) return error.SkipZigTest;
+    const allocator = std.testing.allocator;
+
+    var input = try VideoFrame.init(allocator, 37, 23, .rgba32);
+    defer input.deinit();
+    for (input.data, 0..) |*byte, i| {
+        byte.* = @truncate(i *% 73 +% (i >> 3));
+    }
+
+    // Radii 1, 3 and 6 cover both box kernels and one to three passes
+    for ([_]u8{ 1, 3, 6 }) |radius| {
+        const filter = BlurFilter.init(allocator, radius);
+        var gpu = (try blur(allocator, &input, &filter)) orelse return error.SkipZigTest;
+        defer gpu.deinit();
+        var cpu = try filter.apply(&input);
+        defer cpu.deinit();
+
+        const row_bytes = @as(usize, input.width) * 4;
+        for (0..input.height) |y| {
+            try std.testing.expectEqualSlices(
+                u8,
+                cpu.data[y * cpu.strides[0] ..][0..row_bytes],
+                gpu.data[y * gpu.strides[0] ..][0..row_bytes],
+            );
+        }
+    }
+}
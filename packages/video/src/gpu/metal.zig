@@ -144,6 +144,17 @@ fn MTLComputeCommandEncoder_setBuffer(
     set_fn(encoder, sel, buffer, offset, index);
 }
 
+fn MTLComputeCommandEncoder_setBytes(
+    encoder: *MTLComputeCommandEncoder,
+    bytes: *const anyopaque,
+    length: usize,
+    index: usize,
+) void {
+    const sel = sel_registerName("setBytes:length:atIndex:");
+    const set_fn = msgSend(void);
+    set_fn(encoder, sel, bytes, length, index);
+}
+
 fn MTLComputeCommandEncoder_dispatchThreadgroups(
     encoder: *MTLComputeCommandEncoder,
     threadgroups_per_grid: MTLSize,
@@ -356,6 +367,41 @@ const METAL_SHADERS =
     \\    }
     \\}
     \\
+    \\// Box blur matching the CPU BlurFilter: size x size taps with edge
+    \\// clamping and a rounded integer mean; alpha of 4-channel pixels is copied
+    \\kernel void box_blur(
+    \\    device const uchar* input [[buffer(0)]],
+    \\    device uchar* output [[buffer(1)]],
+    \\    constant uint& width [[buffer(2)]],
+    \\    constant uint& height [[buffer(3)]],
+    \\    constant uint& channels [[buffer(4)]],
+    \\    constant uint& size [[buffer(5)]],
+    \\    uint2 gid [[thread_position_in_grid]])
+    \\{
+    \\    if (gid.x >= width || gid.y >= height) return;
+    \\
+    \\    int half_size = int(size / 2);
+    \\    uint divisor = size * size;
+    \\    uint dst_idx = (gid.y * width + gid.x) * channels;
+    \\
+    \\    for (uint c = 0; c < channels; c++) {
+    \\        if (channels == 4 && c == 3) {
+    \\            output[dst_idx + c] = input[dst_idx + c];
+    \\            continue;
+    \\        }
+    \\
+    \\        uint sum = 0;
+    \\        for (int dy = -half_size; dy <= half_size; dy++) {
+    \\            uint sy = uint(clamp(int(gid.y) + dy, 0, int(height) - 1));
+    \\            for (int dx = -half_size; dx <= half_size; dx++) {
+    \\                uint sx = uint(clamp(int(gid.x) + dx, 0, int(width) - 1));
+    \\                sum += input[(sy * width + sx) * channels + c];
+    \\            }
+    \\        }
+    \\        output[dst_idx + c] = uchar((sum + divisor / 2) / divisor);
+    \\    }
+    \\}
+    \\
     \\// Unsharp mask (sharpening)
     \\kernel void unsharp_mask(
     \\    device const uchar* input [[buffer(0)]],
@@ -378,6 +424,62 @@ const METAL_SHADERS =
     \\        output[idx * channels + c] = uchar(clamp(sharpened, 0.0f, 255.0f));
     \\    }
     \\}
+    \\
+    \\// Lanczos-3 weight
+    \\static float lanczos3(float x)
+    \\{
+    \\    x = fabs(x);
+    \\    if (x < 1e-5) return 1.0;
+    \\    if (x >= 3.0) return 0.0;
+    \\    float px = M_PI_F * x;
+    \\    return 3.0 * sin(px) * sin(px / 3.0) / (px * px);
+    \\}
+    \\
+    \\// Lanczos-3 scaling (6x6 taps, edge-clamped, normalized)
+    \\// Uses the same corner-aligned mapping as the CPU ScaleFilter
+    \\// (src = dst * src_size / dst_size), so both produce the same grid.
+    \\kernel void lanczos_scale(
+    \\    device const uchar* input [[buffer(0)]],
+    \\    device uchar* output [[buffer(1)]],
+    \\    constant uint& src_width [[buffer(2)]],
+    \\    constant uint& src_height [[buffer(3)]],
+    \\    constant uint& dst_width [[buffer(4)]],
+    \\    constant uint& dst_height [[buffer(5)]],
+    \\    constant uint& channels [[buffer(6)]],
+    \\    uint2 gid [[thread_position_in_grid]])
+    \\{
+    \\    if (gid.x >= dst_width || gid.y >= dst_height) return;
+    \\
+    \\    float cx = float(gid.x) * float(src_width) / float(dst_width);
+    \\    float cy = float(gid.y) * float(src_height) / float(dst_height);
+    \\    int x_base = int(floor(cx));
+    \\    int y_base = int(floor(cy));
+    \\
+    \\    float wx[6];
+    \\    float wy[6];
+    \\    for (int i = 0; i < 6; i++) {
+    \\        wx[i] = lanczos3(cx - float(x_base - 2 + i));
+    \\        wy[i] = lanczos3(cy - float(y_base - 2 + i));
+    \\    }
+    \\
+    \\    for (uint c = 0; c < channels; c++) {
+    \\        float sum = 0.0;
+    \\        float weight_sum = 0.0;
+    \\
+    \\        for (int j = 0; j < 6; j++) {
+    \\            uint sy = uint(clamp(y_base - 2 + j, 0, int(src_height) - 1));
+    \\            for (int i = 0; i < 6; i++) {
+    \\                uint sx = uint(clamp(x_base - 2 + i, 0, int(src_width) - 1));
+    \\                float w = wx[i] * wy[j];
+    \\                sum += float(input[(sy * src_width + sx) * channels + c]) * w;
+    \\                weight_sum += w;
+    \\            }
+    \\        }
+    \\
+    \\        float result = weight_sum != 0.0 ? sum / weight_sum : 0.0;
+    \\        output[(gid.y * dst_width + gid.x) * channels + c] = uchar(clamp(round(result), 0.0f, 255.0f));
+    \\    }
+    \\}
 ;
 
 // ============================================================================
@@ -546,6 +648,8 @@ pub const MetalComputeEncoder = struct {
     bilinear_scale_pipeline: ?MetalComputePipeline = null,
     gaussian_blur_pipeline: ?MetalComputePipeline = null,
     unsharp_mask_pipeline: ?MetalComputePipeline = null,
+    lanczos_scale_pipeline: ?MetalComputePipeline = null,
+    box_blur_pipeline: ?MetalComputePipeline = null,
 
     const Self = @This();
 
@@ -563,6 +667,8 @@ pub const MetalComputeEncoder = struct {
         if (self.bilinear_scale_pipeline) |*p| p.deinit();
         if (self.gaussian_blur_pipeline) |*p| p.deinit();
         if (self.unsharp_mask_pipeline) |*p| p.deinit();
+        if (self.lanczos_scale_pipeline) |*p| p.deinit();
+        if (self.box_blur_pipeline) |*p| p.deinit();
     }
 
     /// Convert YUV to RGB using Metal compute shader
@@ -742,4 +848,108 @@ pub const MetalComputeEncoder = struct {
         MTLCommandBuffer_commit(command_buffer);
         MTLCommandBuffer_waitUntilCompleted(command_buffer);
     }
+
+    /// Lanczos-3 scaling using Metal
+    pub fn lanczosScale(
+        self: *Self,
+        input: *MetalBuffer,
+        output: *MetalBuffer,
+        src_width: u32,
+        src_height: u32,
+        dst_width: u32,
+        dst_height: u32,
+        channels: u32,
+    ) !void {
+        if (self.lanczos_scale_pipeline == null) {
+            self.lanczos_scale_pipeline = try MetalComputePipeline.init(self.device, "lanczos_scale");
+        }
+
+        const command_buffer = MTLCommandQueue_commandBuffer(self.queue.queue) orelse {
+            return error.FailedToCreateCommandBuffer;
+        };
+
+        const encoder = MTLCommandBuffer_computeCommandEncoder(command_buffer) orelse {
+            return error.FailedToCreateComputeEncoder;
+        };
+
+        // Scalar uniforms go inline with setBytes instead of separate buffers
+        MTLComputeCommandEncoder_setComputePipelineState(encoder, self.lanczos_scale_pipeline.?.pipeline_state);
+        MTLComputeCommandEncoder_setBuffer(encoder, input.buffer, 0, 0);
+        MTLComputeCommandEncoder_setBuffer(encoder, output.buffer, 0, 1);
+        MTLComputeCommandEncoder_setBytes(encoder, &src_width, @sizeOf(u32), 2);
+        MTLComputeCommandEncoder_setBytes(encoder, &src_height, @sizeOf(u32), 3);
+        MTLComputeCommandEncoder_setBytes(encoder, &dst_width, @sizeOf(u32), 4);
+        MTLComputeCommandEncoder_setBytes(encoder, &dst_height, @sizeOf(u32), 5);
+        MTLComputeCommandEncoder_setBytes(encoder, &channels, @sizeOf(u32), 6);
+
+        const threadgroup_size = MTLSize{ .width = 16, .height = 16, .depth = 1 };
+        const threadgroups = MTLSize{
+            .width = (dst_width + 15) / 16,
+            .height = (dst_height + 15) / 16,
+            .depth = 1,
+        };
+
+        MTLComputeCommandEncoder_dispatchThreadgroups(encoder, threadgroups, threadgroup_size);
+        MTLComputeCommandEncoder_endEncoding(encoder);
+        MTLCommandBuffer_commit(command_buffer);
+        MTLCommandBuffer_waitUntilCompleted(command_buffer);
+    }
+
+    /// size x size box blur using Metal, repeated `passes` times
+    /// All passes go into one command buffer, ping-ponging between `output`
+    /// and `scratch`, so intermediate results never leave the GPU. The final
+    /// result is always in `output`.
+    pub fn boxBlur(
+        self: *Self,
+        input: *MetalBuffer,
+        output: *MetalBuffer,
+        scratch: *MetalBuffer,
+        width: u32,
+        height: u32,
+        channels: u32,
+        size: u32,
+        passes: u32,
+    ) !void {
+        if (self.box_blur_pipeline == null) {
+            self.box_blur_pipeline = try MetalComputePipeline.init(self.device, "box_blur");
+        }
+
+        const command_buffer = MTLCommandQueue_commandBuffer(self.queue.queue) orelse {
+            return error.FailedToCreateCommandBuffer;
+        };
+
+        const threadgroup_size = MTLSize{ .width = 16, .height = 16, .depth = 1 };
+        const threadgroups = MTLSize{
+            .width = (width + 15) / 16,
+            .height = (height + 15) / 16,
+            .depth = 1,
+        };
+
+        // Pick the first target so the last pass lands in `output`
+        const total_passes = @max(1, passes);
+        var src = input;
+        var dst = if (total_passes % 2 == 1) output else scratch;
+
+        for (0..total_passes) |_| {
+            const encoder = MTLCommandBuffer_computeCommandEncoder(command_buffer) orelse {
+                return error.FailedToCreateComputeEncoder;
+            };
+
+            MTLComputeCommandEncoder_setComputePipelineState(encoder, self.box_blur_pipeline.?.pipeline_state);
+            MTLComputeCommandEncoder_setBuffer(encoder, src.buffer, 0, 0);
+            MTLComputeCommandEncoder_setBuffer(encoder, dst.buffer, 0, 1);
+            MTLComputeCommandEncoder_setBytes(encoder, &width, @sizeOf(u32), 2);
+            MTLComputeCommandEncoder_setBytes(encoder, &height, @sizeOf(u32), 3);
+            MTLComputeCommandEncoder_setBytes(encoder, &channels, @sizeOf(u32), 4);
+            MTLComputeCommandEncoder_setBytes(encoder, &size, @sizeOf(u32), 5);
+            MTLComputeCommandEncoder_dispatchThreadgroups(encoder, threadgroups, threadgroup_size);
+            MTLComputeCommandEncoder_endEncoding(encoder);
+
+            src = dst;
+            dst = if (dst == output) scratch else output;
+        }
+
+        MTLCommandBuffer_commit(command_buffer);
+        MTLCommandBuffer_waitUntilCompleted(command_buffer);
+    }
 };
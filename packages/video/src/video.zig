@@ -34,6 +34,15 @@ pub const frame = @import("core/frame.zig");
 pub const VideoFrame = frame.VideoFrame;
 pub const AudioFrame = frame.AudioFrame;
 
+// ============================================================================
+// Memory Management
+// ============================================================================
+
+pub const memory = @import("core/memory.zig");
+pub const VideoFramePool = memory.VideoFramePool;
+pub const AudioFramePool = memory.AudioFramePool;
+pub const BufferPool = memory.BufferPool;
+
 // ============================================================================
 // Packet and Stream Types
 // ============================================================================
@@ -287,6 +296,10 @@ pub const FieldOrder = video_filters.FieldOrder;
 pub const FieldSeparator = video_filters.FieldSeparator;
 pub const DenoiseFilter = video_filters.DenoiseFilter;
 pub const DenoiseMethod = video_filters.DenoiseMethod;
+pub const FusedFilter = video_filters.FusedFilter;
+
+// GPU offload for filters (Metal on macOS, null/CPU fallback elsewhere)
+pub const gpu_filters = @import("gpu/filters.zig");
 
 // ============================================================================
 // Audio Filters